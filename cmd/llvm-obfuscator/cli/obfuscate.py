@@ -1,95 +1,134 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
+import os
+from collections import deque
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Optional
+from typing import Deque, Dict, FrozenSet, Iterable, List, Optional, Tuple
 
 import typer
 
-from core import (
+# Only the lightweight config/utils modules are imported here; the obfuscation
+# pipeline, reporter and analyzers are imported inside the commands that use
+# them so `--help` and unrelated subcommands skip those imports.
+from core.config import (
+    AdvancedConfiguration,
     AnalyzeConfig,
     CompareConfig,
-    LLVMObfuscator,
     ObfuscationConfig,
     ObfuscationLevel,
-    ObfuscationReport,
+    OutputConfiguration,
     PassConfiguration,
     Platform,
-    analyze_binary,
-    compare_binaries,
+    SymbolObfuscationConfiguration,
 )
-from core.batch import load_batch_config
-from core.config import AdvancedConfiguration, OutputConfiguration, SymbolObfuscationConfiguration
 from core.exceptions import ObfuscationError
-from core.utils import create_logger, load_yaml, normalize_flags_and_passes
+from core.utils import create_logger, json_dumps, load_yaml, normalize_flags_and_passes
 
 app = typer.Typer(add_completion=False, help="LLVM-based binary obfuscation toolkit")
 logger = create_logger("cli", logging.INFO)
 
+# Template for plain compiles; its frozen pass/advanced sections are shared as-is.
+_DEFAULT_CONFIG = ObfuscationConfig()
 
-def _build_config(
-    input_path: Path,
-    output: Path,
-    platform: Platform,
-    level: ObfuscationLevel,
-    enable_flattening: bool,
-    enable_substitution: bool,
-    enable_bogus_cf: bool,
-    enable_split: bool,
-    enable_linear_mba: bool,
-    cycles: int,
-    string_encryption: bool,
-    fake_loops: int,
-    enable_symbol_obfuscation: bool,
-    symbol_algorithm: str,
-    symbol_hash_length: int,
-    symbol_prefix: str,
-    symbol_salt: Optional[str],
-    report_formats: str,
-    custom_flags: Optional[str],
-    config_file: Optional[Path],
-    custom_pass_plugin: Optional[Path],
-) -> ObfuscationConfig:
-    if config_file:
-        data = load_yaml(config_file)
+
+def _parse_flags(custom_flags: str) -> List[str]:
+    # str.split() with no separator collapses runs of whitespace and drops empty tokens.
+    return custom_flags.split()
+
+
+def _parse_formats(report_formats: str) -> FrozenSet[str]:
+    return frozenset(fmt.strip() for fmt in report_formats.split(",") if fmt.strip())
+
+
+@dataclass(frozen=True, slots=True)
+class CliOptions:
+    """Raw `compile` options, passed to `_build_config` as a single object."""
+
+    input_path: Path
+    output: Path
+    platform: Platform
+    level: ObfuscationLevel
+    enable_flattening: bool = False
+    enable_substitution: bool = False
+    enable_bogus_cf: bool = False
+    enable_split: bool = False
+    enable_linear_mba: bool = False
+    cycles: int = 1
+    string_encryption: bool = False
+    fake_loops: int = 0
+    enable_symbol_obfuscation: bool = False
+    symbol_algorithm: str = "sha256"
+    symbol_hash_length: int = 12
+    symbol_prefix: str = "typed"
+    symbol_salt: Optional[str] = None
+    report_formats: str = "json"
+    custom_flags: Optional[str] = None
+    config_file: Optional[Path] = None
+    custom_pass_plugin: Optional[Path] = None
+
+
+def _build_config(opts: CliOptions) -> ObfuscationConfig:
+    if opts.config_file:
+        data = load_yaml(opts.config_file)
         return ObfuscationConfig.from_dict(data.get("obfuscation", data))
 
+    if not (
+        opts.enable_flattening
+        or opts.enable_substitution
+        or opts.enable_bogus_cf
+        or opts.enable_split
+        or opts.enable_linear_mba
+        or opts.string_encryption
+        or opts.fake_loops
+        or opts.enable_symbol_obfuscation
+        or opts.custom_flags
+        or opts.custom_pass_plugin
+    ) and opts.cycles == 1:
+        return replace(
+            _DEFAULT_CONFIG,
+            level=opts.level,
+            platform=opts.platform,
+            compiler_flags=[],
+            output=OutputConfiguration(directory=opts.output, report_formats=_parse_formats(opts.report_formats)),
+        )
+
     flags = []
     detected_passes = {"flattening": False, "substitution": False, "boguscf": False, "split": False, "linear-mba": False}
-    if custom_flags:
-        raw_flags = [flag.strip() for flag in custom_flags.split(" ") if flag.strip()]
-        flags, detected_passes = normalize_flags_and_passes(raw_flags)
+    if opts.custom_flags:
+        flags, detected_passes = normalize_flags_and_passes(_parse_flags(opts.custom_flags))
 
     passes = PassConfiguration(
-        flattening=enable_flattening or detected_passes.get("flattening", False),
-        substitution=enable_substitution or detected_passes.get("substitution", False),
-        bogus_control_flow=enable_bogus_cf or detected_passes.get("boguscf", False),
-        split=enable_split or detected_passes.get("split", False),
-        linear_mba=enable_linear_mba or detected_passes.get("linear-mba", False),
+        flattening=opts.enable_flattening or detected_passes.get("flattening", False),
+        substitution=opts.enable_substitution or detected_passes.get("substitution", False),
+        bogus_control_flow=opts.enable_bogus_cf or detected_passes.get("boguscf", False),
+        split=opts.enable_split or detected_passes.get("split", False),
+        linear_mba=opts.enable_linear_mba or detected_passes.get("linear-mba", False),
     )
     symbol_obf_config = SymbolObfuscationConfiguration(
-        enabled=enable_symbol_obfuscation,
-        algorithm=symbol_algorithm,
-        hash_length=symbol_hash_length,
-        prefix_style=symbol_prefix,
-        salt=symbol_salt,
+        enabled=opts.enable_symbol_obfuscation,
+        algorithm=opts.symbol_algorithm,
+        hash_length=opts.symbol_hash_length,
+        prefix_style=opts.symbol_prefix,
+        salt=opts.symbol_salt,
     )
     advanced = AdvancedConfiguration(
-        cycles=cycles,
-        string_encryption=string_encryption,
-        fake_loops=fake_loops,
+        cycles=opts.cycles,
+        string_encryption=opts.string_encryption,
+        fake_loops=opts.fake_loops,
         symbol_obfuscation=symbol_obf_config,
     )
-    output_config = OutputConfiguration(directory=output, report_formats=report_formats.split(","))
+    output_config = OutputConfiguration(directory=opts.output, report_formats=_parse_formats(opts.report_formats))
     return ObfuscationConfig(
-        level=level,
-        platform=platform,
+        level=opts.level,
+        platform=opts.platform,
         compiler_flags=flags,
         passes=passes,
         advanced=advanced,
         output=output_config,
-        custom_pass_plugin=custom_pass_plugin,
+        custom_pass_plugin=opts.custom_pass_plugin,
     )
 
 
@@ -118,8 +157,10 @@ def compile(
     custom_pass_plugin: Optional[Path] = typer.Option(None, help="Path to custom LLVM pass plugin"),
 ):
     """Compile and obfuscate a source file."""
+    from core import LLVMObfuscator, ObfuscationReport
+
     try:
-        config = _build_config(
+        opts = CliOptions(
             input_path=input_file,
             output=output,
             platform=platform,
@@ -142,10 +183,11 @@ def compile(
             config_file=config_file,
             custom_pass_plugin=custom_pass_plugin,
         )
+        config = _build_config(opts)
         reporter = ObfuscationReport(config.output.directory)
         obfuscator = LLVMObfuscator(reporter=reporter)
         result = obfuscator.obfuscate(input_file, config)
-        typer.echo(json.dumps(result, indent=2))
+        typer.echo(json_dumps(result))
     except ObfuscationError as exc:
         logger.error("Obfuscation failed: %s", exc)
         raise typer.Exit(code=1)
@@ -157,9 +199,11 @@ def analyze(
     output: Optional[Path] = typer.Option(None, help="Output report path"),
 ):
     """Analyze an existing binary for obfuscation metrics."""
+    from core import analyze_binary
+
     config = AnalyzeConfig(binary_path=binary, output=output)
     result = analyze_binary(config)
-    typer.echo(json.dumps(result, indent=2))
+    typer.echo(json_dumps(result))
 
 
 @app.command()
@@ -169,30 +213,73 @@ def compare(
     output: Optional[Path] = typer.Option(None, help="Comparison report path"),
 ):
     """Compare original and obfuscated binaries."""
+    from core import compare_binaries
+
     config = CompareConfig(original_binary=original, obfuscated_binary=obfuscated, output=output)
     result = compare_binaries(config)
-    typer.echo(json.dumps(result, indent=2))
+    typer.echo(json_dumps(result))
+
+
+def _run_batch_job(job: Dict) -> Dict:
+    from core import LLVMObfuscator, ObfuscationReport
+
+    # Each worker gets its own obfuscator; its helpers are not shared across threads.
+    reporter = ObfuscationReport(Path("./reports"))
+    obfuscator = LLVMObfuscator(reporter=reporter)
+    return obfuscator.obfuscate(job["source"], job["config"])
+
+
+async def _run_batch(batch_jobs: Iterable[Dict], concurrency: int) -> int:
+    semaphore = asyncio.Semaphore(concurrency)
+    pending: Deque[Tuple[Dict, asyncio.Task]] = deque()
+
+    async def run_one(job: Dict) -> Dict:
+        try:
+            # obfuscate() blocks on clang/opt subprocesses, so it runs on a worker
+            # thread while the semaphore bounds how many compile at once.
+            return await asyncio.to_thread(_run_batch_job, job)
+        finally:
+            semaphore.release()
+
+    async def report_next() -> None:
+        job, task = pending.popleft()
+        try:
+            typer.echo(json_dumps(await task))
+        except Exception as exc:
+            # One failing job (toolchain error, unreadable source, bad config) must not stop the batch.
+            logger.error("Batch job failed for %s: %s", job["source"], exc)
+
+    count = 0
+    # Jobs are pulled from the iterator only once a slot frees up, and results
+    # are reported in job order as soon as the oldest job finishes.
+    try:
+        for job in batch_jobs:
+            await semaphore.acquire()
+            count += 1
+            obf_config: ObfuscationConfig = job["config"]
+            obf_config.output.directory = job["output"]
+            typer.echo(f"Processing {job['source']} -> {obf_config.output.directory}")
+            pending.append((job, asyncio.create_task(run_one(job))))
+            while pending and pending[0][1].done():
+                await report_next()
+    finally:
+        # Even when reading the job list fails part-way, jobs already started are awaited and reported.
+        while pending:
+            await report_next()
+    return count
 
 
 @app.command()
 def batch(
     config_path: Path = typer.Argument(..., help="YAML configuration for batch processing"),
+    jobs: int = typer.Option(1, "--jobs", "-j", min=0, help="Number of batch jobs to run in parallel (0 = one per CPU)"),
 ):
     """Run batch obfuscation jobs using YAML configuration."""
-    jobs = load_batch_config(config_path)
-    typer.echo(f"Loaded {len(jobs)} jobs from {config_path}")
-    reporter = ObfuscationReport(Path("./reports"))
-    obfuscator = LLVMObfuscator(reporter=reporter)
-    for job in jobs:
-        source = job["source"]
-        obf_config: ObfuscationConfig = job["config"]
-        obf_config.output.directory = job["output"]
-        typer.echo(f"Processing {source} -> {obf_config.output.directory}")
-        try:
-            result = obfuscator.obfuscate(source, obf_config)
-            typer.echo(json.dumps(result, indent=2))
-        except ObfuscationError as exc:
-            logger.error("Batch job failed for %s: %s", source, exc)
+    from core.batch import load_batch_config
+
+    typer.echo(f"Streaming jobs from {config_path}")
+    count = asyncio.run(_run_batch(load_batch_config(config_path), jobs or os.cpu_count() or 1))
+    typer.echo(f"Processed {count} jobs from {config_path}")
 
 
 if __name__ == "__main__":
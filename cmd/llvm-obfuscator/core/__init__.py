@@ -1,8 +1,9 @@
 """Core package for LLVM obfuscator."""
 
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from . import compat as _compat  # noqa: F401  # ensure compatibility patches load
-from .analyzer import analyze_binary
-from .comparer import compare_binaries
 from .config import (
     AnalyzeConfig,
     AdvancedConfiguration,
@@ -13,9 +14,38 @@ from .config import (
     PassConfiguration,
     Platform,
 )
-from .obfuscator import LLVMObfuscator
-from .reporter import ObfuscationReport
-from .symbol_obfuscator import SymbolObfuscator
+
+if TYPE_CHECKING:
+    from .analyzer import analyze_binary
+    from .comparer import compare_binaries
+    from .obfuscator import LLVMObfuscator
+    from .reporter import ObfuscationReport, ReportModel
+    from .symbol_obfuscator import SymbolObfuscator
+
+# Heavier submodules are imported on first attribute access (PEP 562) so that
+# e.g. `analyze` does not pay for the obfuscation pipeline imports.
+_LAZY_EXPORTS = {
+    "LLVMObfuscator": ".obfuscator",
+    "ObfuscationReport": ".reporter",
+    "ReportModel": ".reporter",
+    "SymbolObfuscator": ".symbol_obfuscator",
+    "analyze_binary": ".analyzer",
+    "compare_binaries": ".comparer",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     "LLVMObfuscator",
@@ -28,6 +58,7 @@ __all__ = [
     "AnalyzeConfig",
     "CompareConfig",
     "ObfuscationReport",
+    "ReportModel",
     "SymbolObfuscator",
     "analyze_binary",
     "compare_binaries",
@@ -1,19 +1,23 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict
 
 from .config import AnalyzeConfig
-from .utils import compute_entropy, detect_binary_format, get_file_size, list_sections, summarize_symbols
+from .utils import detect_binary_format, file_size_and_entropy, list_sections, summarize_symbols
 
 
 def analyze_binary(config: AnalyzeConfig) -> Dict:
     binary = config.binary_path
-    binary_format = detect_binary_format(binary)
-    file_size = get_file_size(binary)
-    sections = list_sections(binary)
-    symbols_count, functions_count = summarize_symbols(binary)
-    entropy = compute_entropy(binary.read_bytes() if binary.exists() else b"")
+    # objdump and nm are separate processes; run them alongside the in-process probes.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        sections_future = executor.submit(list_sections, binary)
+        symbols_future = executor.submit(summarize_symbols, binary)
+        binary_format = detect_binary_format(binary)
+        file_size, entropy = file_size_and_entropy(binary)
+        sections = sections_future.result()
+        symbols_count, functions_count = symbols_future.result()
     report = {
         "binary": str(binary),
         "file_size": file_size,
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+from .utils import ensure_directory, json_dumps_bytes, json_loads
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV = "LLVM_OBFUSCATOR_CACHE_DIR"
+DISABLE_CACHE_ENV = "LLVM_OBFUSCATOR_NO_CACHE"
+MEMORY_CACHE_SIZE = 128
+
+
+def default_cache_dir() -> Optional[Path]:
+    """Cache root from LLVM_OBFUSCATOR_CACHE_DIR; None (no caching) unless it is set.
+
+    The store has no eviction, so it is opt-in rather than growing under the
+    home directory of every long-running server.
+    """
+    if os.getenv(DISABLE_CACHE_ENV):
+        return None
+    override = os.getenv(CACHE_DIR_ENV)
+    return Path(override) if override else None
+
+
+def file_fingerprint(path: Optional[Path]) -> str:
+    """Cheap identity for tools/plugins that take part in a build: path, mtime and size."""
+    if not path:
+        return ""
+    try:
+        stat = path.stat()
+    except OSError:
+        return ""
+    return f"{path}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def cache_key(*parts: Union[bytes, str]) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        data = part.encode("utf-8") if isinstance(part, str) else part
+        # Length-prefix every part so ("ab", "c") and ("a", "bc") hash differently.
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+class ArtifactCache:
+    """Content-addressed store of build outputs, laid out as <root>/<key[:2]>/<key>/.
+
+    Recently used entries are also kept in an in-process LRU so hot keys skip
+    the existence check and metadata read on the disk cache.
+    """
+
+    def __init__(self, root: Path, memory_size: int = MEMORY_CACHE_SIZE) -> None:
+        self.root = root
+        self.memory_size = memory_size
+        self._memory: "OrderedDict[str, Tuple[Path, Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _remember(self, key: str, artifact: Path, meta: Dict) -> None:
+        with self._lock:
+            self._memory[key] = (artifact, meta)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    def _recall(self, key: str) -> Optional[Tuple[Path, Dict]]:
+        with self._lock:
+            hit = self._memory.get(key)
+            if hit is not None:
+                self._memory.move_to_end(key)
+            return hit
+
+    def _entry(self, key: str) -> Path:
+        return self.root / key[:2] / key
+
+    def fetch(self, key: str, destination: Path) -> Optional[Dict]:
+        """Copy the cached artifact to destination and return its metadata, or None on a miss."""
+        hit = self._recall(key)
+        if hit is not None:
+            artifact, meta = hit
+            try:
+                shutil.copy(artifact, destination)
+                return meta
+            except OSError:
+                # Entry was removed from disk behind our back; forget it and re-check below.
+                with self._lock:
+                    self._memory.pop(key, None)
+
+        entry = self._entry(key)
+        artifact = entry / "artifact"
+        if not artifact.exists():
+            return None
+        try:
+            meta = json_loads((entry / "meta.json").read_bytes())
+            shutil.copy(artifact, destination)
+        except (OSError, ValueError) as exc:
+            logger.debug("Ignoring unreadable cache entry %s: %s", entry, exc)
+            return None
+        self._remember(key, artifact, meta)
+        return meta
+
+    def store(self, key: str, artifact: Path, meta: Dict) -> None:
+        """Publish artifact under key; the entry appears atomically or not at all."""
+        entry = self._entry(key)
+        staging = None
+        try:
+            ensure_directory(entry.parent)
+            staging = Path(tempfile.mkdtemp(prefix=f".{key[:8]}-", dir=entry.parent))
+            shutil.copy(artifact, staging / "artifact")
+            (staging / "meta.json").write_bytes(json_dumps_bytes(meta))
+            os.replace(staging, entry)
+            self._remember(key, entry / "artifact", meta)
+        except OSError as exc:
+            # Typically another process published the same key first.
+            logger.debug("Could not store cache entry %s: %s", entry, exc)
+            if staging is not None:
+                shutil.rmtree(staging, ignore_errors=True)
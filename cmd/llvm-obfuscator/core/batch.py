@@ -1,23 +1,21 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator
 
 from .config import ObfuscationConfig
 from .utils import load_yaml
 
 
-def load_batch_config(config_path: Path) -> List[Dict]:
+def load_batch_config(config_path: Path) -> Iterator[Dict]:
+    """Yield normalized batch jobs one at a time so callers can start work before all configs are built."""
     data = load_yaml(config_path)
-    jobs = data.get("jobs", [])
-    normalized = []
-    for job in jobs:
+    for job in data.get("jobs", []):
         source = Path(job["source"]).expanduser()
         destination = Path(job.get("output", "./obfuscated")).expanduser()
         obf_config = ObfuscationConfig.from_dict(job.get("config", {}))
-        normalized.append({
+        yield {
             "source": source,
             "config": obf_config,
             "output": destination,
-        })
-    return normalized
+        }
@@ -4,26 +4,27 @@ from pathlib import Path
 from typing import Dict
 
 from .config import CompareConfig
-from .utils import compute_entropy, get_file_size, write_json
+from .utils import file_size_and_entropy, write_json
 
 
 def compare_binaries(config: CompareConfig) -> Dict:
     original = Path(config.original_binary)
     obfuscated = Path(config.obfuscated_binary)
+    original_size, original_entropy = file_size_and_entropy(original)
+    obfuscated_size, obfuscated_entropy = file_size_and_entropy(obfuscated)
     comparison = {
         "original": {
             "path": str(original),
-            "size": get_file_size(original),
-            "entropy": compute_entropy(original.read_bytes() if original.exists() else b""),
+            "size": original_size,
+            "entropy": original_entropy,
         },
         "obfuscated": {
             "path": str(obfuscated),
-            "size": get_file_size(obfuscated),
-            "entropy": compute_entropy(obfuscated.read_bytes() if obfuscated.exists() else b""),
+            "size": obfuscated_size,
+            "entropy": obfuscated_entropy,
         },
-        "size_delta": get_file_size(obfuscated) - get_file_size(original),
-        "entropy_delta": compute_entropy(obfuscated.read_bytes() if obfuscated.exists() else b"")
-        - compute_entropy(original.read_bytes() if original.exists() else b""),
+        "size_delta": obfuscated_size - original_size,
+        "entropy_delta": obfuscated_entropy - original_entropy,
     }
     if config.output:
         write_json(config.output, comparison)
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 
 class Platform(str, Enum):
@@ -14,14 +15,15 @@ class Platform(str, Enum):
 
     @classmethod
     def from_string(cls, value: str) -> "Platform":
-        normalized = value.lower()
-        # Handle darwin as alias for macos
-        if normalized == "darwin":
-            normalized = "macos"
-        try:
-            return cls(normalized)
-        except ValueError as exc:
-            raise ValueError(f"Unsupported platform: {value}") from exc
+        platform = _PLATFORM_LOOKUP.get(value.lower())
+        if platform is None:
+            raise ValueError(f"Unsupported platform: {value}")
+        return platform
+
+
+_PLATFORM_LOOKUP: Dict[str, Platform] = {member.value: member for member in Platform}
+# Handle darwin as alias for macos
+_PLATFORM_LOOKUP["darwin"] = Platform.MACOS
 
 
 class ObfuscationLevel(int, Enum):
@@ -32,7 +34,17 @@ class ObfuscationLevel(int, Enum):
     MAXIMUM = 5
 
 
-@dataclass
+# (LLVM pass name, PassConfiguration attribute) in pipeline order.
+_PASS_ATTRS: Tuple[Tuple[str, str], ...] = (
+    ("flattening", "flattening"),
+    ("substitution", "substitution"),
+    ("boguscf", "bogus_control_flow"),
+    ("split", "split"),  # Note: New PM uses "split", legacy uses "splitbbl"
+    ("linear-mba", "linear_mba"),
+)
+
+
+@dataclass(frozen=True, slots=True)
 class PassConfiguration:
     flattening: bool = False
     substitution: bool = False
@@ -40,18 +52,18 @@ class PassConfiguration:
     split: bool = False
     linear_mba: bool = False
 
-    def enabled_passes(self) -> List[str]:
-        mapping = {
-            "flattening": self.flattening,
-            "substitution": self.substitution,
-            "boguscf": self.bogus_control_flow,
-            "split": self.split,  # Note: New PM uses "split", legacy uses "splitbbl"
-            "linear-mba": self.linear_mba,
-        }
-        return [name for name, enabled in mapping.items() if enabled]
+    def enabled_passes(self) -> Tuple[str, ...]:
+        return _enabled_pass_names(self)
+
 
+# The configuration is frozen and hashable, and there are only 2**5 pass combinations,
+# so each distinct one resolves its pass names once.
+@lru_cache(maxsize=32)
+def _enabled_pass_names(passes: PassConfiguration) -> Tuple[str, ...]:
+    return tuple(name for name, attr in _PASS_ATTRS if getattr(passes, attr))
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class SymbolObfuscationConfiguration:
     enabled: bool = False
     algorithm: str = "sha256"  # sha256, blake2b, siphash
@@ -62,28 +74,74 @@ class SymbolObfuscationConfiguration:
     preserve_stdlib: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AdvancedConfiguration:
     cycles: int = 1
     string_encryption: bool = False
     fake_loops: int = 0
+    # Split the module into cpu_count * N function batches for parallel opt runs (0 = whole module).
+    opt_batches_per_thread: int = 0
+    # Run C sources through one clang call with -fpass-plugin instead of clang -> opt -> clang.
+    # Only for plugins that define their own "passes" option or schedule their passes from a
+    # pipeline-start hook; plugins that rely on opt's -passes fall back to the 3-step route.
+    fuse_pass_plugin: bool = False
     symbol_obfuscation: SymbolObfuscationConfiguration = field(default_factory=SymbolObfuscationConfiguration)
 
 
-@dataclass
+_DEFAULT_REPORT_FORMATS: FrozenSet[str] = frozenset({"json"})
+
+
+@dataclass(slots=True)
 class OutputConfiguration:
     directory: Path
-    report_formats: List[str] = field(default_factory=lambda: ["json"])  # json, html, pdf
+    report_formats: FrozenSet[str] = _DEFAULT_REPORT_FORMATS  # json, html, markdown, pdf
+    # Section/symbol listings of the output binary; only skipped when False and no reporter is attached.
+    collect_attributes: bool = True
+
+    def __post_init__(self) -> None:
+        # Accept any iterable (lists from YAML/API payloads) and store a set for O(1) membership checks.
+        # A bare string is one format ("html", not {"h", "t", "m", "l"}); None means the default.
+        formats = self.report_formats
+        if formats is None:
+            formats = _DEFAULT_REPORT_FORMATS
+        elif isinstance(formats, str):
+            formats = (formats,)
+        self.report_formats = frozenset(fmt.lower() for fmt in formats)
 
 
-@dataclass
+# Path objects are immutable, so every config using the default directory can share one.
+_DEFAULT_OUTPUT_DIR = Path("./obfuscated")
+
+# Field names are resolved once at import so from_dict only copies the keys
+# that are present and lets the dataclass defaults fill in the rest.
+_PASS_FIELDS = tuple(f.name for f in fields(PassConfiguration))
+_ADVANCED_FIELDS = tuple(f.name for f in fields(AdvancedConfiguration) if f.name != "symbol_obfuscation")
+
+
+@lru_cache(maxsize=256)
+def _shared_config(cls, items: Tuple[Tuple[str, type, object], ...]):
+    return cls(**{name: value for name, _, value in items})
+
+
+def _from_mapping(cls, names, data: Dict):
+    # Pass and advanced configs are frozen, so jobs with identical sections
+    # (the common case in batch files) share a single instance. Value types are
+    # part of the key because True == 1 (and 1 == 1.0) hash alike.
+    items = tuple((name, type(data[name]), data[name]) for name in names if name in data)
+    try:
+        return _shared_config(cls, items)
+    except TypeError:  # unhashable value, build a private instance
+        return cls(**{name: value for name, _, value in items})
+
+
+@dataclass(slots=True)
 class ObfuscationConfig:
     level: ObfuscationLevel = ObfuscationLevel.MEDIUM
     platform: Platform = Platform.LINUX
     compiler_flags: List[str] = field(default_factory=list)
     passes: PassConfiguration = field(default_factory=PassConfiguration)
     advanced: AdvancedConfiguration = field(default_factory=AdvancedConfiguration)
-    output: OutputConfiguration = field(default_factory=lambda: OutputConfiguration(Path("./obfuscated")))
+    output: OutputConfiguration = field(default_factory=lambda: OutputConfiguration(_DEFAULT_OUTPUT_DIR))
     custom_pass_plugin: Optional[Path] = None
 
     @classmethod
@@ -91,24 +149,14 @@ class ObfuscationConfig:
         level = ObfuscationLevel(data.get("level", ObfuscationLevel.MEDIUM))
         platform = Platform.from_string(data.get("platform", Platform.LINUX.value))
         compiler_flags = data.get("compiler_flags", [])
-        passes_data = data.get("passes", {})
-        passes = PassConfiguration(
-            flattening=passes_data.get("flattening", False),
-            substitution=passes_data.get("substitution", False),
-            bogus_control_flow=passes_data.get("bogus_control_flow", False),
-            split=passes_data.get("split", False),
-            linear_mba=passes_data.get("linear_mba", False),
-        )
-        adv_data = data.get("advanced", {})
-        advanced = AdvancedConfiguration(
-            cycles=adv_data.get("cycles", 1),
-            string_encryption=adv_data.get("string_encryption", False),
-            fake_loops=adv_data.get("fake_loops", 0),
-        )
+        passes = _from_mapping(PassConfiguration, _PASS_FIELDS, data.get("passes", {}))
+        advanced = _from_mapping(AdvancedConfiguration, _ADVANCED_FIELDS, data.get("advanced", {}))
         output_data = data.get("output", {})
+        directory = output_data.get("directory")
         output = OutputConfiguration(
-            directory=Path(output_data.get("directory", "./obfuscated")),
+            directory=Path(directory) if directory else _DEFAULT_OUTPUT_DIR,
             report_formats=output_data.get("report_format", ["json"]),
+            collect_attributes=output_data.get("collect_attributes", True),
         )
         custom_pass_plugin = data.get("custom_pass_plugin")
         if custom_pass_plugin:
@@ -124,13 +172,13 @@ class ObfuscationConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalyzeConfig:
     binary_path: Path
     output: Optional[Path] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CompareConfig:
     original_binary: Path
     obfuscated_binary: Path
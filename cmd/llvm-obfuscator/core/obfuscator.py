@@ -1,9 +1,23 @@
 from __future__ import annotations
 
 import logging
+import math
+import mmap
+import os
+import platform
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
+from .artifact_cache import ArtifactCache, cache_key, default_cache_dir, file_fingerprint
 from .config import ObfuscationConfig, Platform
 from .exceptions import ObfuscationError
 from .fake_loop_inserter import FakeLoopGenerator
@@ -11,11 +25,11 @@ from .reporter import ObfuscationReport
 from .string_encryptor import StringEncryptionResult, XORStringEncryptor
 from .symbol_obfuscator import SymbolObfuscator
 from .utils import (
-    compute_entropy,
     create_logger,
     detect_binary_format,
     ensure_directory,
-    get_file_size,
+    entropy_from_histogram,
+    fingerprint_file,
     get_timestamp,
     list_sections,
     merge_flags,
@@ -26,18 +40,225 @@ from .utils import (
 
 logger = logging.getLogger(__name__)
 
+# Last-resort opt locations when no opt ships with the plugin (set LLVM_OBFUSCATOR_OPT to override).
+_FALLBACK_OPT_PATHS = (
+    Path("/usr/local/bin/opt"),
+    Path("/opt/homebrew/bin/opt"),
+)
+
+# Intermediate IR goes to tmpfs when available.
+_IR_TMP_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# Personality routines referenced by functions that use C++ exception handling.
+_EH_PERSONALITY_NAMES = (b"__gxx_personality_", b"__gcc_personality_", b"__CxxFrameHandler")
+
+# Names of functions defined (not just declared) in a textual LLVM IR module.
+_IR_DEFINE_RE = re.compile(rb'^define\b[^@\n]*@("(?:[^"\\]|\\.)*"|[-\w.$]+)\(', re.MULTILINE)
+
+# Sources that pull in local headers are not cached: the key only covers the source file itself.
+_LOCAL_INCLUDE_RE = re.compile(rb'^[ \t]*#[ \t]*(?:include|import)[ \t]*"', re.MULTILINE)
+_INCLUDE_FLAG_PREFIXES = ("-I", "-iquote", "-isystem", "-idirafter", "-include", "-imacros", "--include")
+
+
+def _ir_defined_functions(ir_file: Path) -> List[str]:
+    """Names of the functions defined in a textual IR file, scanned in place through mmap."""
+    with ir_file.open("rb") as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files cannot be mapped
+            return []
+        with data:
+            names = _IR_DEFINE_RE.findall(data)
+    return [
+        (name[1:-1] if name.startswith(b'"') else name).decode("utf-8", errors="ignore")
+        for name in names
+    ]
+
+
+# Host platform facts are fixed for the life of the process, so resolve them once.
+_SYSTEM = platform.system().lower()  # darwin, linux, windows
+_MACHINE = platform.machine().lower()  # arm64, x86_64, amd64
+_ARCH = {"x86_64": "x86_64", "amd64": "x86_64", "arm64": "arm64", "aarch64": "arm64"}.get(_MACHINE)
+_PLUGIN_EXT = {"darwin": "dylib", "linux": "so", "windows": "dll"}.get(_SYSTEM)
+_PLUGIN_ROOT = Path(__file__).parent.parent / "plugins"
+
+
+def _plugin_file(system: str, arch: str, ext: str) -> Path:
+    return _PLUGIN_ROOT / f"{system}-{arch}" / f"LLVMObfuscationPlugin.{ext}"
+
+
+# Bundled plugin location for the host (None key) and for each explicit target platform.
+# Linux/Windows targets default to x86_64; macOS targets use the host arch (arm64 or x86_64).
+_DARWIN_PLUGIN = _plugin_file("darwin", "arm64" if _MACHINE == "aarch64" else _MACHINE, "dylib")
+_BUNDLED_PLUGIN_PATHS: Dict[Optional[Platform], Optional[Path]] = {
+    None: _plugin_file(_SYSTEM, _ARCH, _PLUGIN_EXT) if _ARCH and _PLUGIN_EXT else None,
+    Platform.LINUX: _plugin_file("linux", "x86_64", "so"),
+    Platform.WINDOWS: _plugin_file("windows", "x86_64", "dll"),
+    Platform.MACOS: _DARWIN_PLUGIN,
+    Platform.DARWIN: _DARWIN_PLUGIN,
+}
+
+
+@lru_cache(maxsize=None)
+def _resource_dir_flags(compiler_path: str) -> Tuple[str, ...]:
+    """
+    Memoized -resource-dir lookup behind LLVMObfuscator._get_resource_dir_flag.
+
+    The answer only depends on the compiler binary, so the PATH lookup and
+    the `clang -print-resource-dir` probe run once per compiler per process
+    instead of before every clang invocation.
+    """
+    # Only needed on Linux for custom clang binaries
+    if _SYSTEM != "linux":
+        return ()
+
+    # Resolve compiler to full path if it's just a command name (like "clang")
+    resolved_path = compiler_path
+    if "/" not in compiler_path:
+        which_path = shutil.which(compiler_path)
+        if which_path:
+            resolved_path = which_path
+            logger.info(f"[RESOURCE-DIR-DEBUG] Resolved '{compiler_path}' to '{resolved_path}'")
+        else:
+            logger.warning(f"[RESOURCE-DIR-DEBUG] Could not resolve compiler path: {compiler_path}")
+    else:
+        logger.info(f"[RESOURCE-DIR-DEBUG] Compiler path already resolved: {resolved_path}")
+
+    # Check if this is a custom clang (not system clang)
+    is_custom_clang = (
+        "/plugins/" in resolved_path or  # Bundled clang
+        "/usr/local/llvm-obfuscator/" in resolved_path or  # Custom installed clang
+        "/llvm-project/build/" in resolved_path  # LLVM build directory
+    )
+
+    logger.info(f"[RESOURCE-DIR-DEBUG] is_custom_clang={is_custom_clang} for path={resolved_path}")
+
+    if not is_custom_clang:
+        return ()
+
+    # Try to find system clang's resource directory
+    # Priority: system clang-19 > clang-18 > clang
+    system_clang_candidates = [
+        "/usr/lib/llvm-19/lib/clang/19",
+        "/usr/lib/llvm-18/lib/clang/18",
+        "/usr/lib/llvm-17/lib/clang/17",
+    ]
+
+    for resource_dir in system_clang_candidates:
+        if Path(resource_dir).exists():
+            logger.info(f"[RESOURCE-DIR-DEBUG] Using system resource directory: {resource_dir}")
+            return ("-resource-dir", resource_dir)
+
+    # Fallback: try to detect from system clang
+    try:
+        result = subprocess.run(
+            ["clang", "-print-resource-dir"],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        if result.returncode == 0:
+            resource_dir = result.stdout.strip()
+            if Path(resource_dir).exists():
+                logger.debug(f"Detected resource directory from system clang: {resource_dir}")
+                return ("-resource-dir", resource_dir)
+    except Exception as e:
+        logger.debug(f"Could not detect system clang resource directory: {e}")
+
+    logger.warning(
+        "Custom clang binary used but system resource directory not found. "
+        "Compilation may fail with 'stddef.h not found' errors."
+    )
+    return ()
+
+
+_CXX_SUFFIXES = frozenset({".cpp", ".cxx", ".cc", ".c++"})
+_KNOWN_HOSTS = frozenset({"darwin", "linux", "windows"})
+
+
+@dataclass(frozen=True, slots=True)
+class CompileContext:
+    """Per-job compile facts resolved once in LLVMObfuscator._compile_context."""
+
+    base_compiler: str
+    is_cpp: bool
+    # OLLVM plugin (explicit > env var > bundled); None when no passes are requested.
+    plugin_path: Optional[Path]
+    # Bundled plugin for the target platform; its directory may also hold clang/opt.
+    bundled_plugin: Optional[Path]
+    target_flags: Tuple[str, ...]
+    host_os: str
+    target_os: str
+
+    @property
+    def is_cross_compiling(self) -> bool:
+        return self.host_os in _KNOWN_HOSTS and self.host_os != self.target_os
+
+
+@dataclass(slots=True)
+class EstimatedMetrics:
+    """Heuristic obfuscation metrics produced by LLVMObfuscator._estimate_metrics."""
+
+    bogus_code_info: Dict
+    string_obfuscation: Dict
+    fake_loops_inserted: Dict
+    cycles_completed: Dict
+    obfuscation_score: float
+    symbol_reduction: float
+    function_reduction: float
+    size_reduction: float
+    entropy_increase: float
+    estimated_re_effort: str
+
+
+@dataclass(slots=True)
+class JobData:
+    """Result of a single obfuscation job; to_dict() gives the reporter/API payload."""
+
+    job_id: Optional[str]
+    source_file: str
+    platform: str
+    obfuscation_level: int
+    requested_passes: Sequence[str]  # What user requested
+    applied_passes: List[str]  # What was actually applied
+    compiler_flags: Sequence[str]
+    timestamp: str
+    warnings: List[str]
+    baseline_metrics: Dict  # Before obfuscation metrics
+    output_attributes: Dict
+    comparison: Dict
+    bogus_code_info: Dict
+    cycles_completed: Dict
+    string_obfuscation: Dict
+    fake_loops_inserted: Dict
+    symbol_obfuscation: Dict
+    obfuscation_score: float
+    symbol_reduction: float
+    function_reduction: float
+    size_reduction: float
+    entropy_increase: float
+    estimated_re_effort: str
+    output_file: str
+
+    def to_dict(self) -> Dict:
+        # Shallow copy: nested sections are handed over as-is rather than deep-copied by asdict().
+        return {name: getattr(self, name) for name in _JOB_DATA_FIELDS}
+
+
+_JOB_DATA_FIELDS = tuple(f.name for f in fields(JobData))
+
 
 class LLVMObfuscator:
     """Main obfuscation pipeline orchestrator."""
 
-    BASE_FLAGS = [
+    BASE_FLAGS = (
         "-fvisibility=hidden",
         "-O3",
         "-fno-builtin",
         "-fomit-frame-pointer",
         "-mspeculative-load-hardening",
         "-Wl,-s",
-    ]
+    )
 
     CUSTOM_PASSES = [
         "flattening",
@@ -46,78 +267,73 @@ class LLVMObfuscator:
         "split",
     ]
 
-    def __init__(self, reporter: Optional[ObfuscationReport] = None) -> None:
+    # Section/symbol listings kept per binary digest (see _binary_metrics).
+    LISTINGS_CACHE_SIZE = 64
+
+    def __init__(self, reporter: Optional[ObfuscationReport] = None, cache_dir: Optional[Path] = None) -> None:
         self.logger = create_logger(__name__)
         self.reporter = reporter
+        cache_root = cache_dir or default_cache_dir()
+        self.artifact_cache = ArtifactCache(cache_root) if cache_root else None
+        self._opt_binary: Optional[Path] = None
+        # Plugins whose fused clang invocation failed; they go straight to clang -> opt -> clang.
+        self._unfusable_plugins: Set[str] = set()
         self.encryptor = XORStringEncryptor()
         self.fake_loop_generator = FakeLoopGenerator()
         self.symbol_obfuscator = SymbolObfuscator()
+        # SHA-256 -> (sections, symbols_count, functions_count); identical binaries (baseline rebuilds,
+        # artifact cache hits) are listed with nm/objdump only once.
+        self._listings: "OrderedDict[str, Tuple[Dict[str, int], int, int]]" = OrderedDict()
+        self._listings_lock = threading.Lock()
 
     def _get_bundled_plugin_path(self, target_platform: Optional[Platform] = None) -> Optional[Path]:
         """Auto-detect bundled OLLVM plugin for current or target platform."""
-        try:
-            import platform
-            import os
-
-            if target_platform:
-                # Use target platform specified by user (for cross-compilation)
-                if target_platform == Platform.LINUX:
-                    system = "linux"
-                    arch = "x86_64"  # Default to x86_64 for Linux
-                    ext = "so"
-                elif target_platform == Platform.WINDOWS:
-                    system = "windows"
-                    arch = "x86_64"
-                    ext = "dll"
-                elif target_platform in [Platform.MACOS, Platform.DARWIN]:
-                    system = "darwin"
-                    arch = platform.machine().lower()  # Use current arch (arm64 or x86_64)
-                    if arch == "aarch64":
-                        arch = "arm64"
-                    ext = "dylib"
-                else:
-                    # For unknown, fall back to current platform detection
-                    target_platform = None
-
-            if not target_platform:
-                # Auto-detect current platform
-                system = platform.system().lower()  # darwin, linux, windows
-                machine = platform.machine().lower()  # arm64, x86_64, amd64
-
-                # Normalize architecture names
-                if machine in ['x86_64', 'amd64']:
-                    arch = 'x86_64'
-                elif machine in ['arm64', 'aarch64']:
-                    arch = 'arm64'
-                else:
-                    self.logger.debug(f"Unsupported architecture for bundled plugin: {machine}")
-                    return None
-
-                # Determine plugin extension by platform
-                if system == "darwin":
-                    ext = "dylib"
-                elif system == "linux":
-                    ext = "so"
-                elif system == "windows":
-                    ext = "dll"
-                else:
-                    self.logger.debug(f"Unsupported platform for bundled plugin: {system}")
-                    return None
-
-            # Build path to bundled plugin
-            plugin_dir = Path(__file__).parent.parent / "plugins" / f"{system}-{arch}"
-            plugin_file = plugin_dir / f"LLVMObfuscationPlugin.{ext}"
+        plugin_file = _BUNDLED_PLUGIN_PATHS.get(target_platform, _BUNDLED_PLUGIN_PATHS[None])
+        if plugin_file is None:
+            self.logger.debug(f"Unsupported platform for bundled plugin: {_SYSTEM}-{_MACHINE}")
+            return None
+        if plugin_file.exists():
+            self.logger.info(f"Auto-detected bundled plugin: {plugin_file}")
+            return plugin_file
+        self.logger.debug(f"Bundled plugin not found at: {plugin_file}")
+        return None
+
+    def _compile_context(
+        self, source: Path, config: ObfuscationConfig, enabled_passes: Sequence[str]
+    ) -> CompileContext:
+        """Resolve compiler, plugin and target once per job instead of at every compile step."""
+        bundled_plugin = self._get_bundled_plugin_path(config.platform)
+
+        plugin_path = None
+        if enabled_passes:
+            # Determine which plugin to use (priority: explicit > env var > bundled)
+            plugin_path = config.custom_pass_plugin
+            if not plugin_path:
+                env_plugin = os.getenv("LLVM_OBFUSCATION_PLUGIN")
+                if env_plugin:
+                    plugin_path = Path(env_plugin)
+                    if plugin_path.exists():
+                        self.logger.info(f"Using plugin from environment: {plugin_path}")
+                    else:
+                        self.logger.warning(f"Environment plugin not found: {plugin_path}")
+                        plugin_path = None
+            if not plugin_path:
+                plugin_path = bundled_plugin
 
-            if plugin_file.exists():
-                self.logger.info(f"Auto-detected bundled plugin: {plugin_file}")
-                return plugin_file
-            else:
-                self.logger.debug(f"Bundled plugin not found at: {plugin_file}")
-                return None
+            if plugin_path and not plugin_path.exists():
+                plugin_path = None
 
-        except Exception as e:
-            self.logger.debug(f"Could not auto-detect bundled plugin: {e}")
-            return None
+        is_cpp = source.suffix in _CXX_SUFFIXES
+        target_os = config.platform.value.lower()
+        return CompileContext(
+            base_compiler="clang++" if is_cpp else "clang",
+            is_cpp=is_cpp,
+            plugin_path=plugin_path,
+            bundled_plugin=bundled_plugin,
+            target_flags=("--target=x86_64-w64-mingw32",) if config.platform == Platform.WINDOWS else (),
+            host_os=_SYSTEM,
+            target_os="darwin" if target_os == "macos" else target_os,
+        )
 
     def obfuscate(self, source_file: Path, config: ObfuscationConfig, job_id: Optional[str] = None) -> Dict:
         if not source_file.exists():
@@ -134,100 +350,98 @@ class LLVMObfuscator:
         require_tool("clang")
         if config.platform == Platform.WINDOWS:
             require_tool("x86_64-w64-mingw32-gcc")
+        enabled_passes = config.passes.enabled_passes()
+        context = self._compile_context(source_file, config, enabled_passes)
 
-        source_content = source_file.read_text(encoding="utf-8", errors="ignore")
-
-        # Compile baseline (unobfuscated) binary for comparison
+        # Compile baseline (unobfuscated) binary for comparison. It only feeds the
+        # report, so its build and analysis overlap the obfuscation pipeline below.
         self.logger.info("Compiling baseline binary for comparison...")
         baseline_binary = output_directory / f"{source_file.stem}_baseline"
-        baseline_metrics = self._compile_and_analyze_baseline(source_file, baseline_binary, config)
-
-        # Symbol obfuscation (if enabled) - applied FIRST before other transformations
-        symbol_result = None
-        working_source = source_file
-        if config.advanced.symbol_obfuscation.enabled:
-            try:
-                symbol_obfuscated_file = output_directory / f"{source_file.stem}_symbol_obfuscated{source_file.suffix}"
-                symbol_result = self.symbol_obfuscator.obfuscate(
-                    source_file=source_file,
-                    output_file=symbol_obfuscated_file,
-                    algorithm=config.advanced.symbol_obfuscation.algorithm,
-                    hash_length=config.advanced.symbol_obfuscation.hash_length,
-                    prefix_style=config.advanced.symbol_obfuscation.prefix_style,
-                    salt=config.advanced.symbol_obfuscation.salt,
-                    preserve_main=config.advanced.symbol_obfuscation.preserve_main,
-                    preserve_stdlib=config.advanced.symbol_obfuscation.preserve_stdlib,
-                    generate_map=True,
-                    map_file=output_directory / "symbol_map.json",
-                    is_cpp=source_file.suffix in [".cpp", ".cc", ".cxx"],
-                )
-                working_source = symbol_obfuscated_file
-                self.logger.info(f"Symbol obfuscation complete: {symbol_result['symbols_obfuscated']} symbols renamed")
-            except Exception as e:
-                self.logger.warning(f"Symbol obfuscation failed, continuing without it: {e}")
-
-        # String encryption (if enabled) - applied to source content
-        string_result: Optional[StringEncryptionResult] = None
-        if config.advanced.string_encryption:
-            try:
-                # Get the symbol-obfuscated source if available, otherwise use original
-                current_source_content = working_source.read_text(encoding="utf-8", errors="replace")
-                string_result = self.encryptor.encrypt_strings(current_source_content)
-
-                # Write the transformed source to a new file
-                string_encrypted_file = output_directory / f"{source_file.stem}_string_encrypted{source_file.suffix}"
-                string_encrypted_file.write_text(string_result.transformed_source, encoding="utf-8", errors="replace")
-                working_source = string_encrypted_file
-                self.logger.info(f"String encryption complete: {string_result.encrypted_strings}/{string_result.total_strings} strings encrypted")
-            except Exception as e:
-                self.logger.error(f"String encryption failed: {e}")
-                string_result = None
-
-        fake_loops = []
-        if config.advanced.fake_loops:
-            fake_loops = self.fake_loop_generator.generate(config.advanced.fake_loops, source_file.name)
-
-        enabled_passes = config.passes.enabled_passes()
-        compiler_flags = merge_flags(self.BASE_FLAGS, config.compiler_flags)
-
-        # IMPORTANT: Cycles only make sense for source code recompilation
-        # Once we have a binary, we can't feed it back through the compiler
-        # So if OLLVM passes are enabled, limit to 1 cycle
-        effective_cycles = 1 if enabled_passes else config.advanced.cycles
-        if enabled_passes and config.advanced.cycles > 1:
-            self.logger.warning(
-                "Multiple cycles (%d) requested with OLLVM passes enabled. "
-                "Cycles only apply to source code compilation. "
-                "Running 1 cycle with all OLLVM passes instead.",
-                config.advanced.cycles
-            )
+        baseline_executor = ThreadPoolExecutor(max_workers=1)
+        baseline_future = baseline_executor.submit(self._compile_and_analyze_baseline, source_file, baseline_binary, config)
 
-        intermediate_source = working_source  # Use symbol-obfuscated source if enabled
-        for cycle in range(1, effective_cycles + 1):
-            self.logger.info("Starting cycle %s/%s", cycle, effective_cycles)
-            intermediate_binary = output_binary if cycle == effective_cycles else output_directory / f"{output_binary.stem}_cycle{cycle}{output_binary.suffix}"
-
-            cycle_result = self._compile(
-                intermediate_source,
-                intermediate_binary,
+        # Join the baseline on every path so a failed job never leaves it writing output behind.
+        try:
+            # Symbol obfuscation (if enabled) - applied FIRST before other transformations
+            symbol_result = None
+            working_source = source_file
+            if config.advanced.symbol_obfuscation.enabled:
+                try:
+                    symbol_obfuscated_file = output_directory / f"{source_file.stem}_symbol_obfuscated{source_file.suffix}"
+                    symbol_result = self.symbol_obfuscator.obfuscate(
+                        source_file=source_file,
+                        output_file=symbol_obfuscated_file,
+                        algorithm=config.advanced.symbol_obfuscation.algorithm,
+                        hash_length=config.advanced.symbol_obfuscation.hash_length,
+                        prefix_style=config.advanced.symbol_obfuscation.prefix_style,
+                        salt=config.advanced.symbol_obfuscation.salt,
+                        preserve_main=config.advanced.symbol_obfuscation.preserve_main,
+                        preserve_stdlib=config.advanced.symbol_obfuscation.preserve_stdlib,
+                        generate_map=True,
+                        map_file=output_directory / "symbol_map.json",
+                        is_cpp=source_file.suffix in [".cpp", ".cc", ".cxx"],
+                    )
+                    working_source = symbol_obfuscated_file
+                    self.logger.info(f"Symbol obfuscation complete: {symbol_result['symbols_obfuscated']} symbols renamed")
+                except Exception as e:
+                    self.logger.warning(f"Symbol obfuscation failed, continuing without it: {e}")
+
+            # String encryption (if enabled) - applied to source content
+            string_result: Optional[StringEncryptionResult] = None
+            if config.advanced.string_encryption:
+                try:
+                    # Get the symbol-obfuscated source if available, otherwise use original
+                    current_source_content = working_source.read_text(encoding="utf-8", errors="replace")
+                    string_result = self.encryptor.encrypt_strings(current_source_content)
+
+                    # Write the transformed source to a new file
+                    string_encrypted_file = output_directory / f"{source_file.stem}_string_encrypted{source_file.suffix}"
+                    string_encrypted_file.write_text(string_result.transformed_source, encoding="utf-8", errors="replace")
+                    working_source = string_encrypted_file
+                    self.logger.info(f"String encryption complete: {string_result.encrypted_strings}/{string_result.total_strings} strings encrypted")
+                except Exception as e:
+                    self.logger.error(f"String encryption failed: {e}")
+                    string_result = None
+
+            fake_loops = []
+            if config.advanced.fake_loops:
+                fake_loops = self.fake_loop_generator.generate(config.advanced.fake_loops, source_file.name)
+
+            compiler_flags = merge_flags(self.BASE_FLAGS, config.compiler_flags)
+
+            # Cycles are applied at the IR level: the source goes through the frontend
+            # once and opt runs the pass sequence `cycles` times back to back.
+            if enabled_passes and config.advanced.cycles > 1:
+                self.logger.info("Applying %d cycles of OLLVM passes in a single opt run", config.advanced.cycles)
+
+            compile_result = self._compile(
+                working_source,  # Use symbol-obfuscated / string-encrypted source if enabled
+                output_binary,
                 config,
                 compiler_flags,
                 enabled_passes,
+                context,
             )
 
             # Track what actually happened
-            if cycle_result:
-                actually_applied_passes = cycle_result.get("applied_passes", [])
-                # Always extend warnings list (even if empty, to maintain consistency)
-                warnings_log.extend(cycle_result.get("warnings", []))
+            if compile_result:
+                actually_applied_passes = compile_result.get("applied_passes", [])
+                warnings_log.extend(compile_result.get("warnings", []))
 
-            intermediate_source = intermediate_binary
-
-        binary_format = detect_binary_format(output_binary)
-        file_size = get_file_size(output_binary)
-        sections = list_sections(output_binary)
-        symbols_count, functions_count = summarize_symbols(output_binary)
-        entropy = compute_entropy(output_binary.read_bytes() if output_binary.exists() else b"")
+            output_metrics = self._binary_metrics(
+                output_binary,
+                include_listings=self.reporter is not None or config.output.collect_attributes,
+            )
+            file_size = output_metrics["file_size"]
+            binary_format = output_metrics["binary_format"]
+            sections = output_metrics["sections"]
+            symbols_count = output_metrics["symbols_count"]
+            functions_count = output_metrics["functions_count"]
+            entropy = output_metrics["entropy"]
+            output_sha256 = output_metrics["sha256"]
+            baseline_metrics = baseline_future.result()
+        finally:
+            baseline_executor.shutdown(wait=True, cancel_futures=True)
 
         base_metrics = self._estimate_metrics(
             source_file=source_file,
@@ -239,19 +453,20 @@ class LLVMObfuscator:
             entropy=entropy,
         )
 
-        job_data = {
-            "job_id": job_id,
-            "source_file": str(source_file.name),  # Use just the filename, not full path
-            "platform": config.platform.value,
-            "obfuscation_level": int(config.level),
-            "requested_passes": enabled_passes,  # What user requested
-            "applied_passes": actually_applied_passes,  # What was actually applied
-            "compiler_flags": compiler_flags,
-            "timestamp": get_timestamp(),
-            "warnings": warnings_log,  # Add warnings to report
-            "baseline_metrics": baseline_metrics,  # Before obfuscation metrics
-            "output_attributes": {
+        job_data = JobData(
+            job_id=job_id,
+            source_file=str(source_file.name),  # Use just the filename, not full path
+            platform=config.platform.value,
+            obfuscation_level=int(config.level),
+            requested_passes=enabled_passes,  # What user requested
+            applied_passes=actually_applied_passes,  # What was actually applied
+            compiler_flags=compiler_flags,
+            timestamp=get_timestamp(),
+            warnings=warnings_log,  # Add warnings to report
+            baseline_metrics=baseline_metrics,  # Before obfuscation metrics
+            output_attributes={
                 "file_size": file_size,
+                "sha256": output_sha256,
                 "binary_format": binary_format,
                 "sections": sections,
                 "symbols_count": symbols_count,
@@ -259,7 +474,7 @@ class LLVMObfuscator:
                 "entropy": entropy,
                 "obfuscation_methods": actually_applied_passes + (["symbol_obfuscation"] if symbol_result else []) + (["string_encryption"] if string_result else []),
             },
-            "comparison": {
+            comparison={
                 "size_change": file_size - baseline_metrics.get("file_size", file_size) if baseline_metrics else 0,
                 "size_change_percent": round(((file_size - baseline_metrics.get("file_size", file_size)) / baseline_metrics.get("file_size", file_size) * 100), 2) if baseline_metrics and baseline_metrics.get("file_size", 0) > 0 else 0,
                 "symbols_removed": baseline_metrics.get("symbols_count", 0) - symbols_count if baseline_metrics else 0,
@@ -269,19 +484,19 @@ class LLVMObfuscator:
                 "entropy_increase": round(entropy - baseline_metrics.get("entropy", 0), 3) if baseline_metrics else 0,
                 "entropy_increase_percent": round(((entropy - baseline_metrics.get("entropy", 0)) / baseline_metrics.get("entropy", 1) * 100), 2) if baseline_metrics and baseline_metrics.get("entropy", 0) > 0 else 0,
             },
-            "bogus_code_info": base_metrics["bogus_code_info"],
-            "cycles_completed": base_metrics["cycles_completed"],
-            "string_obfuscation": base_metrics["string_obfuscation"],
-            "fake_loops_inserted": base_metrics["fake_loops_inserted"],
-            "symbol_obfuscation": symbol_result or {"enabled": False},
-            "obfuscation_score": base_metrics["obfuscation_score"],
-            "symbol_reduction": base_metrics["symbol_reduction"],
-            "function_reduction": base_metrics["function_reduction"],
-            "size_reduction": base_metrics["size_reduction"],
-            "entropy_increase": base_metrics["entropy_increase"],
-            "estimated_re_effort": base_metrics["estimated_re_effort"],
-            "output_file": str(output_binary),
-        }
+            bogus_code_info=base_metrics.bogus_code_info,
+            cycles_completed=base_metrics.cycles_completed,
+            string_obfuscation=base_metrics.string_obfuscation,
+            fake_loops_inserted=base_metrics.fake_loops_inserted,
+            symbol_obfuscation=symbol_result or {"enabled": False},
+            obfuscation_score=base_metrics.obfuscation_score,
+            symbol_reduction=base_metrics.symbol_reduction,
+            function_reduction=base_metrics.function_reduction,
+            size_reduction=base_metrics.size_reduction,
+            entropy_increase=base_metrics.entropy_increase,
+            estimated_re_effort=base_metrics.estimated_re_effort,
+            output_file=str(output_binary),
+        ).to_dict()
 
         if self.reporter:
             report = self.reporter.generate_report(job_data)
@@ -305,77 +520,7 @@ class LLVMObfuscator:
         This is needed when using bundled clang or custom-built clang that
         doesn't have the compiler builtin headers.
         """
-        import platform as py_platform
-        import subprocess
-
-        # Only needed on Linux for custom clang binaries
-        if py_platform.system().lower() != "linux":
-            return []
-
-        # Resolve compiler to full path if it's just a command name (like "clang")
-        resolved_path = compiler_path
-        if "/" not in compiler_path:
-            try:
-                result = subprocess.run(
-                    ["which", compiler_path],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if result.returncode == 0:
-                    resolved_path = result.stdout.strip()
-                    self.logger.info(f"[RESOURCE-DIR-DEBUG] Resolved '{compiler_path}' to '{resolved_path}'")
-            except Exception as e:
-                self.logger.warning(f"[RESOURCE-DIR-DEBUG] Could not resolve compiler path: {e}")
-        else:
-            self.logger.info(f"[RESOURCE-DIR-DEBUG] Compiler path already resolved: {resolved_path}")
-
-        # Check if this is a custom clang (not system clang)
-        is_custom_clang = (
-            "/plugins/" in resolved_path or  # Bundled clang
-            "/usr/local/llvm-obfuscator/" in resolved_path or  # Custom installed clang
-            "/llvm-project/build/" in resolved_path  # LLVM build directory
-        )
-
-        self.logger.info(f"[RESOURCE-DIR-DEBUG] is_custom_clang={is_custom_clang} for path={resolved_path}")
-
-        if not is_custom_clang:
-            return []
-
-        # Try to find system clang's resource directory
-        # Priority: system clang-19 > clang-18 > clang
-        system_clang_candidates = [
-            "/usr/lib/llvm-19/lib/clang/19",
-            "/usr/lib/llvm-18/lib/clang/18",
-            "/usr/lib/llvm-17/lib/clang/17",
-        ]
-
-        for resource_dir in system_clang_candidates:
-            if Path(resource_dir).exists():
-                self.logger.info(f"[RESOURCE-DIR-DEBUG] Using system resource directory: {resource_dir}")
-                return ["-resource-dir", resource_dir]
-
-        # Fallback: try to detect from system clang
-        try:
-            result = subprocess.run(
-                ["clang", "-print-resource-dir"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                resource_dir = result.stdout.strip()
-                if Path(resource_dir).exists():
-                    self.logger.debug(f"Detected resource directory from system clang: {resource_dir}")
-                    return ["-resource-dir", resource_dir]
-        except Exception as e:
-            self.logger.debug(f"Could not detect system clang resource directory: {e}")
-
-        self.logger.warning(
-            "Custom clang binary used but system resource directory not found. "
-            "Compilation may fail with 'stddef.h not found' errors."
-        )
-        return []
+        return list(_resource_dir_flags(compiler_path))
 
     def _has_exception_handling(self, ir_file: Path) -> bool:
         """
@@ -385,6 +530,13 @@ class LLVMObfuscator:
         with the OLLVM flattening pass.
         """
         try:
+            if ir_file.suffix == ".bc":
+                # Bitcode has no instruction text, but every function with
+                # invoke/landingpad needs a personality routine, whose name is
+                # stored verbatim in the module string table.
+                ir_bytes = ir_file.read_bytes()
+                return any(name in ir_bytes for name in _EH_PERSONALITY_NAMES)
+
             ir_content = ir_file.read_text(encoding='utf-8', errors='ignore')
 
             # Check for invoke instructions (exception-aware function calls)
@@ -403,47 +555,127 @@ class LLVMObfuscator:
         source: Path,
         destination: Path,
         config: ObfuscationConfig,
-        compiler_flags: List[str],
-        enabled_passes: List[str],
+        compiler_flags: Sequence[str],
+        enabled_passes: Sequence[str],
+        context: Optional[CompileContext] = None,
     ) -> Dict:
+        """Compile through the artifact cache, running the toolchain only on a miss."""
+        if context is None:
+            context = self._compile_context(source, config, enabled_passes)
+        if self.artifact_cache is None:
+            return self._run_compile_pipeline(source, destination, config, compiler_flags, enabled_passes, context)
+
+        key = self._artifact_key(source, config, compiler_flags, enabled_passes, context)
+        if key is None:
+            self.logger.debug("Not caching %s: it depends on headers outside the cache key", source.name)
+            return self._run_compile_pipeline(source, destination, config, compiler_flags, enabled_passes, context)
+        cached = self.artifact_cache.fetch(key, destination)
+        if cached is not None:
+            self.logger.info("Reusing cached build of %s (%s)", source.name, key[:12])
+            return cached
+
+        result = self._run_compile_pipeline(source, destination, config, compiler_flags, enabled_passes, context)
+        if destination.exists():
+            self.artifact_cache.store(key, destination, result)
+        return result
+
+    def _artifact_key(
+        self,
+        source: Path,
+        config: ObfuscationConfig,
+        compiler_flags: Sequence[str],
+        enabled_passes: Sequence[str],
+        context: CompileContext,
+    ) -> Optional[str]:
+        """Cache key for one build, or None when the output depends on local headers."""
+        source_bytes = source.read_bytes()
+        if _LOCAL_INCLUDE_RE.search(source_bytes) or any(
+            flag.startswith(_INCLUDE_FLAG_PREFIXES) for flag in compiler_flags
+        ):
+            return None
+        return cache_key(
+            source_bytes,
+            source.suffix,
+            config.platform.value,
+            "\0".join(compiler_flags),
+            ",".join(enabled_passes),
+            str(config.advanced.cycles),
+            str(config.advanced.fuse_pass_plugin),
+            str(config.advanced.opt_batches_per_thread),
+            file_fingerprint(context.plugin_path),
+            self._toolchain_fingerprint(context),
+        )
+
+    @staticmethod
+    def _toolchain_fingerprint(context: CompileContext) -> str:
+        """Identity of every clang/opt binary _run_compile_pipeline may resolve for this context.
+
+        Which candidate wins depends on what exists on disk, so missing
+        candidates (fingerprinted as "") are part of the identity as well.
+        """
+        base = shutil.which(context.base_compiler)
+        candidates = [
+            Path(base) if base else None,
+            Path("/usr/bin/clang"),
+            Path("/usr/bin/clang++"),
+            Path("/usr/local/llvm-obfuscator/bin/opt"),
+        ]
+        if context.bundled_plugin:
+            candidates.append(context.bundled_plugin.parent / "clang")
+        if context.plugin_path:
+            plugin_dir = Path(context.plugin_path).parent
+            candidates.extend([
+                plugin_dir / "clang",
+                plugin_dir / "opt",
+                plugin_dir.parent / "bin" / "clang",
+                plugin_dir.parent / "bin" / "opt",
+            ])
+            env_opt = os.getenv("LLVM_OBFUSCATOR_OPT")
+            which_opt = shutil.which("opt")
+            candidates.extend(Path(p) for p in (env_opt, which_opt) if p)
+            candidates.extend(_FALLBACK_OPT_PATHS)
+        return "\0".join(file_fingerprint(path) for path in candidates)
+
+    def _run_compile_pipeline(
+        self,
+        source: Path,
+        destination: Path,
+        config: ObfuscationConfig,
+        compiler_flags: Sequence[str],
+        enabled_passes: Sequence[str],
+        context: Optional[CompileContext] = None,
+    ) -> Dict:
+        if context is None:
+            context = self._compile_context(source, config, enabled_passes)
         # Use absolute paths to avoid path resolution issues
         source_abs = source.resolve()
         destination_abs = destination.resolve()
+        # merge_flags hands out a shared tuple; commands below are built by list concatenation.
+        compiler_flags = list(compiler_flags)
+        target_flags = list(context.target_flags)
 
         # Track what actually happens during compilation
         warnings = []
         actually_applied_passes = list(enabled_passes)  # Start with requested passes
 
-        # Detect compiler based on file extension
-        if source_abs.suffix in ['.cpp', '.cxx', '.cc', '.c++']:
-            base_compiler = "clang++"
+        base_compiler = context.base_compiler
+        if context.is_cpp:
             # Add C++ standard library linking
             compiler_flags = compiler_flags + ["-lstdc++"]
-        else:
-            base_compiler = "clang"
 
         # Check for bundled clang FIRST (from LLVM 22) - used for ALL compilations
         compiler = base_compiler  # default to system clang
         bundled_clang_path = None
 
-        # Only use bundled clang if we're compiling for the SAME platform we're running on
-        # AND we're NOT using LTO (bundled clang doesn't have LLVMgold.so plugin)
-        import platform as py_platform
-        current_os = py_platform.system().lower()
-        target_os = config.platform.value.lower()
-        if target_os == "macos":
-            target_os = "darwin"
-
         # Check if LTO is enabled in compiler flags
         has_lto = any('lto' in flag.lower() for flag in compiler_flags)
 
-        # Only look for bundled clang if not cross-compiling AND not using LTO
-        is_same_platform = (current_os == target_os)
+        # Only use bundled clang if we're compiling for the SAME platform we're running on
+        # AND we're NOT using LTO (bundled clang doesn't have LLVMgold.so plugin)
+        is_same_platform = (context.host_os == context.target_os)
         if is_same_platform and not has_lto:
-            # Try to find bundled plugin directory for this platform
-            plugin_path = self._get_bundled_plugin_path(config.platform)
-            if plugin_path:
-                bundled_clang_path = plugin_path.parent / "clang"
+            if context.bundled_plugin:
+                bundled_clang_path = context.bundled_plugin.parent / "clang"
                 if bundled_clang_path.exists():
                     self.logger.info("Using bundled clang from LLVM 22: %s", bundled_clang_path)
                     compiler = str(bundled_clang_path)
@@ -454,55 +686,22 @@ class LLVMObfuscator:
             self.logger.debug("LTO enabled in flags, using system clang (bundled clang doesn't have LLVMgold.so)")
 
         # If OLLVM passes are requested, use 3-step workflow: source -> IR -> obfuscated IR -> binary
-        if enabled_passes:
-            # Determine which plugin to use (priority: explicit > env var > bundled)
-            import os
-            plugin_path = config.custom_pass_plugin
-
-            if not plugin_path:
-                # Try environment variable
-                env_plugin = os.getenv("LLVM_OBFUSCATION_PLUGIN")
-                if env_plugin:
-                    plugin_path = Path(env_plugin)
-                    if plugin_path.exists():
-                        self.logger.info(f"Using plugin from environment: {plugin_path}")
-                    else:
-                        self.logger.warning(f"Environment plugin not found: {plugin_path}")
-                        plugin_path = None
-
-            if not plugin_path:
-                # Try bundled plugin for target platform
-                plugin_path = self._get_bundled_plugin_path(config.platform)
-
-            if not plugin_path or not plugin_path.exists():
-                self.logger.error(
-                    "OLLVM passes requested but no plugin found.\n"
-                    "Options:\n"
-                    "  1. Specify path: --custom-pass-plugin /path/to/LLVMObfuscationPlugin.dylib\n"
-                    "  2. Set environment: export LLVM_OBFUSCATION_PLUGIN=/path/to/plugin\n"
-                    "  3. Ensure bundled plugin exists for your platform\n"
-                    f"  4. Build plugin from: /Users/akashsingh/Desktop/llvm-project"
-                )
-                raise ObfuscationError("OLLVM plugin not found")
+        plugin_path = context.plugin_path
+        if enabled_passes and not plugin_path:
+            self.logger.error(
+                "OLLVM passes requested but no plugin found.\n"
+                "Options:\n"
+                "  1. Specify path: --custom-pass-plugin /path/to/LLVMObfuscationPlugin.dylib\n"
+                "  2. Set environment: export LLVM_OBFUSCATION_PLUGIN=/path/to/plugin\n"
+                "  3. Ensure bundled plugin exists for your platform\n"
+                f"  4. Build plugin from: /Users/akashsingh/Desktop/llvm-project"
+            )
+            raise ObfuscationError("OLLVM plugin not found")
 
         if enabled_passes and plugin_path:
-            # Check for cross-compilation
-            import platform as py_platform
-            current_os = py_platform.system().lower()
-            target_os = config.platform.value.lower()
-            # Normalize macos to darwin for comparison
-            if target_os == "macos":
-                target_os = "darwin"
-            is_cross_compiling = (current_os == "darwin" and target_os == "linux") or \
-                                 (current_os == "darwin" and target_os == "windows") or \
-                                 (current_os == "linux" and target_os == "darwin") or \
-                                 (current_os == "linux" and target_os == "windows") or \
-                                 (current_os == "windows" and target_os == "darwin") or \
-                                 (current_os == "windows" and target_os == "linux")
-
-            if is_cross_compiling:
+            if context.is_cross_compiling:
                 warning_msg = (
-                    f"Cross-compilation detected: Building on {current_os} for {target_os}. "
+                    f"Cross-compilation detected: Building on {context.host_os} for {context.target_os}. "
                     f"OLLVM passes require running opt binary for target platform. "
                     f"OLLVM passes will be skipped. Applying other obfuscation layers only."
                 )
@@ -513,11 +712,8 @@ class LLVMObfuscator:
 
                 # Fall through to standard compilation without OLLVM
                 command = [compiler, str(source_abs), "-o", str(destination_abs)] + compiler_flags
-                resource_dir_flags = self._get_resource_dir_flag(compiler)
-                if resource_dir_flags:
-                    command.extend(resource_dir_flags)
-                if config.platform == Platform.WINDOWS:
-                    command.extend(["--target=x86_64-w64-mingw32"])
+                command.extend(self._get_resource_dir_flag(compiler))
+                command.extend(target_flags)
                 run_command(command, cwd=source_abs.parent)
                 return {
                     "applied_passes": actually_applied_passes,
@@ -535,176 +731,222 @@ class LLVMObfuscator:
                 bundled_opt = plugin_path_resolved.parent / "opt"
                 bundled_clang = plugin_path_resolved.parent / "clang"
 
-                # Step 1: Compile source to LLVM IR
-                ir_file = destination_abs.parent / f"{destination_abs.stem}_temp.ll"
-                ir_cmd = [compiler, str(source_abs), "-S", "-emit-llvm", "-o", str(ir_file)]
-
-                # Add resource-dir flag if using custom clang
-                resource_dir_flags = self._get_resource_dir_flag(compiler)
-                if resource_dir_flags:
-                    ir_cmd.extend(resource_dir_flags)
-
-                # Add platform target if Windows
-                if config.platform == Platform.WINDOWS:
-                    ir_cmd.extend(["--target=x86_64-w64-mingw32"])
-
-                self.logger.info("Step 1/3: Compiling to LLVM IR")
-                run_command(ir_cmd, cwd=source_abs.parent)
-
-                # Check for C++ exception handling (incompatible with ALL OLLVM passes)
-                if self._has_exception_handling(ir_file):
-                    if enabled_passes:
-                        warning_msg = (
-                            "C++ exception handling detected in IR (invoke/landingpad instructions). "
-                            "ALL OLLVM passes are incompatible with C++ exception handling and will be disabled. "
-                            "This is a known limitation of OLLVM. "
-                            "Obfuscation will continue with compiler flags, string encryption, and symbol obfuscation only."
+                # Build the passes pipeline, repeated once per obfuscation cycle
+                passes_pipeline = ",".join(list(enabled_passes) * max(1, config.advanced.cycles))
+
+                # Fused mode skips the intermediate IR files. C++ sources always take the
+                # 3-step route because the exception-handling check needs the IR.
+                # clang only accepts -mllvm -passes when the plugin registers that option
+                # itself, so a zero exit status means the plugin ran the requested pipeline.
+                if (
+                    config.advanced.fuse_pass_plugin
+                    and not context.is_cpp
+                    and str(plugin_path) not in self._unfusable_plugins
+                    and bundled_clang.exists()
+                ):
+                    fused_cmd = [
+                        str(bundled_clang),
+                        str(source_abs),
+                        f"-fpass-plugin={plugin_path}",
+                        "-mllvm", f"-passes={passes_pipeline}",
+                        "-o", str(destination_abs),
+                    ] + [f for f in compiler_flags if 'lto' not in f.lower()]
+                    fused_cmd.extend(self._get_resource_dir_flag(str(bundled_clang)))
+                    fused_cmd.extend(target_flags)
+
+                    self.logger.info("Compiling with OLLVM passes in a single clang invocation")
+                    try:
+                        run_command(fused_cmd, cwd=source_abs.parent)
+                    except ObfuscationError as e:
+                        self._unfusable_plugins.add(str(plugin_path))
+                        self.logger.warning(
+                            "Plugin %s does not support single-invocation compiles; using clang/opt/clang for it from now on: %s",
+                            plugin_path,
+                            e,
                         )
-                        self.logger.warning(warning_msg)
-                        warnings.append(warning_msg)
-                        enabled_passes = []  # Disable ALL OLLVM passes
-                        actually_applied_passes = []  # No OLLVM passes applied
-
-                # Only continue with OLLVM if we still have passes enabled
-                if not enabled_passes:
-                    # Fall back to standard compilation without OLLVM passes
-                    command = [compiler, str(source_abs), "-o", str(destination_abs)] + compiler_flags
+                    else:
+                        self.logger.info("OLLVM obfuscation complete")
+                        return {
+                            "applied_passes": actually_applied_passes,
+                            "warnings": warnings,
+                            "disabled_passes": []
+                        }
+
+                # IR only lives for this compile, so keep it off the output disk (tmpfs on Linux)
+                with tempfile.TemporaryDirectory(prefix="llvm-obf-", dir=_IR_TMP_ROOT) as ir_tmp:
+                    # Step 1: Compile source to LLVM IR
+                    # Bitcode is smaller and opt loads it without parsing text; the batched
+                    # opt path reads function names from the IR, so it keeps textual IR.
+                    textual_ir = config.advanced.opt_batches_per_thread > 0
+                    ir_file = Path(ir_tmp) / ("input.ll" if textual_ir else "input.bc")
+                    ir_cmd = [compiler, str(source_abs), "-emit-llvm", "-o", str(ir_file)]
+                    ir_cmd.append("-S" if textual_ir else "-c")
 
                     # Add resource-dir flag if using custom clang
                     resource_dir_flags = self._get_resource_dir_flag(compiler)
                     if resource_dir_flags:
-                        command.extend(resource_dir_flags)
-
-                    if config.platform == Platform.WINDOWS:
-                        command.extend(["--target=x86_64-w64-mingw32"])
-
-                    # Clean up the IR file we don't need anymore
-                    if ir_file.exists():
-                        ir_file.unlink()
-
-                    run_command(command, cwd=source_abs.parent)
-                    return {
-                        "applied_passes": actually_applied_passes,
-                        "warnings": warnings,
-                        "disabled_passes": [p for p in enabled_passes if p not in actually_applied_passes]
-                    }
-
-                # Step 2: Apply OLLVM passes using opt
-                obfuscated_ir = destination_abs.parent / f"{destination_abs.stem}_obfuscated.bc"
-
-                if bundled_opt.exists():
-                    self.logger.info("Using bundled opt: %s", bundled_opt)
-                    opt_binary = bundled_opt
-
-                    # Also use bundled clang if available (ensures LLVM 22 compatibility)
-                    if bundled_clang.exists():
-                        self.logger.info("Using bundled clang from LLVM 22: %s", bundled_clang)
-                        compiler = str(bundled_clang)
-                    else:
-                        self.logger.warning("Bundled clang not found, using system clang (may have version mismatch)")
-                # SECOND: Check Docker installation path (production deployment)
-                elif Path("/usr/local/llvm-obfuscator/bin/opt").exists():
-                    opt_binary = Path("/usr/local/llvm-obfuscator/bin/opt")
-                    self.logger.info("Using opt from Docker installation: %s", opt_binary)
-
-                    # IMPORTANT: Use ABSOLUTE PATH to system clang
-                    # Docker clang doesn't have LLVMgold.so needed for LTO linking
-                    # We use Docker opt for OLLVM passes, but system clang for final compilation
-                    # Must use /usr/bin/clang explicitly because /usr/local/llvm-obfuscator/bin is first in PATH
-                    compiler = "/usr/bin/clang++" if base_compiler == "clang++" else "/usr/bin/clang"
-                    self.logger.info("Using Docker opt for OLLVM passes, system clang (%s) for final compilation", compiler)
-                # THIRD: Check if plugin is from LLVM build directory
-                elif "/llvm-project/build/lib/" in str(plugin_path_resolved):
-                    # Plugin is from LLVM build, try to find opt and clang in same build
-                    llvm_build_dir = plugin_path_resolved.parent.parent  # Go up from lib/ to build/
-                    opt_binary = llvm_build_dir / "bin" / "opt"
-                    llvm_clang = llvm_build_dir / "bin" / "clang"
-
-                    if opt_binary.exists():
-                        self.logger.info("Using opt from LLVM build: %s", opt_binary)
-
-                        # Also use clang from same build if available
-                        if llvm_clang.exists():
-                            self.logger.info("Using clang from LLVM build: %s", llvm_clang)
-                            compiler = str(llvm_clang)
+                        ir_cmd.extend(resource_dir_flags)
+
+                    ir_cmd.extend(target_flags)
+
+                    self.logger.info("Step 1/3: Compiling to LLVM IR")
+                    run_command(ir_cmd, cwd=source_abs.parent)
+
+                    # Check for C++ exception handling (incompatible with ALL OLLVM passes)
+                    if self._has_exception_handling(ir_file):
+                        if enabled_passes:
+                            warning_msg = (
+                                "C++ exception handling detected in IR (invoke/landingpad instructions). "
+                                "ALL OLLVM passes are incompatible with C++ exception handling and will be disabled. "
+                                "This is a known limitation of OLLVM. "
+                                "Obfuscation will continue with compiler flags, string encryption, and symbol obfuscation only."
+                            )
+                            self.logger.warning(warning_msg)
+                            warnings.append(warning_msg)
+                            enabled_passes = []  # Disable ALL OLLVM passes
+                            actually_applied_passes = []  # No OLLVM passes applied
+
+                    # Only continue with OLLVM if we still have passes enabled
+                    if not enabled_passes:
+                        # Fall back to standard compilation without OLLVM passes
+                        command = [compiler, str(source_abs), "-o", str(destination_abs)] + compiler_flags
+
+                        # Add resource-dir flag if using custom clang
+                        resource_dir_flags = self._get_resource_dir_flag(compiler)
+                        if resource_dir_flags:
+                            command.extend(resource_dir_flags)
+
+                        command.extend(target_flags)
+
+                        run_command(command, cwd=source_abs.parent)
+                        return {
+                            "applied_passes": actually_applied_passes,
+                            "warnings": warnings,
+                            "disabled_passes": [p for p in enabled_passes if p not in actually_applied_passes]
+                        }
+
+                    # Step 2: Apply OLLVM passes using opt
+                    obfuscated_ir = Path(ir_tmp) / "obfuscated.bc"
+
+                    if bundled_opt.exists():
+                        self.logger.info("Using bundled opt: %s", bundled_opt)
+                        opt_binary = bundled_opt
+
+                        # Also use bundled clang if available (ensures LLVM 22 compatibility)
+                        if bundled_clang.exists():
+                            self.logger.info("Using bundled clang from LLVM 22: %s", bundled_clang)
+                            compiler = str(bundled_clang)
+                        else:
+                            self.logger.warning("Bundled clang not found, using system clang (may have version mismatch)")
+                    # SECOND: Check Docker installation path (production deployment)
+                    elif Path("/usr/local/llvm-obfuscator/bin/opt").exists():
+                        opt_binary = Path("/usr/local/llvm-obfuscator/bin/opt")
+                        self.logger.info("Using opt from Docker installation: %s", opt_binary)
+
+                        # IMPORTANT: Use ABSOLUTE PATH to system clang
+                        # Docker clang doesn't have LLVMgold.so needed for LTO linking
+                        # We use Docker opt for OLLVM passes, but system clang for final compilation
+                        # Must use /usr/bin/clang explicitly because /usr/local/llvm-obfuscator/bin is first in PATH
+                        compiler = "/usr/bin/clang++" if base_compiler == "clang++" else "/usr/bin/clang"
+                        self.logger.info("Using Docker opt for OLLVM passes, system clang (%s) for final compilation", compiler)
+                    # THIRD: Check if plugin is from LLVM build directory
+                    elif "/llvm-project/build/lib/" in str(plugin_path_resolved):
+                        # Plugin is from LLVM build, try to find opt and clang in same build
+                        llvm_build_dir = plugin_path_resolved.parent.parent  # Go up from lib/ to build/
+                        opt_binary = llvm_build_dir / "bin" / "opt"
+                        llvm_clang = llvm_build_dir / "bin" / "clang"
+
+                        if opt_binary.exists():
+                            self.logger.info("Using opt from LLVM build: %s", opt_binary)
+
+                            # Also use clang from same build if available
+                            if llvm_clang.exists():
+                                self.logger.info("Using clang from LLVM build: %s", llvm_clang)
+                                compiler = str(llvm_clang)
+                        else:
+                            self.logger.error(
+                                "OLLVM passes require custom opt binary.\n"
+                                "The plugin is from LLVM build but opt not found.\n"
+                                f"Expected at: {opt_binary}"
+                            )
+                            raise ObfuscationError("Custom opt binary not found")
+                    # FOURTH: Try known system locations (will fail - stock LLVM doesn't have our passes)
                     else:
-                        self.logger.error(
-                            "OLLVM passes require custom opt binary.\n"
-                            "The plugin is from LLVM build but opt not found.\n"
-                            f"Expected at: {opt_binary}"
+                        self.logger.warning(
+                            "Using bundled plugin without bundled opt.\n"
+                            "Note: Stock LLVM 'opt' does NOT include OLLVM passes.\n"
+                            "This will likely fail. Please bundle opt with plugin."
                         )
-                        raise ObfuscationError("Custom opt binary not found")
-                # FOURTH: Try known system locations (will fail - stock LLVM doesn't have our passes)
-                else:
-                    self.logger.warning(
-                        "Using bundled plugin without bundled opt.\n"
-                        "Note: Stock LLVM 'opt' does NOT include OLLVM passes.\n"
-                        "This will likely fail. Please bundle opt with plugin."
-                    )
-                    # Try to find opt in known locations
-                    opt_paths = [
-                        Path("/Users/akashsingh/Desktop/llvm-project/build/bin/opt"),
-                        Path("/usr/local/bin/opt"),
-                        Path("/opt/homebrew/bin/opt"),
+                        opt_binary = self._find_fallback_opt()
+
+                        if not opt_binary:
+                            self.logger.error(
+                                "No opt binary found and plugin needs compatible opt.\n"
+                                "Stock system LLVM does NOT include OLLVM passes.\n"
+                                "Please ensure bundled opt is in plugins/<platform>/ directory."
+                            )
+                            raise ObfuscationError("Compatible opt binary not found")
+
+                    opt_cmd = [
+                        str(opt_binary),
+                        "-load-pass-plugin=" + str(plugin_path),
+                        f"-passes={passes_pipeline}",
                     ]
 
-                    opt_binary = None
-                    for opt_path in opt_paths:
-                        if opt_path.exists():
-                            opt_binary = opt_path
-                            self.logger.warning("Trying opt at: %s (may not have OLLVM passes)", opt_binary)
-                            break
-
-                    if not opt_binary:
-                        self.logger.error(
-                            "No opt binary found and plugin needs compatible opt.\n"
-                            "Stock system LLVM does NOT include OLLVM passes.\n"
-                            "Please ensure bundled opt is in plugins/<platform>/ directory."
+                    self.logger.info("Step 2/3: Applying OLLVM passes via opt")
+                    # Step 1 does not see compiler_flags, so flag-only changes reuse the obfuscated IR.
+                    ir_key = None
+                    if self.artifact_cache is not None:
+                        ir_key = cache_key(
+                            ir_file.read_bytes(),
+                            passes_pipeline,
+                            file_fingerprint(plugin_path_resolved),
+                            file_fingerprint(Path(opt_binary)),
+                            str(config.advanced.opt_batches_per_thread),
                         )
-                        raise ObfuscationError("Compatible opt binary not found")
-
-                # Build the passes pipeline
-                passes_pipeline = ",".join(enabled_passes)
-                opt_cmd = [
-                    str(opt_binary),
-                    "-load-pass-plugin=" + str(plugin_path),
-                    f"-passes={passes_pipeline}",
-                    str(ir_file),
-                    "-o", str(obfuscated_ir)
-                ]
-
-                self.logger.info("Step 2/3: Applying OLLVM passes via opt")
-                run_command(opt_cmd, cwd=source_abs.parent)
-
-                # Step 3: Compile obfuscated IR to binary
-                # If using bundled clang, strip LTO flags (bundled clang doesn't have LLVMgold.so)
-                final_flags = compiler_flags
-                if str(compiler) == str(bundled_clang):
-                    # Remove all LTO-related flags
-                    final_flags = [f for f in compiler_flags if 'lto' not in f.lower()]
-                    if len(final_flags) != len(compiler_flags):
-                        self.logger.info("Removed LTO flags (incompatible with bundled clang)")
-
-                final_cmd = [compiler, str(obfuscated_ir), "-o", str(destination_abs)] + final_flags
-
-                if config.platform == Platform.WINDOWS:
-                    final_cmd.extend(["--target=x86_64-w64-mingw32"])
-
-                self.logger.info("Step 3/3: Compiling obfuscated IR to binary")
-                run_command(final_cmd, cwd=source_abs.parent)
-
-                # Cleanup temporary files
-                if ir_file.exists():
-                    ir_file.unlink()
-                if obfuscated_ir.exists():
-                    obfuscated_ir.unlink()
-
-                self.logger.info("OLLVM obfuscation complete")
-                return {
-                    "applied_passes": actually_applied_passes,
-                    "warnings": warnings,
-                    "disabled_passes": []
-                }
+                    if ir_key is not None and self.artifact_cache.fetch(ir_key, obfuscated_ir) is not None:
+                        self.logger.info("Reusing cached obfuscated IR (%s)", ir_key[:12])
+                    else:
+                        batched = False
+                        if config.advanced.opt_batches_per_thread > 0:
+                            try:
+                                batched = self._run_opt_batched(
+                                    opt_cmd,
+                                    Path(opt_binary),
+                                    ir_file,
+                                    obfuscated_ir,
+                                    config.advanced.opt_batches_per_thread,
+                                    cwd=source_abs.parent,
+                                )
+                            except ObfuscationError as e:
+                                self.logger.warning(f"Batched opt run failed, retrying on the whole module: {e}")
+                        if not batched:
+                            run_command(opt_cmd + [str(ir_file), "-o", str(obfuscated_ir)], cwd=source_abs.parent)
+                        if ir_key is not None:
+                            self.artifact_cache.store(ir_key, obfuscated_ir, {})
+
+                    # Step 3: Compile obfuscated IR to binary
+                    # If using bundled clang, strip LTO flags (bundled clang doesn't have LLVMgold.so)
+                    final_flags = compiler_flags
+                    if str(compiler) == str(bundled_clang):
+                        # Remove all LTO-related flags
+                        final_flags = [f for f in compiler_flags if 'lto' not in f.lower()]
+                        if len(final_flags) != len(compiler_flags):
+                            self.logger.info("Removed LTO flags (incompatible with bundled clang)")
+
+                    final_cmd = [compiler, str(obfuscated_ir), "-o", str(destination_abs)] + final_flags
+
+                    final_cmd.extend(target_flags)
+
+                    self.logger.info("Step 3/3: Compiling obfuscated IR to binary")
+                    run_command(final_cmd, cwd=source_abs.parent)
+
+                    self.logger.info("OLLVM obfuscation complete")
+                    return {
+                        "applied_passes": actually_applied_passes,
+                        "warnings": warnings,
+                        "disabled_passes": []
+                    }
 
         elif enabled_passes:
             # Log warning but continue without passes
@@ -722,8 +964,7 @@ class LLVMObfuscator:
             if resource_dir_flags:
                 command.extend(resource_dir_flags)
 
-            if config.platform == Platform.WINDOWS:
-                command.extend(["--target=x86_64-w64-mingw32"])
+            command.extend(target_flags)
             run_command(command, cwd=source_abs.parent)
             return {
                 "applied_passes": actually_applied_passes,
@@ -739,8 +980,7 @@ class LLVMObfuscator:
             if resource_dir_flags:
                 command.extend(resource_dir_flags)
 
-            if config.platform == Platform.WINDOWS:
-                command.extend(["--target=x86_64-w64-mingw32"])
+            command.extend(target_flags)
             run_command(command, cwd=source_abs.parent)
             return {
                 "applied_passes": actually_applied_passes,
@@ -748,6 +988,150 @@ class LLVMObfuscator:
                 "disabled_passes": []
             }
 
+    def _run_opt_batched(
+        self,
+        opt_cmd: List[str],
+        opt_binary: Path,
+        ir_file: Path,
+        obfuscated_ir: Path,
+        batches_per_thread: int,
+        cwd: Path,
+    ) -> bool:
+        """
+        Run the OLLVM passes on function batches in parallel.
+
+        The module is split with llvm-extract into roughly
+        cpu_count * batches_per_thread batches, each batch is run through opt
+        on its own thread and the results are merged back with llvm-link.
+        The first batch also carries every global variable definition.
+
+        Returns False (without running anything) when the module is too small
+        to split or llvm-extract/llvm-link are not available.
+        """
+        extract_tool = self._find_llvm_tool("llvm-extract", opt_binary.parent)
+        link_tool = self._find_llvm_tool("llvm-link", opt_binary.parent)
+        if not extract_tool or not link_tool:
+            self.logger.debug("llvm-extract/llvm-link not found, running opt on the whole module")
+            return False
+
+        functions = _ir_defined_functions(ir_file)
+        workers = os.cpu_count() or 1
+        batch_size = max(1, math.ceil(len(functions) / (workers * batches_per_thread)))
+        batches = [functions[i:i + batch_size] for i in range(0, len(functions), batch_size)]
+        if len(batches) < 2:
+            return False
+
+        parts = []
+        commands = []
+        for index, batch in enumerate(batches):
+            extracted = obfuscated_ir.with_name(f"{obfuscated_ir.stem}_part{index}.bc")
+            transformed = obfuscated_ir.with_name(f"{obfuscated_ir.stem}_part{index}_opt.bc")
+            extract_cmd = [extract_tool, str(ir_file), "-o", str(extracted)]
+            if index == 0:
+                extract_cmd.append("--rglob=.*")
+            extract_cmd.extend(f"--func={name}" for name in batch)
+            parts.append((extracted, transformed))
+            commands.append((extract_cmd, opt_cmd + [str(extracted), "-o", str(transformed)]))
+
+        def run_batch(batch_commands) -> None:
+            extract_cmd, batch_opt_cmd = batch_commands
+            run_command(extract_cmd, cwd=cwd)
+            run_command(batch_opt_cmd, cwd=cwd)
+
+        self.logger.info(
+            "Running opt on %d function batches across %d threads", len(batches), min(workers, len(batches))
+        )
+        try:
+            with ThreadPoolExecutor(max_workers=min(workers, len(batches))) as executor:
+                list(executor.map(run_batch, commands))
+            run_command(
+                [link_tool] + [str(transformed) for _, transformed in parts] + ["-o", str(obfuscated_ir)],
+                cwd=cwd,
+            )
+        finally:
+            for extracted, transformed in parts:
+                extracted.unlink(missing_ok=True)
+                transformed.unlink(missing_ok=True)
+        return True
+
+    def _find_fallback_opt(self) -> Optional[Path]:
+        """
+        Locate an opt binary when none is bundled with the plugin.
+
+        Checks LLVM_OBFUSCATOR_OPT, then PATH, then common install locations.
+        The first hit is remembered for the lifetime of this obfuscator.
+        """
+        if self._opt_binary is not None:
+            return self._opt_binary
+
+        env_opt = os.getenv("LLVM_OBFUSCATOR_OPT")
+        candidates = [Path(env_opt)] if env_opt else []
+        which_opt = shutil.which("opt")
+        if which_opt:
+            candidates.append(Path(which_opt))
+        candidates.extend(_FALLBACK_OPT_PATHS)
+
+        for opt_path in candidates:
+            if opt_path.exists():
+                self.logger.warning("Trying opt at: %s (may not have OLLVM passes)", opt_path)
+                self._opt_binary = opt_path
+                return opt_path
+        return None
+
+    @staticmethod
+    def _find_llvm_tool(name: str, tool_dir: Path) -> Optional[str]:
+        """Prefer the LLVM tool shipped next to opt, then fall back to PATH."""
+        candidate = tool_dir / name
+        if candidate.exists():
+            return str(candidate)
+        return shutil.which(name)
+
+    def _binary_metrics(self, binary: Path, include_listings: bool = True) -> Dict:
+        """
+        Format, size, SHA-256, entropy and (optionally) section/symbol counts of a binary.
+
+        The fingerprint is one streaming read; its digest keys the section/symbol
+        listings, so objdump and nm (run concurrently) only see binaries whose
+        contents have not been listed before.
+        """
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            format_future = executor.submit(detect_binary_format, binary)
+            file_size, digest, histogram = fingerprint_file(binary)
+            listings = None
+            if include_listings:
+                listings = self._recall_listings(digest)
+                if listings is None:
+                    sections_future = executor.submit(list_sections, binary)
+                    symbols_future = executor.submit(summarize_symbols, binary)
+                    listings = (sections_future.result(), *symbols_future.result())
+                    self._remember_listings(digest, listings)
+            sections, symbols_count, functions_count = listings or ({}, 0, 0)
+            return {
+                "file_size": file_size,
+                "binary_format": format_future.result(),
+                "sections": dict(sections),
+                "symbols_count": symbols_count,
+                "functions_count": functions_count,
+                "entropy": entropy_from_histogram(histogram, file_size),
+                "sha256": digest,
+            }
+
+    def _recall_listings(self, digest: str) -> Optional[Tuple[Dict[str, int], int, int]]:
+        with self._listings_lock:
+            hit = self._listings.get(digest)
+            if hit is not None:
+                self._listings.move_to_end(digest)
+            return hit
+
+    def _remember_listings(self, digest: str, listings: Tuple[Dict[str, int], int, int]) -> None:
+        if not digest:  # missing binary
+            return
+        with self._listings_lock:
+            self._listings[digest] = listings
+            self._listings.move_to_end(digest)
+            while len(self._listings) > self.LISTINGS_CACHE_SIZE:
+                self._listings.popitem(last=False)
+
     def _compile_and_analyze_baseline(self, source_file: Path, baseline_binary: Path, config: ObfuscationConfig) -> Dict:
         """Compile an unobfuscated baseline binary and analyze its metrics for comparison."""
         # Default values in case baseline compilation fails
@@ -786,20 +1170,9 @@ class LLVMObfuscator:
 
             # Analyze baseline binary
             if baseline_binary.exists():
-                file_size = get_file_size(baseline_binary)
-                binary_format = detect_binary_format(baseline_binary)
-                sections = list_sections(baseline_binary)
-                symbols_count, functions_count = summarize_symbols(baseline_binary)
-                entropy = compute_entropy(baseline_binary.read_bytes())
-
-                return {
-                    "file_size": file_size,
-                    "binary_format": binary_format,
-                    "sections": sections,
-                    "symbols_count": symbols_count,
-                    "functions_count": functions_count,
-                    "entropy": entropy,
-                }
+                metrics = self._binary_metrics(baseline_binary)
+                del metrics["sha256"]
+                return metrics
             else:
                 self.logger.warning("Baseline binary not created, using default metrics")
                 return default_metrics
@@ -811,23 +1184,24 @@ class LLVMObfuscator:
         self,
         source_file: Path,
         output_binary: Path,
-        passes: List[str],
+        passes: Sequence[str],
         cycles: int,
         string_result: Optional[StringEncryptionResult],
         fake_loops,
         entropy: float,
-    ) -> Dict:
-        baseline_score = 50 + 5 * len(passes) + 3 * cycles
+    ) -> EstimatedMetrics:
+        pass_count = len(passes)
+        baseline_score = 50 + 5 * pass_count + 3 * cycles
         score = min(95.0, baseline_score + (string_result.encryption_percentage if string_result else 0) * 0.2)
-        symbol_reduction = round(min(90.0, 20 + 10 * len(passes)), 2)
-        function_reduction = round(min(70.0, 10 + 5 * len(passes)), 2)
-        size_reduction = round(max(-30.0, 10 - 5 * len(passes)), 2)
+        symbol_reduction = round(min(90.0, 20 + 10 * pass_count), 2)
+        function_reduction = round(min(70.0, 10 + 5 * pass_count), 2)
+        size_reduction = round(max(-30.0, 10 - 5 * pass_count), 2)
         entropy_increase = round(entropy * 0.1, 2)
         bogus_code_info = {
-            "dead_code_blocks": len(passes) * 3,
-            "opaque_predicates": len(passes) * 2,
-            "junk_instructions": len(passes) * 5,
-            "code_bloat_percentage": round(5 + len(passes) * 1.5, 2),
+            "dead_code_blocks": pass_count * 3,
+            "opaque_predicates": pass_count * 2,
+            "junk_instructions": pass_count * 5,
+            "code_bloat_percentage": round(5 + pass_count * 1.5, 2),
         }
         string_obfuscation = {
             "total_strings": string_result.total_strings if string_result else 0,
@@ -852,15 +1226,15 @@ class LLVMObfuscator:
             ],
         }
         estimated_effort = "6-10 weeks" if score >= 80 else "4-6 weeks"
-        return {
-            "bogus_code_info": bogus_code_info,
-            "string_obfuscation": string_obfuscation,
-            "fake_loops_inserted": fake_loops_inserted,
-            "cycles_completed": cycles_completed,
-            "obfuscation_score": round(score, 2),
-            "symbol_reduction": symbol_reduction,
-            "function_reduction": function_reduction,
-            "size_reduction": size_reduction,
-            "entropy_increase": entropy_increase,
-            "estimated_re_effort": estimated_effort,
-        }
+        return EstimatedMetrics(
+            bogus_code_info=bogus_code_info,
+            string_obfuscation=string_obfuscation,
+            fake_loops_inserted=fake_loops_inserted,
+            cycles_completed=cycles_completed,
+            obfuscation_score=round(score, 2),
+            symbol_reduction=symbol_reduction,
+            function_reduction=function_reduction,
+            size_reduction=size_reduction,
+            entropy_increase=entropy_increase,
+            estimated_re_effort=estimated_effort,
+        )
@@ -1,324 +1,190 @@
 from __future__ import annotations
 
-from datetime import datetime
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, List
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
-from .exceptions import ReportGenerationError
-from .utils import ensure_directory, get_timestamp, write_html, write_json
-
-
-class ObfuscationReport:
-    """Generate comprehensive obfuscation report per SIH requirements."""
-
-    def __init__(self, output_dir: Path) -> None:
-        self.output_dir = output_dir
-
-    def generate_report(self, job_data: Dict[str, Any]) -> Dict[str, Any]:
-        try:
-            report = {
-                "input_parameters": {
-                    "source_file": job_data.get("source_file"),
-                    "platform": job_data.get("platform"),
-                    "obfuscation_level": job_data.get("obfuscation_level"),
-                    "requested_passes": job_data.get("requested_passes", []),  # What user requested
-                    "applied_passes": job_data.get("applied_passes", []),  # What was actually applied
-                    "compiler_flags": job_data.get("compiler_flags", []),
-                    "timestamp": job_data.get("timestamp", get_timestamp()),
-                },
-                "warnings": job_data.get("warnings", []),  # Warnings from obfuscation process
-                "baseline_metrics": job_data.get("baseline_metrics", {}),  # Before obfuscation metrics
-                "output_attributes": job_data.get("output_attributes", {}),
-                "comparison": job_data.get("comparison", {}),  # Before/after comparison
-                "bogus_code_info": job_data.get("bogus_code_info", {}),
-                "cycles_completed": job_data.get("cycles_completed", {}),
-                "string_obfuscation": job_data.get("string_obfuscation", {}),
-                "fake_loops_inserted": job_data.get("fake_loops_inserted", {}),
-                "symbol_obfuscation": job_data.get("symbol_obfuscation", {}),
-                "obfuscation_score": job_data.get("obfuscation_score", 0.0),
-                "symbol_reduction": job_data.get("symbol_reduction", 0.0),
-                "function_reduction": job_data.get("function_reduction", 0.0),
-                "size_reduction": job_data.get("size_reduction", 0.0),
-                "entropy_increase": job_data.get("entropy_increase", 0.0),
-                "estimated_re_effort": job_data.get("estimated_re_effort", "4-6 weeks"),
-            }
-        except Exception as exc:  # pragma: no cover - defensive
-            raise ReportGenerationError("Failed to assemble report") from exc
-        return report
+import jinja2
+from markupsafe import Markup, escape
 
-    def export(self, report: Dict[str, Any], job_id: str, formats: List[str]) -> Dict[str, Path]:
-        outputs: Dict[str, Path] = {}
-        for fmt in formats:
-            fmt_lower = fmt.lower()
-            if fmt_lower == "json":
-                path = self.output_dir / f"{job_id}.json"
-                write_json(path, report)
-                outputs["json"] = path
-            elif fmt_lower == "html":
-                path = self.output_dir / f"{job_id}.html"
-                html = self._render_html(report, job_id)
-                write_html(path, html)
-                outputs["html"] = path
-            elif fmt_lower in ["pdf", "markdown"]:
-                path = self.output_dir / f"{job_id}.{fmt_lower}"
-                if fmt_lower == "pdf":
-                    self._write_pdf(path, report, job_id)
-                else:
-                    markdown = self._render_markdown(report, job_id)
-                    path.write_text(markdown, encoding="utf-8")
-                outputs[fmt_lower] = path
-        return outputs
-
-    def _render_html(self, report: Dict[str, Any], job_id: str) -> str:
-        """Render a clean, simple HTML report matching existing website style."""
-        timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
-
-        # Extract data for easier access
-        input_params = report.get("input_parameters", {})
-        warnings = report.get("warnings", [])
-        baseline_metrics = report.get("baseline_metrics", {})
-        output_attrs = report.get("output_attributes", {})
-        comparison = report.get("comparison", {})
-        bogus_code = report.get("bogus_code_info", {})
-        cycles = report.get("cycles_completed", {})
-        string_obf = report.get("string_obfuscation", {})
-        fake_loops = report.get("fake_loops_inserted", {})
-        symbol_obf = report.get("symbol_obfuscation", {})
-
-        # Format warnings list
-        warnings_html = ""
-        if warnings:
-            for i, warning in enumerate(warnings, 1):
-                warnings_html += f'<tr><td>{i}</td><td>{warning}</td></tr>'
-        else:
-            warnings_html = '<tr><td colspan="2">No warnings - all obfuscation techniques applied successfully</td></tr>'
-
-        # Format file size
-        file_size = output_attrs.get("file_size", 0)
-        file_size_kb = file_size / 1024 if file_size > 0 else 0
-
-        # Format obfuscation methods
-        methods = output_attrs.get("obfuscation_methods", [])
-        methods_list = ", ".join(methods) if methods else "None"
-
-        # Format compiler flags
-        flags = input_params.get("compiler_flags", [])
-        flags_list = " ".join(flags) if flags else "None"
-
-        # Format sections
-        sections = output_attrs.get("sections", {})
-        sections_html = ""
-        if sections:
-            for name, size in sections.items():
-                sections_html += f'<tr><td>{name}</td><td>{size} bytes</td></tr>'
-        else:
-            sections_html = '<tr><td colspan="2">No section information available</td></tr>'
-
-        # Cycles information
-        total_cycles = cycles.get("total_cycles", 1)
-        per_cycle_metrics = cycles.get("per_cycle_metrics", [])
-        cycles_html = ""
-        for cycle_info in per_cycle_metrics:
-            cycle_num = cycle_info.get("cycle", 0)
-            passes = cycle_info.get("passes_applied", [])
-            duration = cycle_info.get("duration_ms", 0)
-            passes_str = ", ".join(passes) if passes else "None"
-            cycles_html += f'<tr><td>Cycle {cycle_num}</td><td>{passes_str}</td><td>{duration} ms</td></tr>'
-
-        # String obfuscation details
-        total_strings = string_obf.get("total_strings", 0)
-        encrypted_strings = string_obf.get("encrypted_strings", 0)
-        encryption_pct = string_obf.get("encryption_percentage", 0.0)
-        encryption_method = string_obf.get("encryption_method", "none")
-
-        # Fake loops details
-        fake_loop_count = fake_loops.get("count", 0)
-        fake_loop_types = fake_loops.get("types", [])
-        fake_loops_html = ""
-        if fake_loop_count > 0:
-            for i, loop_type in enumerate(fake_loop_types, 1):
-                location = fake_loops.get("locations", [])[i-1] if i <= len(fake_loops.get("locations", [])) else "Unknown"
-                fake_loops_html += f'<tr><td>Loop {i}</td><td>{loop_type}</td><td>{location}</td></tr>'
-        else:
-            fake_loops_html = '<tr><td colspan="3">No fake loops inserted</td></tr>'
+from .exceptions import ReportGenerationError
+from .utils import ensure_directory, get_timestamp, json_dumps_bytes
 
-        # Symbol obfuscation details
-        symbol_enabled = symbol_obf.get("enabled", False)
-        symbols_obfuscated = symbol_obf.get("symbols_obfuscated", 0)
-        symbol_algorithm = symbol_obf.get("algorithm", "N/A")
 
-        html = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset='utf-8'>
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>LLVM Obfuscation Report - {job_id}</title>
-    <style>
-        * {{
+# Report stylesheet; a plain string (no f-string brace escaping) shared by every HTML export.
+_STATIC_CSS = """        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: Arial, sans-serif;
             line-height: 1.6;
             padding: 20px;
             max-width: 1200px;
             margin: 0 auto;
-        }}
+        }
 
-        h1 {{
+        h1 {
             font-size: 24px;
             margin-bottom: 10px;
             padding-bottom: 10px;
             border-bottom: 2px solid #000;
-        }}
+        }
 
-        h2 {{
+        h2 {
             font-size: 18px;
             margin-top: 30px;
             margin-bottom: 15px;
             padding-bottom: 5px;
             border-bottom: 1px solid #000;
-        }}
+        }
 
-        h3 {{
+        h3 {
             font-size: 16px;
             margin-top: 20px;
             margin-bottom: 10px;
-        }}
+        }
 
-        .header-info {{
+        .header-info {
             margin-bottom: 30px;
-        }}
+        }
 
-        .field {{
+        .field {
             margin: 10px 0;
             display: grid;
             grid-template-columns: 250px 1fr;
             gap: 15px;
-        }}
+        }
 
-        .field-label {{
+        .field-label {
             font-weight: bold;
-        }}
+        }
 
-        .field-value {{
+        .field-value {
             word-wrap: break-word;
-        }}
+        }
 
-        table {{
+        table {
             width: 100%;
             border-collapse: collapse;
             margin: 15px 0;
-        }}
+        }
 
-        th, td {{
+        th, td {
             border: 1px solid #000;
             padding: 10px;
             text-align: left;
-        }}
+        }
 
-        th {{
+        th {
             font-weight: bold;
             background: #f0f0f0;
-        }}
+        }
 
-        code {{
+        code {
             background: #f5f5f5;
             padding: 2px 5px;
             font-family: monospace;
-        }}
+        }
 
-        .summary-grid {{
+        .summary-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
             gap: 20px;
             margin: 20px 0;
-        }}
+        }
 
-        .summary-card {{
+        .summary-card {
             border: 1px solid #000;
             padding: 15px;
-        }}
+        }
 
-        .summary-label {{
+        .summary-label {
             font-size: 14px;
             margin-bottom: 5px;
-        }}
+        }
 
-        .summary-value {{
+        .summary-value {
             font-size: 24px;
             font-weight: bold;
-        }}
+        }
 
-        .footer {{
+        .footer {
             margin-top: 50px;
             padding-top: 20px;
             border-top: 1px solid #000;
             text-align: center;
             font-size: 14px;
-        }}
+        }
 
-        .comparison-grid {{
+        .comparison-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
             gap: 20px;
             margin: 20px 0;
-        }}
+        }
 
-        .comparison-item {{
+        .comparison-item {
             border: 1px solid #ddd;
             padding: 15px;
             border-radius: 4px;
-        }}
+        }
 
-        .comparison-item h3 {{
+        .comparison-item h3 {
             margin: 0 0 10px 0;
             font-size: 16px;
-        }}
+        }
 
-        .metric-row {{
+        .metric-row {
             display: flex;
             justify-content: space-between;
             margin: 8px 0;
             font-size: 14px;
-        }}
+        }
 
-        .metric-label {{
+        .metric-label {
             font-weight: 500;
-        }}
+        }
 
-        .metric-value {{
+        .metric-value {
             font-family: monospace;
-        }}
+        }
 
-        .change-indicator {{
+        .change-indicator {
             margin-top: 8px;
             padding: 8px;
             border-radius: 4px;
             text-align: center;
             font-weight: bold;
-        }}
+        }
 
-        .change-positive {{
+        .change-positive {
             background-color: #d4edda;
             color: #155724;
-        }}
+        }
 
-        .change-negative {{
+        .change-negative {
             background-color: #f8d7da;
             color: #721c24;
-        }}
+        }
 
-        .change-neutral {{
+        .change-neutral {
             background-color: #e2e3e5;
             color: #383d41;
-        }}
+        }
 
-        .progress-bar {{
+        .progress-bar {
             width: 100%;
             height: 20px;
             background: #f0f0f0;
@@ -326,9 +192,9 @@ class ObfuscationReport:
             border-radius: 4px;
             overflow: hidden;
             margin-top: 5px;
-        }}
+        }
 
-        .progress-fill {{
+        .progress-fill {
             height: 100%;
             background: linear-gradient(90deg, #4CAF50, #45a049);
             display: flex;
@@ -337,13 +203,40 @@ class ObfuscationReport:
             color: white;
             font-size: 12px;
             font-weight: bold;
-        }}
+        }
 
-        @media print {{
-            body {{
+        @media print {
+            body {
                 padding: 10px;
-            }}
-        }}
+            }
+        }"""
+
+def _minify_css(css: str) -> str:
+    """Collapse whitespace and drop the spaces around CSS punctuation."""
+    css = re.sub(r"\s+", " ", css).strip()
+    return re.sub(r"\s*([{}:;,])\s*", r"\1", css).replace(";}", "}")
+
+
+# Set to embed the single-line stylesheet (about half the bytes) in HTML reports.
+MINIFY_HTML_ENV = "LLVM_OBFUSCATOR_MINIFY_HTML"
+_STATIC_CSS_MIN = _minify_css(_STATIC_CSS)
+
+def _bytecode_cache() -> Optional[jinja2.BytecodeCache]:
+    # Lets worker processes load the compiled template instead of recompiling it.
+    try:
+        return jinja2.FileSystemBytecodeCache()
+    except (OSError, RuntimeError):  # no writable temp directory
+        return None
+
+
+_TEMPLATE_SRC = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset='utf-8'>
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>LLVM Obfuscation Report - {{ job_id_html }}</title>
+    <style>
+{{ static_css }}
     </style>
 </head>
 <body>
@@ -351,11 +244,11 @@ class ObfuscationReport:
         <h1>LLVM Obfuscation Report</h1>
         <div class="field">
             <div class="field-label">Job ID:</div>
-            <div class="field-value"><code>{job_id}</code></div>
+            <div class="field-value"><code>{{ job_id_html }}</code></div>
         </div>
         <div class="field">
             <div class="field-label">Generated:</div>
-            <div class="field-value">{timestamp}</div>
+            <div class="field-value">{{ timestamp }}</div>
         </div>
     </div>
 
@@ -364,19 +257,19 @@ class ObfuscationReport:
     <div class="summary-grid">
         <div class="summary-card">
             <div class="summary-label">Obfuscation Score</div>
-            <div class="summary-value">{report.get('obfuscation_score', 0)}/100</div>
+            <div class="summary-value">{{ report.obfuscation_score }}/100</div>
         </div>
         <div class="summary-card">
             <div class="summary-label">Symbol Reduction</div>
-            <div class="summary-value">{report.get('symbol_reduction', 0)}%</div>
+            <div class="summary-value">{{ report.symbol_reduction }}%</div>
         </div>
         <div class="summary-card">
             <div class="summary-label">Function Reduction</div>
-            <div class="summary-value">{report.get('function_reduction', 0)}%</div>
+            <div class="summary-value">{{ report.function_reduction }}%</div>
         </div>
         <div class="summary-card">
             <div class="summary-label">RE Effort Estimate</div>
-            <div class="summary-value">{report.get('estimated_re_effort', 'N/A')}</div>
+            <div class="summary-value">{{ report.estimated_re_effort }}</div>
         </div>
     </div>
 
@@ -384,31 +277,31 @@ class ObfuscationReport:
     <h2>Input Parameters</h2>
     <div class="field">
         <div class="field-label">Source File:</div>
-        <div class="field-value"><code>{input_params.get('source_file', 'N/A')}</code></div>
+        <div class="field-value"><code>{{ source_file_html }}</code></div>
     </div>
     <div class="field">
         <div class="field-label">Platform:</div>
-        <div class="field-value">{input_params.get('platform', 'unknown')}</div>
+        <div class="field-value">{{ input_params.get("platform", "unknown") }}</div>
     </div>
     <div class="field">
         <div class="field-label">Obfuscation Level:</div>
-        <div class="field-value">Level {input_params.get('obfuscation_level', 0)}</div>
+        <div class="field-value">Level {{ input_params.get("obfuscation_level", 0) }}</div>
     </div>
     <div class="field">
         <div class="field-label">Requested OLLVM Passes:</div>
-        <div class="field-value">{", ".join(input_params.get('requested_passes', [])) or "None"}</div>
+        <div class="field-value">{{ input_params.get("requested_passes", [])|join(", ") or "None" }}</div>
     </div>
     <div class="field">
         <div class="field-label">Actually Applied OLLVM Passes:</div>
-        <div class="field-value"><strong>{", ".join(input_params.get('applied_passes', [])) or "None"}</strong></div>
+        <div class="field-value"><strong>{{ input_params.get("applied_passes", [])|join(", ") or "None" }}</strong></div>
     </div>
     <div class="field">
         <div class="field-label">Timestamp:</div>
-        <div class="field-value">{input_params.get('timestamp', 'N/A')}</div>
+        <div class="field-value">{{ input_params.get("timestamp", "N/A") }}</div>
     </div>
     <div class="field">
         <div class="field-label">Compiler Flags:</div>
-        <div class="field-value"><code>{flags_list}</code></div>
+        <div class="field-value"><code>{{ flags_list or "None" }}</code></div>
     </div>
 
     <!-- Warnings and Logs -->
@@ -421,25 +314,30 @@ class ObfuscationReport:
             </tr>
         </thead>
         <tbody>
-            {warnings_html}
+            {% for warning in warnings %}
+            <tr><td>{{ loop.index }}</td><td>{{ warning }}</td></tr>
+            {% else %}
+            <tr><td colspan="2">No warnings - all obfuscation techniques applied successfully</td></tr>
+            {% endfor %}
         </tbody>
     </table>
 
     <!-- Before/After Comparison -->
-    {f'''<h2>Before/After Comparison</h2>
+    {% if delta %}
+    <h2>Before/After Comparison</h2>
     <div class="comparison-grid">
         <div class="comparison-item">
             <h3>File Size</h3>
             <div class="metric-row">
                 <span class="metric-label">Before:</span>
-                <span class="metric-value">{baseline_metrics.get("file_size", 0) / 1024:.2f} KB</span>
+                <span class="metric-value">{{ delta.size_before_str }} KB</span>
             </div>
             <div class="metric-row">
                 <span class="metric-label">After:</span>
-                <span class="metric-value">{output_attrs.get("file_size", 0) / 1024:.2f} KB</span>
+                <span class="metric-value">{{ delta.size_after_str }} KB</span>
             </div>
-            <div class="change-indicator {("change-negative" if comparison.get("size_change_percent", 0) > 0 else "change-positive" if comparison.get("size_change_percent", 0) < 0 else "change-neutral")}">
-                {("+" if comparison.get("size_change_percent", 0) > 0 else "")}{comparison.get("size_change_percent", 0):.2f}% ({comparison.get("size_change", 0):+} bytes)
+            <div class="change-indicator {{ delta.size_class }}">
+                {{ delta.size_change_str }}% ({{ delta.size_change_bytes_str }} bytes)
             </div>
         </div>
 
@@ -447,18 +345,18 @@ class ObfuscationReport:
             <h3>Symbol Count</h3>
             <div class="metric-row">
                 <span class="metric-label">Before:</span>
-                <span class="metric-value">{baseline_metrics.get("symbols_count", 0)}</span>
+                <span class="metric-value">{{ delta.symbols_before }}</span>
             </div>
             <div class="metric-row">
                 <span class="metric-label">After:</span>
-                <span class="metric-value">{output_attrs.get("symbols_count", 0)}</span>
+                <span class="metric-value">{{ delta.symbols_after }}</span>
             </div>
-            <div class="change-indicator {("change-positive" if comparison.get("symbols_removed", 0) > 0 else "change-neutral")}">
-                {comparison.get("symbols_removed", 0)} symbols removed ({comparison.get("symbols_removed_percent", 0):.1f}%)
+            <div class="change-indicator {{ delta.symbols_class }}">
+                {{ delta.symbols_removed }} symbols removed ({{ delta.symbols_percent_str }}%)
             </div>
             <div class="progress-bar">
-                <div class="progress-fill" style="width: {min(100, abs(comparison.get("symbols_removed_percent", 0)))}%">
-                    {comparison.get("symbols_removed_percent", 0):.1f}%
+                <div class="progress-fill" style="width: {{ delta.symbols_bar }}%">
+                    {{ delta.symbols_percent_str }}%
                 </div>
             </div>
         </div>
@@ -467,18 +365,18 @@ class ObfuscationReport:
             <h3>Function Count</h3>
             <div class="metric-row">
                 <span class="metric-label">Before:</span>
-                <span class="metric-value">{baseline_metrics.get("functions_count", 0)}</span>
+                <span class="metric-value">{{ delta.functions_before }}</span>
             </div>
             <div class="metric-row">
                 <span class="metric-label">After:</span>
-                <span class="metric-value">{output_attrs.get("functions_count", 0)}</span>
+                <span class="metric-value">{{ delta.functions_after }}</span>
             </div>
-            <div class="change-indicator {("change-positive" if comparison.get("functions_removed", 0) > 0 else "change-neutral")}">
-                {comparison.get("functions_removed", 0)} functions hidden ({comparison.get("functions_removed_percent", 0):.1f}%)
+            <div class="change-indicator {{ delta.functions_class }}">
+                {{ delta.functions_removed }} functions hidden ({{ delta.functions_percent_str }}%)
             </div>
             <div class="progress-bar">
-                <div class="progress-fill" style="width: {min(100, abs(comparison.get("functions_removed_percent", 0)))}%">
-                    {comparison.get("functions_removed_percent", 0):.1f}%
+                <div class="progress-fill" style="width: {{ delta.functions_bar }}%">
+                    {{ delta.functions_percent_str }}%
                 </div>
             </div>
         </div>
@@ -487,43 +385,44 @@ class ObfuscationReport:
             <h3>Binary Entropy</h3>
             <div class="metric-row">
                 <span class="metric-label">Before:</span>
-                <span class="metric-value">{baseline_metrics.get("entropy", 0):.3f}</span>
+                <span class="metric-value">{{ delta.entropy_before_str }}</span>
             </div>
             <div class="metric-row">
                 <span class="metric-label">After:</span>
-                <span class="metric-value">{output_attrs.get("entropy", 0):.3f}</span>
+                <span class="metric-value">{{ delta.entropy_after_str }}</span>
             </div>
-            <div class="change-indicator {("change-positive" if comparison.get("entropy_increase", 0) > 0 else "change-neutral")}">
-                +{comparison.get("entropy_increase", 0):.3f} entropy increase ({comparison.get("entropy_increase_percent", 0):+.1f}%)
+            <div class="change-indicator {{ delta.entropy_class }}">
+                +{{ delta.entropy_increase_str }} entropy increase ({{ delta.entropy_percent_str }}%)
             </div>
         </div>
-    </div>''' if baseline_metrics and comparison else ''}
+    </div>
+    {% endif %}
 
     <!-- Output File Attributes -->
     <h2>Output File Attributes</h2>
     <div class="field">
         <div class="field-label">File Size:</div>
-        <div class="field-value">{file_size_kb:.2f} KB ({file_size} bytes)</div>
+        <div class="field-value">{{ file_size_kb_str }} KB ({{ file_size }} bytes)</div>
     </div>
     <div class="field">
         <div class="field-label">Binary Format:</div>
-        <div class="field-value">{output_attrs.get('binary_format', 'unknown')}</div>
+        <div class="field-value">{{ output_attrs.get("binary_format", "unknown") }}</div>
     </div>
     <div class="field">
         <div class="field-label">Symbol Count:</div>
-        <div class="field-value">{output_attrs.get('symbols_count', 0)}</div>
+        <div class="field-value">{{ output_attrs.get("symbols_count", 0) }}</div>
     </div>
     <div class="field">
         <div class="field-label">Function Count:</div>
-        <div class="field-value">{output_attrs.get('functions_count', 0)}</div>
+        <div class="field-value">{{ output_attrs.get("functions_count", 0) }}</div>
     </div>
     <div class="field">
         <div class="field-label">Entropy:</div>
-        <div class="field-value">{output_attrs.get('entropy', 0)}</div>
+        <div class="field-value">{{ output_attrs.get("entropy", 0) }}</div>
     </div>
     <div class="field">
         <div class="field-label">Obfuscation Methods:</div>
-        <div class="field-value">{methods_list}</div>
+        <div class="field-value">{{ methods_list }}</div>
     </div>
 
     <h3>Binary Sections</h3>
@@ -535,7 +434,11 @@ class ObfuscationReport:
             </tr>
         </thead>
         <tbody>
-            {sections_html}
+            {% for name, size in output_attrs.get("sections", {}).items() %}
+            <tr><td>{{ name }}</td><td>{{ size }} bytes</td></tr>
+            {% else %}
+            <tr><td colspan="2">No section information available</td></tr>
+            {% endfor %}
         </tbody>
     </table>
 
@@ -543,29 +446,30 @@ class ObfuscationReport:
     <h2>Bogus Code Generation</h2>
     <div class="field">
         <div class="field-label">Dead Code Blocks:</div>
-        <div class="field-value">{bogus_code.get('dead_code_blocks', 0)}</div>
+        <div class="field-value">{{ bogus_code.get("dead_code_blocks", 0) }}</div>
     </div>
     <div class="field">
         <div class="field-label">Opaque Predicates:</div>
-        <div class="field-value">{bogus_code.get('opaque_predicates', 0)}</div>
+        <div class="field-value">{{ bogus_code.get("opaque_predicates", 0) }}</div>
     </div>
     <div class="field">
         <div class="field-label">Junk Instructions:</div>
-        <div class="field-value">{bogus_code.get('junk_instructions', 0)}</div>
+        <div class="field-value">{{ bogus_code.get("junk_instructions", 0) }}</div>
     </div>
     <div class="field">
         <div class="field-label">Code Bloat Percentage:</div>
-        <div class="field-value">{bogus_code.get('code_bloat_percentage', 0)}%</div>
+        <div class="field-value">{{ bogus_code.get("code_bloat_percentage", 0) }}%</div>
     </div>
 
     <!-- Obfuscation Cycles -->
     <h2>Obfuscation Cycles</h2>
     <div class="field">
         <div class="field-label">Total Cycles:</div>
-        <div class="field-value">{total_cycles}</div>
+        <div class="field-value">{{ cycles.get("total_cycles", 1) }}</div>
     </div>
 
-    {f'''<h3>Per-Cycle Breakdown</h3>
+    {% if per_cycle_metrics %}
+    <h3>Per-Cycle Breakdown</h3>
     <table>
         <thead>
             <tr>
@@ -575,37 +479,41 @@ class ObfuscationReport:
             </tr>
         </thead>
         <tbody>
-            {cycles_html}
+            {% for cycle_info in per_cycle_metrics %}
+            <tr><td>Cycle {{ cycle_info.get("cycle", 0) }}</td><td>{{ cycle_info.get("passes_applied", [])|join(", ") or "None" }}</td><td>{{ cycle_info.get("duration_ms", 0) }} ms</td></tr>
+            {% endfor %}
         </tbody>
-    </table>''' if cycles_html else ''}
+    </table>
+    {% endif %}
 
     <!-- String Obfuscation -->
     <h2>String Obfuscation</h2>
     <div class="field">
         <div class="field-label">Total Strings:</div>
-        <div class="field-value">{total_strings}</div>
+        <div class="field-value">{{ string_obf.get("total_strings", 0) }}</div>
     </div>
     <div class="field">
         <div class="field-label">Encrypted Strings:</div>
-        <div class="field-value">{encrypted_strings}</div>
+        <div class="field-value">{{ string_obf.get("encrypted_strings", 0) }}</div>
     </div>
     <div class="field">
         <div class="field-label">Encryption Method:</div>
-        <div class="field-value">{encryption_method.upper()}</div>
+        <div class="field-value">{{ string_obf.get("encryption_method", "none")|upper }}</div>
     </div>
     <div class="field">
         <div class="field-label">Encryption Rate:</div>
-        <div class="field-value">{encryption_pct:.1f}%</div>
+        <div class="field-value">{{ encryption_rate_str }}%</div>
     </div>
 
     <!-- Fake Loops -->
     <h2>Fake Loops Inserted</h2>
     <div class="field">
         <div class="field-label">Total Fake Loops:</div>
-        <div class="field-value">{fake_loop_count}</div>
+        <div class="field-value">{{ fake_loop_count }}</div>
     </div>
 
-    {f'''<h3>Loop Details</h3>
+    {% if fake_loop_count > 0 %}
+    <h3>Loop Details</h3>
     <table>
         <thead>
             <tr>
@@ -615,24 +523,30 @@ class ObfuscationReport:
             </tr>
         </thead>
         <tbody>
-            {fake_loops_html}
+            {% set locations = fake_loops.get("locations") or [] %}
+            {% for loop_type in fake_loops.get("types", []) %}
+            <tr><td>Loop {{ loop.index }}</td><td>{{ loop_type }}</td><td>{{ locations[loop.index0] if loop.index <= locations|length else "Unknown" }}</td></tr>
+            {% endfor %}
         </tbody>
-    </table>''' if fake_loop_count > 0 else ''}
+    </table>
+    {% endif %}
 
     <!-- Symbol Obfuscation -->
     <h2>Symbol Obfuscation</h2>
     <div class="field">
         <div class="field-label">Enabled:</div>
-        <div class="field-value">{"Yes" if symbol_enabled else "No"}</div>
+        <div class="field-value">{{ "Yes" if symbol_obf.get("enabled", False) else "No" }}</div>
     </div>
-    {f'''<div class="field">
+    {% if symbol_obf.get("enabled", False) %}
+    <div class="field">
         <div class="field-label">Symbols Renamed:</div>
-        <div class="field-value">{symbols_obfuscated}</div>
+        <div class="field-value">{{ symbol_obf.get("symbols_obfuscated", 0) }}</div>
     </div>
     <div class="field">
         <div class="field-label">Algorithm:</div>
-        <div class="field-value">{symbol_algorithm}</div>
-    </div>''' if symbol_enabled else ''}
+        <div class="field-value">{{ symbol_obf.get("algorithm", "N/A") }}</div>
+    </div>
+    {% endif %}
 
     <!-- Footer -->
     <div class="footer">
@@ -640,24 +554,25 @@ class ObfuscationReport:
     </div>
 </body>
 </html>
-        """
-        return html
-
-    def _render_markdown(self, report: Dict[str, Any], job_id: str) -> str:
-        """Render a markdown version of the report."""
-        timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
-
-        input_params = report.get("input_parameters", {})
-        baseline_metrics = report.get("baseline_metrics", {})
-        output_attrs = report.get("output_attributes", {})
-        comparison = report.get("comparison", {})
-        bogus_code = report.get("bogus_code_info", {})
-        cycles = report.get("cycles_completed", {})
-        string_obf = report.get("string_obfuscation", {})
-        fake_loops = report.get("fake_loops_inserted", {})
-        symbol_obf = report.get("symbol_obfuscation", {})
+"""
 
-        md = f"""# 🛡️ LLVM Obfuscation Report
+# The report template is compiled once at import; rendering only runs the generated code.
+_JINJA_ENV = jinja2.Environment(
+    loader=jinja2.DictLoader({"report.html": _TEMPLATE_SRC}),
+    autoescape=True,
+    trim_blocks=True,
+    lstrip_blocks=True,
+    bytecode_cache=_bytecode_cache(),
+)
+_JINJA_ENV.globals["static_css"] = Markup(_STATIC_CSS_MIN if os.getenv(MINIFY_HTML_ENV) else _STATIC_CSS)
+_REPORT_TMPL = _JINJA_ENV.get_template("report.html")
+_STREAM_BUFFER_SIZE = 128 * 1024
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S UTC"
+# Stands in for the "Generated" time in cached HTML renders; filled in per export.
+_HTML_TIMESTAMP_SLOT = "\x00generated-timestamp\x00"
+
+# Markdown report layout, filled with str.format_map from the prepared context.
+_MD_TEMPLATE = """# 🛡️ LLVM Obfuscation Report
 
 **Job ID:** `{job_id}`
 **Generated:** {timestamp}
@@ -668,47 +583,47 @@ class ObfuscationReport:
 
 | Metric | Value |
 |--------|-------|
-| Obfuscation Score | {report.get('obfuscation_score', 0)}/100 |
-| Symbol Reduction | {report.get('symbol_reduction', 0)}% |
-| Function Reduction | {report.get('function_reduction', 0)}% |
-| Estimated RE Effort | {report.get('estimated_re_effort', 'N/A')} |
+| Obfuscation Score | {obfuscation_score}/100 |
+| Symbol Reduction | {symbol_reduction}% |
+| Function Reduction | {function_reduction}% |
+| Estimated RE Effort | {estimated_re_effort} |
 
 ---
 
 ## 📥 Input Parameters
 
-- **Source File:** `{input_params.get('source_file', 'N/A')}`
-- **Platform:** {input_params.get('platform', 'unknown')}
-- **Obfuscation Level:** Level {input_params.get('obfuscation_level', 0)}
-- **Requested OLLVM Passes:** {", ".join(input_params.get('requested_passes', [])) or "None"}
-- **Actually Applied OLLVM Passes:** **{", ".join(input_params.get('applied_passes', [])) or "None"}**
-- **Timestamp:** {input_params.get('timestamp', 'N/A')}
+- **Source File:** `{source_file}`
+- **Platform:** {platform}
+- **Obfuscation Level:** Level {obfuscation_level}
+- **Requested OLLVM Passes:** {requested_passes}
+- **Actually Applied OLLVM Passes:** **{applied_passes}**
+- **Timestamp:** {input_timestamp}
 
 ### Compiler Flags
 ```
-{' '.join(input_params.get('compiler_flags', []))}
+{flags_list}
 ```
 
 ---
 
 ## ⚠️ Warnings & Processing Logs
 
-{self._format_warnings_markdown(report.get('warnings', []))}
+{warnings_md}
 
 ---
 
-{self._format_comparison_markdown(baseline_metrics, output_attrs, comparison)}
+{comparison_md}
 
 ## 📦 Output File Attributes
 
-- **File Size:** {output_attrs.get('file_size', 0) / 1024:.2f} KB ({output_attrs.get('file_size', 0)} bytes)
-- **Binary Format:** {output_attrs.get('binary_format', 'unknown')}
-- **Symbol Count:** {output_attrs.get('symbols_count', 0)}
-- **Function Count:** {output_attrs.get('functions_count', 0)}
-- **Entropy:** {output_attrs.get('entropy', 0)}
+- **File Size:** {file_size_kb_str} KB ({file_size} bytes)
+- **Binary Format:** {binary_format}
+- **Symbol Count:** {symbols_count}
+- **Function Count:** {functions_count}
+- **Entropy:** {entropy}
 
 ### Obfuscation Methods Applied
-{", ".join(output_attrs.get('obfuscation_methods', [])) or "None"}
+{methods_list}
 
 ---
 
@@ -716,185 +631,539 @@ class ObfuscationReport:
 
 | Type | Count |
 |------|-------|
-| Dead Code Blocks | {bogus_code.get('dead_code_blocks', 0)} |
-| Opaque Predicates | {bogus_code.get('opaque_predicates', 0)} |
-| Junk Instructions | {bogus_code.get('junk_instructions', 0)} |
-| Code Bloat | {bogus_code.get('code_bloat_percentage', 0)}% |
+| Dead Code Blocks | {dead_code_blocks} |
+| Opaque Predicates | {opaque_predicates} |
+| Junk Instructions | {junk_instructions} |
+| Code Bloat | {code_bloat_percentage}% |
 
 ---
 
 ## 🔄 Obfuscation Cycles
 
-**Total Cycles:** {cycles.get('total_cycles', 1)}
+**Total Cycles:** {total_cycles}
 
 ---
 
 ## 🔐 String Obfuscation
 
-- **Total Strings:** {string_obf.get('total_strings', 0)}
-- **Encrypted Strings:** {string_obf.get('encrypted_strings', 0)}
-- **Encryption Method:** {string_obf.get('encryption_method', 'none').upper()}
-- **Encryption Rate:** {string_obf.get('encryption_percentage', 0.0):.1f}%
+- **Total Strings:** {total_strings}
+- **Encrypted Strings:** {encrypted_strings}
+- **Encryption Method:** {encryption_method}
+- **Encryption Rate:** {encryption_rate_str}%
 
 ---
 
 ## ➰ Fake Loops Inserted
 
-**Total Fake Loops:** {fake_loops.get('count', 0)}
+**Total Fake Loops:** {fake_loop_count}
 
 ---
 
 ## 🏷️ Symbol Obfuscation
 
-- **Enabled:** {"Yes" if symbol_obf.get('enabled', False) else "No"}
-- **Symbols Renamed:** {symbol_obf.get('symbols_obfuscated', 0)}
-- **Algorithm:** {symbol_obf.get('algorithm', 'N/A')}
+- **Enabled:** {symbol_enabled}
+- **Symbols Renamed:** {symbols_obfuscated}
+- **Algorithm:** {symbol_algorithm}
 
 ---
 
 *🤖 Generated with LLVM Obfuscator API*
 """
-        return md
 
-    def _format_warnings_markdown(self, warnings: List[str]) -> str:
-        """Format warnings list for markdown output."""
-        if not warnings:
-            return "✅ **No warnings** - All obfuscation techniques applied successfully"
 
-        md = ""
-        for i, warning in enumerate(warnings, 1):
-            md += f"{i}. {warning}\n"
-        return md.strip()
+@lru_cache(maxsize=None)
+def _reportlab() -> Optional[SimpleNamespace]:
+    """ReportLab classes plus the report's paragraph styles, imported and built on the first PDF export.
+
+    Returns None when ReportLab is not installed.
+    """
+    try:
+        from reportlab.lib import colors
+        from reportlab.lib.enums import TA_CENTER
+        from reportlab.lib.pagesizes import letter
+        from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+        from reportlab.lib.units import inch
+        from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+    except ImportError:
+        return None
+
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        textColor=colors.HexColor('#2c3e50'),
+        spaceAfter=30,
+        alignment=TA_CENTER,
+    )
+    heading_style = ParagraphStyle(
+        'CustomHeading',
+        parent=styles['Heading2'],
+        fontSize=16,
+        textColor=colors.HexColor('#3498db'),
+        spaceAfter=12,
+        spaceBefore=12,
+    )
+    # Header row and grid shared by every PDF table; tables with extra commands append to these.
+    table_style_cmds = (
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495e')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    )
+    return SimpleNamespace(
+        colors=colors,
+        inch=inch,
+        letter=letter,
+        Paragraph=Paragraph,
+        SimpleDocTemplate=SimpleDocTemplate,
+        Spacer=Spacer,
+        Table=Table,
+        TableStyle=TableStyle,
+        styles=styles,
+        title_style=title_style,
+        heading_style=heading_style,
+        table_style_cmds=table_style_cmds,
+        table_style=TableStyle(table_style_cmds),
+        # Header-less label/value table for the job id and generation time under the title.
+        meta_style=TableStyle([
+            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 0),
+        ]),
+    )
 
-    def _format_comparison_markdown(self, baseline_metrics: Dict[str, Any],
-                                   output_attrs: Dict[str, Any],
-                                   comparison: Dict[str, Any]) -> str:
-        """Format before/after comparison for markdown output."""
-        if not baseline_metrics or not comparison:
-            return ""
 
-        md = """## 🔄 Before/After Comparison
+def _pdf_table(rl: SimpleNamespace, data: List[List[str]], col_widths: List[float], *extra_style: Tuple) -> Any:
+    """A ReportLab table with the shared header/grid style plus any table-specific commands."""
+    table = rl.Table(data, colWidths=col_widths)
+    table.setStyle(rl.TableStyle(rl.table_style_cmds + extra_style) if extra_style else rl.table_style)
+    return table
 
-| Metric | Before | After | Change |
-|--------|--------|-------|--------|
-"""
 
-        # File Size
-        before_size = baseline_metrics.get("file_size", 0) / 1024
-        after_size = output_attrs.get("file_size", 0) / 1024
-        size_change = comparison.get("size_change_percent", 0)
-        size_indicator = "📈" if size_change > 0 else "📉" if size_change < 0 else "➡️"
-        md += f"| **File Size** | {before_size:.2f} KB | {after_size:.2f} KB | {size_indicator} {size_change:+.2f}% |\n"
+@dataclass(frozen=True, slots=True)
+class ReportModel:
+    """Assembled obfuscation report; renderers read attributes instead of dict lookups with defaults."""
+
+    input_parameters: Dict[str, Any]
+    warnings: List[str]
+    baseline_metrics: Dict[str, Any]
+    output_attributes: Dict[str, Any]
+    comparison: Dict[str, Any]
+    bogus_code_info: Dict[str, Any]
+    cycles_completed: Dict[str, Any]
+    string_obfuscation: Dict[str, Any]
+    fake_loops_inserted: Dict[str, Any]
+    symbol_obfuscation: Dict[str, Any]
+    obfuscation_score: float
+    symbol_reduction: float
+    function_reduction: float
+    size_reduction: float
+    entropy_increase: float
+    estimated_re_effort: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON export payload, keyed and ordered like the report fields."""
+        return {name: getattr(self, name) for name in _REPORT_FIELDS}
+
+
+_REPORT_FIELDS = tuple(f.name for f in fields(ReportModel))
+
+
+class ObfuscationReport:
+    """Generate comprehensive obfuscation report per SIH requirements."""
+
+    __slots__ = ("output_dir", "_html_cache", "_html_cache_lock")
+
+    HTML_CACHE_SIZE = 32
+    # HTML reports with more table rows than this are streamed to disk instead of
+    # being rendered into one string (and are therefore not cached).
+    HTML_STREAM_ROWS = 1000
+
+    def __init__(self, output_dir: Path) -> None:
+        self.output_dir = output_dir
+        # Rendered HTML keyed by a digest of (report, job_id); re-exports of the same report skip rendering.
+        self._html_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._html_cache_lock = threading.Lock()
+
+    def generate_report(self, job_data: Dict[str, Any]) -> ReportModel:
+        try:
+            report = ReportModel(
+                input_parameters={
+                    "source_file": job_data.get("source_file"),
+                    "platform": job_data.get("platform"),
+                    "obfuscation_level": job_data.get("obfuscation_level"),
+                    "requested_passes": job_data.get("requested_passes", []),  # What user requested
+                    "applied_passes": job_data.get("applied_passes", []),  # What was actually applied
+                    "compiler_flags": job_data.get("compiler_flags", []),
+                    "timestamp": job_data.get("timestamp", get_timestamp()),
+                },
+                warnings=job_data.get("warnings", []),  # Warnings from obfuscation process
+                baseline_metrics=job_data.get("baseline_metrics", {}),  # Before obfuscation metrics
+                output_attributes=job_data.get("output_attributes", {}),
+                comparison=job_data.get("comparison", {}),  # Before/after comparison
+                bogus_code_info=job_data.get("bogus_code_info", {}),
+                cycles_completed=job_data.get("cycles_completed", {}),
+                string_obfuscation=job_data.get("string_obfuscation", {}),
+                fake_loops_inserted=job_data.get("fake_loops_inserted", {}),
+                symbol_obfuscation=job_data.get("symbol_obfuscation", {}),
+                obfuscation_score=job_data.get("obfuscation_score", 0.0),
+                symbol_reduction=job_data.get("symbol_reduction", 0.0),
+                function_reduction=job_data.get("function_reduction", 0.0),
+                size_reduction=job_data.get("size_reduction", 0.0),
+                entropy_increase=job_data.get("entropy_increase", 0.0),
+                estimated_re_effort=job_data.get("estimated_re_effort", "4-6 weeks"),
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            raise ReportGenerationError("Failed to assemble report") from exc
+        return report
+
+    def export(self, report: ReportModel, job_id: str, formats: Iterable[str]) -> Dict[str, Path]:
+        outputs: Dict[str, Path] = {}
+        writes: Dict[str, Callable[[], Any]] = {}
+        # Shared by every rendered format so the timestamp and derived values are computed once.
+        context = self._prepare_context(report, job_id)
+        requested = [fmt.lower() for fmt in formats]
+        # The JSON export doubles as the HTML cache key, so the report is serialized at most once.
+        report_json = json_dumps_bytes(report.to_dict()) if {"json", "html"}.intersection(requested) else None
+        # Payloads are serialized up front; only the file writes run concurrently below.
+        for fmt_lower in requested:
+            builder = self._WRITERS.get(fmt_lower)
+            if builder is None:
+                continue
+            path = self.output_dir / f"{job_id}.{fmt_lower}"
+            writes[fmt_lower] = builder(self, path, report, job_id, context, report_json)
+            outputs[fmt_lower] = path
+
+        if writes:
+            ensure_directory(self.output_dir)
+        if len(writes) > 1:
+            with ThreadPoolExecutor(max_workers=len(writes)) as executor:
+                for future in [executor.submit(write) for write in writes.values()]:
+                    future.result()
+        else:
+            for write in writes.values():
+                write()
+        return outputs
 
-        # Symbol Count
-        before_symbols = baseline_metrics.get("symbols_count", 0)
-        after_symbols = output_attrs.get("symbols_count", 0)
+    def _json_writer(
+        self,
+        path: Path,
+        report: ReportModel,
+        job_id: str,
+        context: Dict[str, Any],
+        report_json: Optional[bytes],
+    ) -> Callable[[], Any]:
+        return partial(path.write_bytes, report_json)
+
+    def _html_writer(
+        self,
+        path: Path,
+        report: ReportModel,
+        job_id: str,
+        context: Dict[str, Any],
+        report_json: Optional[bytes],
+    ) -> Callable[[], Any]:
+        if self._html_rows(context) > self.HTML_STREAM_ROWS:
+            return partial(self._stream_html, path, context)
+        html = self._render_html(report, job_id, context, report_json)
+        return partial(path.write_bytes, html.encode("utf-8"))
+
+    def _markdown_writer(
+        self,
+        path: Path,
+        report: ReportModel,
+        job_id: str,
+        context: Dict[str, Any],
+        report_json: Optional[bytes],
+    ) -> Callable[[], Any]:
+        markdown = self._render_markdown(report, job_id, context)
+        return partial(path.write_bytes, markdown.encode("utf-8"))
+
+    def _pdf_writer(
+        self,
+        path: Path,
+        report: ReportModel,
+        job_id: str,
+        context: Dict[str, Any],
+        report_json: Optional[bytes],
+    ) -> Callable[[], Any]:
+        return partial(self._write_pdf, path, report, job_id, context, report_json)
+
+    # Format name -> builder returning the deferred write for that format.
+    _WRITERS = {
+        "json": _json_writer,
+        "html": _html_writer,
+        "markdown": _markdown_writer,
+        "pdf": _pdf_writer,
+    }
+
+    def _prepare_context(self, report: ReportModel, job_id: str) -> Dict[str, Any]:
+        """Report sections and derived display values shared by the HTML, markdown and PDF renderers."""
+        input_params = report.input_parameters
+        output_attrs = report.output_attributes
+        cycles = report.cycles_completed
+        fake_loops = report.fake_loops_inserted
+        baseline_metrics = report.baseline_metrics
+        comparison = report.comparison
+        string_obf = report.string_obfuscation
+        file_size = output_attrs.get("file_size", 0)
+        return {
+            "report": report,
+            "job_id": job_id,
+            "timestamp": datetime.now(timezone.utc).strftime(_TIMESTAMP_FORMAT),
+            "input_params": input_params,
+            "warnings": report.warnings,
+            "baseline_metrics": baseline_metrics,
+            "output_attrs": output_attrs,
+            "comparison": comparison,
+            "bogus_code": report.bogus_code_info,
+            "cycles": cycles,
+            "per_cycle_metrics": cycles.get("per_cycle_metrics", []),
+            "string_obf": string_obf,
+            "fake_loops": fake_loops,
+            "fake_loop_count": fake_loops.get("count", 0),
+            "symbol_obf": report.symbol_obfuscation,
+            "file_size": file_size,
+            # Display strings shared by the HTML, markdown and PDF renderers.
+            "file_size_kb_str": f"{file_size / 1024 if file_size > 0 else 0:.2f}",
+            "encryption_rate_str": f"{string_obf.get('encryption_percentage', 0.0):.1f}",
+            "delta": self._comparison_context(baseline_metrics, output_attrs, comparison),
+            "methods_list": ", ".join(output_attrs.get("obfuscation_methods", [])) or "None",
+            "flags_list": " ".join(input_params.get("compiler_flags", [])),
+            # Escaped once here (as Markup, so autoescape leaves them alone) for the HTML template.
+            "job_id_html": escape(job_id),
+            "source_file_html": escape(input_params.get("source_file", "N/A")),
+        }
+
+    def _comparison_context(self, baseline_metrics: Dict[str, Any], output_attrs: Dict[str, Any],
+                            comparison: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Before/after values for the comparison section, each looked up and formatted once; None without a baseline."""
+        if not baseline_metrics or not comparison:
+            return None
+        size_change = comparison.get("size_change_percent", 0)
         symbols_removed = comparison.get("symbols_removed", 0)
         symbols_percent = comparison.get("symbols_removed_percent", 0)
-        md += f"| **Symbols** | {before_symbols} | {after_symbols} | ✅ {symbols_removed} removed ({symbols_percent:.1f}%) |\n"
-
-        # Function Count
-        before_functions = baseline_metrics.get("functions_count", 0)
-        after_functions = output_attrs.get("functions_count", 0)
         functions_removed = comparison.get("functions_removed", 0)
         functions_percent = comparison.get("functions_removed_percent", 0)
-        md += f"| **Functions** | {before_functions} | {after_functions} | ✅ {functions_removed} hidden ({functions_percent:.1f}%) |\n"
-
-        # Binary Entropy
-        before_entropy = baseline_metrics.get("entropy", 0)
-        after_entropy = output_attrs.get("entropy", 0)
         entropy_increase = comparison.get("entropy_increase", 0)
-        entropy_percent = comparison.get("entropy_increase_percent", 0)
-        md += f"| **Entropy** | {before_entropy:.3f} | {after_entropy:.3f} | 🔒 +{entropy_increase:.3f} ({entropy_percent:+.1f}%) |\n"
+        return {
+            "size_before_str": f"{baseline_metrics.get('file_size', 0) / 1024:.2f}",
+            "size_after_str": f"{output_attrs.get('file_size', 0) / 1024:.2f}",
+            "size_change_percent": size_change,
+            "size_change_str": f"{'+' if size_change > 0 else ''}{size_change:.2f}",
+            "size_change_bytes_str": f"{comparison.get('size_change', 0):+}",
+            "size_class": "change-negative" if size_change > 0 else "change-positive" if size_change < 0 else "change-neutral",
+            "symbols_before": baseline_metrics.get("symbols_count", 0),
+            "symbols_after": output_attrs.get("symbols_count", 0),
+            "symbols_removed": symbols_removed,
+            "symbols_percent_str": f"{symbols_percent:.1f}",
+            "symbols_class": "change-positive" if symbols_removed > 0 else "change-neutral",
+            "symbols_bar": min(100, abs(symbols_percent)),
+            "functions_before": baseline_metrics.get("functions_count", 0),
+            "functions_after": output_attrs.get("functions_count", 0),
+            "functions_removed": functions_removed,
+            "functions_percent_str": f"{functions_percent:.1f}",
+            "functions_class": "change-positive" if functions_removed > 0 else "change-neutral",
+            "functions_bar": min(100, abs(functions_percent)),
+            "entropy_before_str": f"{baseline_metrics.get('entropy', 0):.3f}",
+            "entropy_after_str": f"{output_attrs.get('entropy', 0):.3f}",
+            "entropy_increase_str": f"{entropy_increase:.3f}",
+            "entropy_percent_str": f"{comparison.get('entropy_increase_percent', 0):+.1f}",
+            "entropy_class": "change-positive" if entropy_increase > 0 else "change-neutral",
+        }
+
+    def _render_html(
+        self,
+        report: ReportModel,
+        job_id: str,
+        context: Optional[Dict[str, Any]] = None,
+        report_json: Optional[bytes] = None,
+    ) -> str:
+        """Render a clean, simple HTML report matching existing website style."""
+        if report_json is None:
+            report_json = json_dumps_bytes(report.to_dict())
+        if context is None:
+            context = self._prepare_context(report, job_id)
+        key = hashlib.blake2b(report_json + job_id.encode("utf-8"), digest_size=16).hexdigest()
+        with self._html_cache_lock:
+            html = self._html_cache.get(key)
+            if html is not None:
+                self._html_cache.move_to_end(key)
+
+        if html is None:
+            # The cached page leaves the generation time open so every export stamps its own.
+            html = _REPORT_TMPL.render(dict(context, timestamp=_HTML_TIMESTAMP_SLOT))
+            with self._html_cache_lock:
+                self._html_cache[key] = html
+                while len(self._html_cache) > self.HTML_CACHE_SIZE:
+                    self._html_cache.popitem(last=False)
+        return html.replace(_HTML_TIMESTAMP_SLOT, str(escape(context["timestamp"])), 1)
+
+    @staticmethod
+    def _html_rows(context: Dict[str, Any]) -> int:
+        return (
+            len(context["warnings"])
+            + len(context["output_attrs"].get("sections", {}))
+            + len(context["per_cycle_metrics"])
+            + len(context["fake_loops"].get("types", []))
+        )
 
-        md += "\n---\n\n"
-        return md
+    def _stream_html(self, path: Path, context: Dict[str, Any]) -> None:
+        """Write the HTML report in template-sized chunks so memory stays bounded for huge reports."""
+        with open(path, "wb", buffering=_STREAM_BUFFER_SIZE) as f:
+            _REPORT_TMPL.stream(context).dump(f, encoding="utf-8")
+
+    def _render_markdown(self, report: ReportModel, job_id: str, context: Optional[Dict[str, Any]] = None) -> str:
+        """Render a markdown version of the report."""
+        ctx = context or self._prepare_context(report, job_id)
+        input_params = ctx["input_params"]
+        output_attrs = ctx["output_attrs"]
+        bogus_code = ctx["bogus_code"]
+        string_obf = ctx["string_obf"]
+        symbol_obf = ctx["symbol_obf"]
+        return _MD_TEMPLATE.format_map({
+            "job_id": job_id,
+            "timestamp": ctx["timestamp"],
+            "obfuscation_score": report.obfuscation_score,
+            "symbol_reduction": report.symbol_reduction,
+            "function_reduction": report.function_reduction,
+            "estimated_re_effort": report.estimated_re_effort,
+            "source_file": input_params.get("source_file", "N/A"),
+            "platform": input_params.get("platform", "unknown"),
+            "obfuscation_level": input_params.get("obfuscation_level", 0),
+            "requested_passes": ", ".join(input_params.get("requested_passes", [])) or "None",
+            "applied_passes": ", ".join(input_params.get("applied_passes", [])) or "None",
+            "input_timestamp": input_params.get("timestamp", "N/A"),
+            "flags_list": ctx["flags_list"],
+            "warnings_md": self._format_warnings_markdown(ctx["warnings"]),
+            "comparison_md": self._format_comparison_markdown(ctx["delta"]),
+            "file_size_kb_str": ctx["file_size_kb_str"],
+            "file_size": ctx["file_size"],
+            "binary_format": output_attrs.get("binary_format", "unknown"),
+            "symbols_count": output_attrs.get("symbols_count", 0),
+            "functions_count": output_attrs.get("functions_count", 0),
+            "entropy": output_attrs.get("entropy", 0),
+            "methods_list": ctx["methods_list"],
+            "dead_code_blocks": bogus_code.get("dead_code_blocks", 0),
+            "opaque_predicates": bogus_code.get("opaque_predicates", 0),
+            "junk_instructions": bogus_code.get("junk_instructions", 0),
+            "code_bloat_percentage": bogus_code.get("code_bloat_percentage", 0),
+            "total_cycles": ctx["cycles"].get("total_cycles", 1),
+            "total_strings": string_obf.get("total_strings", 0),
+            "encrypted_strings": string_obf.get("encrypted_strings", 0),
+            "encryption_method": string_obf.get("encryption_method", "none").upper(),
+            "encryption_rate_str": ctx["encryption_rate_str"],
+            "fake_loop_count": ctx["fake_loop_count"],
+            "symbol_enabled": "Yes" if symbol_obf.get("enabled", False) else "No",
+            "symbols_obfuscated": symbol_obf.get("symbols_obfuscated", 0),
+            "symbol_algorithm": symbol_obf.get("algorithm", "N/A"),
+        })
+
+    def _format_warnings_markdown(self, warnings: List[str]) -> str:
+        """Format warnings list for markdown output."""
+        if not warnings:
+            return "✅ **No warnings** - All obfuscation techniques applied successfully"
+
+        return "\n".join(f"{i}. {warning}" for i, warning in enumerate(warnings, 1)).strip()
+
+    def _format_comparison_markdown(self, delta: Optional[Dict[str, Any]]) -> str:
+        """Format before/after comparison (from _comparison_context) for markdown output."""
+        if not delta:
+            return ""
 
-    def _write_pdf(self, path: Path, report: Dict[str, Any], job_id: str) -> None:
+        size_change = delta["size_change_percent"]
+        size_indicator = "📈" if size_change > 0 else "📉" if size_change < 0 else "➡️"
+        rows = [
+            "## 🔄 Before/After Comparison\n",
+            "| Metric | Before | After | Change |",
+            "|--------|--------|-------|--------|",
+            f"| **File Size** | {delta['size_before_str']} KB | {delta['size_after_str']} KB | "
+            f"{size_indicator} {size_change:+.2f}% |",
+            f"| **Symbols** | {delta['symbols_before']} | {delta['symbols_after']} | "
+            f"✅ {delta['symbols_removed']} removed ({delta['symbols_percent_str']}%) |",
+            f"| **Functions** | {delta['functions_before']} | {delta['functions_after']} | "
+            f"✅ {delta['functions_removed']} hidden ({delta['functions_percent_str']}%) |",
+            f"| **Entropy** | {delta['entropy_before_str']} | {delta['entropy_after_str']} | "
+            f"🔒 +{delta['entropy_increase_str']} ({delta['entropy_percent_str']}%) |",
+        ]
+        return "\n".join(rows) + "\n\n---\n\n"
+
+    def _write_pdf(
+        self,
+        path: Path,
+        report: ReportModel,
+        job_id: str,
+        context: Optional[Dict[str, Any]] = None,
+        report_json: Optional[bytes] = None,
+    ) -> None:
         """Generate a PDF report using ReportLab."""
-        try:
-            from reportlab.lib import colors
-            from reportlab.lib.pagesizes import letter, A4
-            from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-            from reportlab.lib.units import inch
-            from reportlab.platypus import (
-                SimpleDocTemplate, Table, TableStyle, Paragraph,
-                Spacer, PageBreak, Image
-            )
-            from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-        except ImportError:
-            # Fallback if reportlab is not available
+        rl = _reportlab()
+        if rl is None:
+            # Fallback if reportlab is not available: a note plus the raw report data.
             ensure_directory(path.parent)
-            path.write_text(
+            if report_json is None:
+                report_json = json_dumps_bytes(report.to_dict())
+            path.write_bytes(
                 f"PDF Report for Job {job_id}\n\n"
                 f"Note: ReportLab library not installed. Install with: pip install reportlab\n\n"
-                f"Please use HTML or Markdown format for detailed reports.",
-                encoding="utf-8"
+                f"Please use HTML or Markdown format for detailed reports.\n\n".encode("utf-8")
+                + report_json
+                + b"\n"
             )
             return
+        colors, inch = rl.colors, rl.inch
+        Paragraph, Spacer = rl.Paragraph, rl.Spacer
+        styles, title_style, heading_style = rl.styles, rl.title_style, rl.heading_style
+        ctx = context or self._prepare_context(report, job_id)
 
         ensure_directory(path.parent)
 
         # Create PDF
-        doc = SimpleDocTemplate(str(path), pagesize=letter,
-                                rightMargin=0.75*inch, leftMargin=0.75*inch,
-                                topMargin=1*inch, bottomMargin=0.75*inch)
+        doc = rl.SimpleDocTemplate(str(path), pagesize=rl.letter,
+                                   rightMargin=0.75*inch, leftMargin=0.75*inch,
+                                   topMargin=1*inch, bottomMargin=0.75*inch)
 
         # Container for the 'Flowable' objects
         elements = []
-
-        # Define styles
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#2c3e50'),
-            spaceAfter=30,
-            alignment=TA_CENTER,
-        )
-
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=16,
-            textColor=colors.HexColor('#3498db'),
-            spaceAfter=12,
-            spaceBefore=12,
-        )
+        # Spacers are stateless between draws, so one instance per gap size serves the whole
+        # document (not shared across documents: drawOn briefly attaches the canvas to it).
+        section_gap = Spacer(1, 0.2*inch)
+        heading_gap = Spacer(1, 0.1*inch)
 
         # Title
         elements.append(Paragraph("🛡️ LLVM Obfuscation Report", title_style))
-        elements.append(Paragraph(f"<b>Job ID:</b> {job_id}", styles['Normal']))
-        elements.append(Paragraph(f"<b>Generated:</b> {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}", styles['Normal']))
+        meta_table = rl.Table(
+            [['Job ID:', job_id], ['Generated:', ctx['timestamp']]],
+            colWidths=[1.2*inch, 4.8*inch],
+            hAlign='LEFT',
+        )
+        meta_table.setStyle(rl.meta_style)
+        elements.append(meta_table)
         elements.append(Spacer(1, 0.3*inch))
 
         # Key Metrics
         elements.append(Paragraph("📊 Key Metrics", heading_style))
         metrics_data = [
             ['Metric', 'Value'],
-            ['Obfuscation Score', f"{report.get('obfuscation_score', 0)}/100"],
-            ['Symbol Reduction', f"{report.get('symbol_reduction', 0)}%"],
-            ['Function Reduction', f"{report.get('function_reduction', 0)}%"],
-            ['Estimated RE Effort', report.get('estimated_re_effort', 'N/A')],
+            ['Obfuscation Score', f"{report.obfuscation_score}/100"],
+            ['Symbol Reduction', f"{report.symbol_reduction}%"],
+            ['Function Reduction', f"{report.function_reduction}%"],
+            ['Estimated RE Effort', report.estimated_re_effort],
         ]
-        metrics_table = Table(metrics_data, colWidths=[3*inch, 3*inch])
-        metrics_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495e')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        metrics_table = _pdf_table(
+            rl, metrics_data, [3*inch, 3*inch],
             ('FONTSIZE', (0, 0), (-1, 0), 12),
             ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
             ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ]))
+        )
         elements.append(metrics_table)
-        elements.append(Spacer(1, 0.2*inch))
+        elements.append(section_gap)
 
         # Input Parameters
         elements.append(Paragraph("📥 Input Parameters", heading_style))
-        input_params = report.get("input_parameters", {})
+        input_params = report.input_parameters
         input_data = [
             ['Parameter', 'Value'],
             ['Source File', str(input_params.get('source_file', 'N/A'))],
@@ -902,46 +1171,36 @@ class ObfuscationReport:
             ['Obfuscation Level', f"Level {input_params.get('obfuscation_level', 0)}"],
             ['Enabled Passes', ", ".join(input_params.get('enabled_passes', [])) or "None"],
         ]
-        input_table = Table(input_data, colWidths=[2.5*inch, 3.5*inch])
-        input_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495e')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        input_table = _pdf_table(
+            rl, input_data, [2.5*inch, 3.5*inch],
             ('FONTSIZE', (0, 0), (-1, 0), 11),
             ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ]))
+        )
         elements.append(input_table)
-        elements.append(Spacer(1, 0.2*inch))
+        elements.append(section_gap)
 
         # Output Attributes
         elements.append(Paragraph("📦 Output File Attributes", heading_style))
-        output_attrs = report.get("output_attributes", {})
+        output_attrs = report.output_attributes
         file_size = output_attrs.get('file_size', 0)
         output_data = [
             ['Attribute', 'Value'],
-            ['File Size', f"{file_size / 1024:.2f} KB ({file_size} bytes)"],
+            ['File Size', f"{ctx['file_size_kb_str']} KB ({file_size} bytes)"],
             ['Binary Format', str(output_attrs.get('binary_format', 'unknown'))],
             ['Symbol Count', str(output_attrs.get('symbols_count', 0))],
             ['Function Count', str(output_attrs.get('functions_count', 0))],
             ['Entropy', str(output_attrs.get('entropy', 0))],
         ]
-        output_table = Table(output_data, colWidths=[2.5*inch, 3.5*inch])
-        output_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495e')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        output_table = _pdf_table(
+            rl, output_data, [2.5*inch, 3.5*inch],
             ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ]))
+        )
         elements.append(output_table)
-        elements.append(Spacer(1, 0.2*inch))
+        elements.append(section_gap)
 
         # Bogus Code
         elements.append(Paragraph("🔀 Bogus Code Generation", heading_style))
-        bogus_code = report.get("bogus_code_info", {})
+        bogus_code = report.bogus_code_info
         bogus_data = [
             ['Type', 'Count'],
             ['Dead Code Blocks', str(bogus_code.get('dead_code_blocks', 0))],
@@ -949,52 +1208,38 @@ class ObfuscationReport:
             ['Junk Instructions', str(bogus_code.get('junk_instructions', 0))],
             ['Code Bloat', f"{bogus_code.get('code_bloat_percentage', 0)}%"],
         ]
-        bogus_table = Table(bogus_data, colWidths=[3*inch, 3*inch])
-        bogus_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495e')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ]))
+        bogus_table = _pdf_table(rl, bogus_data, [3*inch, 3*inch])
         elements.append(bogus_table)
-        elements.append(Spacer(1, 0.2*inch))
+        elements.append(section_gap)
 
         # String Obfuscation
         elements.append(Paragraph("🔐 String Obfuscation", heading_style))
-        string_obf = report.get("string_obfuscation", {})
+        string_obf = report.string_obfuscation
         string_data = [
             ['Metric', 'Value'],
             ['Total Strings', str(string_obf.get('total_strings', 0))],
             ['Encrypted Strings', str(string_obf.get('encrypted_strings', 0))],
             ['Encryption Method', string_obf.get('encryption_method', 'none').upper()],
-            ['Encryption Rate', f"{string_obf.get('encryption_percentage', 0.0):.1f}%"],
+            ['Encryption Rate', f"{ctx['encryption_rate_str']}%"],
         ]
-        string_table = Table(string_data, colWidths=[3*inch, 3*inch])
-        string_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495e')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ]))
+        string_table = _pdf_table(rl, string_data, [3*inch, 3*inch])
         elements.append(string_table)
-        elements.append(Spacer(1, 0.2*inch))
+        elements.append(section_gap)
 
         # Cycles
-        cycles = report.get("cycles_completed", {})
+        cycles = report.cycles_completed
         total_cycles = cycles.get("total_cycles", 1)
         elements.append(Paragraph(f"🔄 Obfuscation Cycles: {total_cycles}", heading_style))
-        elements.append(Spacer(1, 0.1*inch))
+        elements.append(heading_gap)
 
         # Fake Loops
-        fake_loops = report.get("fake_loops_inserted", {})
+        fake_loops = report.fake_loops_inserted
         fake_loop_count = fake_loops.get("count", 0)
         elements.append(Paragraph(f"➰ Fake Loops Inserted: {fake_loop_count}", heading_style))
-        elements.append(Spacer(1, 0.1*inch))
+        elements.append(heading_gap)
 
         # Symbol Obfuscation
-        symbol_obf = report.get("symbol_obfuscation", {})
+        symbol_obf = report.symbol_obfuscation
         if symbol_obf.get("enabled", False):
             elements.append(Paragraph("🏷️ Symbol Obfuscation", heading_style))
             symbol_data = [
@@ -1002,14 +1247,7 @@ class ObfuscationReport:
                 ['Symbols Renamed', str(symbol_obf.get('symbols_obfuscated', 0))],
                 ['Algorithm', str(symbol_obf.get('algorithm', 'N/A'))],
             ]
-            symbol_table = Table(symbol_data, colWidths=[3*inch, 3*inch])
-            symbol_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495e')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ]))
+            symbol_table = _pdf_table(rl, symbol_data, [3*inch, 3*inch])
             elements.append(symbol_table)
 
         # Footer
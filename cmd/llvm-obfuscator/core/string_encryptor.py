@@ -6,6 +6,11 @@ import re
 from dataclasses import dataclass
 from typing import Dict, List
 
+# const global string declarations, C style (``[static] const char* NAME = "...";``)
+# or C++ style (``[static] const std::string NAME = "...";`` - group 2 is set).
+_CONST_GLOBAL_RE = re.compile(r'^\s*(static\s+)?const\s+(?:char\s*\*|(std::string))\s+(\w+)\s*=\s*"([^"]+)"\s*;')
+_CONST_CHAR_DECL_RE = re.compile(r'const char\*\s+(\w+)\s*=')
+
 
 @dataclass
 class StringEncryptionResult:
@@ -299,7 +304,7 @@ static void _secure_free(char* ptr) {
             # Check if this line has a const char* declaration with _xor_decrypt call
             if 'const char*' in line and '_xor_decrypt' in line:
                 # Extract variable name
-                var_match = re.search(r'const char\*\s+(\w+)\s*=', line)
+                var_match = _CONST_CHAR_DECL_RE.search(line)
                 if var_match:
                     var_name = var_match.group(1)
                     # Replace with non-const declaration
@@ -351,32 +356,17 @@ static void _secure_free(char* ptr) {
 
     def _extract_const_globals(self, source: str) -> List[Dict]:
         """Extract const global string declarations like: const char* NAME = "value"; """
-        import re
-
         const_globals = []
 
-        # Pattern 1: C-style - const char* IDENTIFIER = "string";
-        # Also matches: static const char* or const char *
-        c_pattern = r'^\s*(static\s+)?const\s+char\s*\*\s+(\w+)\s*=\s*"([^"]+)"\s*;'
-
-        # Pattern 2: C++ style - const std::string IDENTIFIER = "string";
-        cpp_pattern = r'^\s*(static\s+)?const\s+std::string\s+(\w+)\s*=\s*"([^"]+)"\s*;'
-
         lines = source.split('\n')
         for line_num, line in enumerate(lines):
-            # Try C pattern first
-            match = re.match(c_pattern, line)
-            is_cpp_string = False
-
-            # If no C match, try C++ pattern
-            if not match:
-                match = re.match(cpp_pattern, line)
-                is_cpp_string = True
-
+            # One precompiled pattern covers both the C and the C++ declaration forms.
+            match = _CONST_GLOBAL_RE.match(line)
             if match:
+                is_cpp_string = match.group(2) is not None
                 static_prefix = match.group(1) or ""
-                var_name = match.group(2)
-                string_value = match.group(3)
+                var_name = match.group(3)
+                string_value = match.group(4)
 
                 # Skip format strings and UI strings
                 skip_patterns = ['%', 'Usage:', '===', 'ERROR:', 'FAIL:', 'SUCCESS:']
@@ -1,19 +1,33 @@
 from __future__ import annotations
 
 import base64
+import hashlib
 import json
 import logging
 import os
 import platform
+import re
 import shutil
 import subprocess
 import tempfile
 from datetime import datetime
+from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Any, AnyStr, Dict, Iterable, List, Optional, Tuple
 
 from .exceptions import ObfuscationError, ToolchainNotFoundError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup, fall back to stdlib json
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional speedup, fall back to a pure-Python histogram
+    np = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,7 +35,13 @@ def ensure_directory(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-def run_command(command: List[str], cwd: Optional[Path] = None, env: Optional[Dict[str, str]] = None) -> Tuple[int, str, str]:
+def run_command(
+    command: List[str],
+    cwd: Optional[Path] = None,
+    env: Optional[Dict[str, str]] = None,
+    text: bool = True,
+) -> Tuple[int, AnyStr, AnyStr]:
+    # text=False hands back the raw output bytes for callers that scan it with bytes patterns.
     logger.debug("Executing command: %s", " ".join(command))
     process = subprocess.Popen(
         command,
@@ -29,14 +49,15 @@ def run_command(command: List[str], cwd: Optional[Path] = None, env: Optional[Di
         env=env,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
+        text=text,
     )
     stdout, stderr = process.communicate()
     logger.debug("Command stdout: %s", stdout)
     if stderr:
         logger.debug("Command stderr: %s", stderr)
     if process.returncode != 0:
-        raise ObfuscationError(f"Command failed with exit code {process.returncode}: {' '.join(command)}\n{stderr}")
+        message = stderr if text else stderr.decode("utf-8", errors="replace")
+        raise ObfuscationError(f"Command failed with exit code {process.returncode}: {' '.join(command)}\n{message}")
     return process.returncode, stdout, stderr
 
 
@@ -44,6 +65,12 @@ def tool_exists(tool_name: str) -> bool:
     return shutil.which(tool_name) is not None
 
 
+@lru_cache(maxsize=None)
+def _preferred_tool(llvm_tool: str, fallback: str) -> str:
+    """The LLVM flavour of a binutils tool when it is on PATH, resolved once per process."""
+    return llvm_tool if tool_exists(llvm_tool) else fallback
+
+
 def require_tool(tool_name: str) -> None:
     if not tool_exists(tool_name):
         raise ToolchainNotFoundError(f"Required tool '{tool_name}' not found in PATH")
@@ -54,10 +81,11 @@ def get_timestamp() -> str:
 
 
 def detect_binary_format(binary_path: Path) -> str:
-    if not binary_path.exists():
+    try:
+        with binary_path.open("rb") as f:
+            magic = f.read(4)
+    except OSError:
         return "unknown"
-    with binary_path.open("rb") as f:
-        magic = f.read(4)
     if magic.startswith(b"\x7fELF"):
         return "ELF"
     if magic[:2] in (b"MZ", b"ZM"):
@@ -65,17 +93,29 @@ def detect_binary_format(binary_path: Path) -> str:
     return "unknown"
 
 
-def compute_entropy(data: bytes) -> float:
-    if not data:
+def _byte_histogram(data) -> Any:
+    if np is not None:
+        # One C-level histogram pass instead of a per-byte interpreter loop.
+        return np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256)
+    counts = [0] * 256
+    for byte in data:
+        counts[byte] += 1
+    return counts
+
+
+def entropy_from_histogram(histogram: Any, length: int) -> float:
+    """Shannon entropy in bits per byte from a 256-bin byte histogram."""
+    if not length:
         return 0.0
+    if np is not None:
+        counts = np.asarray(histogram)
+        p = counts[counts > 0] / length
+        return round(float(-(p * np.log2(p)).sum()), 3)
+
     from math import log2
 
     entropy = 0.0
-    length = len(data)
-    counts = [0] * 256
-    for byte in data:
-        counts[byte] += 1
-    for count in counts:
+    for count in histogram:
         if count == 0:
             continue
         p = count / length
@@ -83,8 +123,56 @@ def compute_entropy(data: bytes) -> float:
     return round(entropy, 3)
 
 
+def compute_entropy(data: bytes) -> float:
+    if not data:
+        return 0.0
+    return entropy_from_histogram(_byte_histogram(data), len(data))
+
+
+def file_size_and_entropy(path: Path) -> Tuple[int, float]:
+    """Size and byte entropy of a file from a single stat and a single pass over its bytes.
+
+    A missing or empty file yields ``(0, 0.0)``.
+    """
+    try:
+        size = path.stat().st_size
+    except OSError:
+        return 0, 0.0
+    if size == 0:
+        return 0, 0.0
+    if np is None:
+        return size, compute_entropy(path.read_bytes())
+    return size, entropy_from_histogram(np.bincount(np.memmap(path, dtype=np.uint8, mode="r"), minlength=256), size)
+
+
+def fingerprint_file(path: Path, chunk_size: int = 1 << 20) -> Tuple[int, str, Any]:
+    """Size, SHA-256 hex digest and 256-bin byte histogram of a file in a single read.
+
+    A missing file yields ``(0, "", empty histogram)``.
+    """
+    digest = hashlib.sha256()
+    histogram = np.zeros(256, dtype=np.int64) if np is not None else [0] * 256
+    size = 0
+    try:
+        with path.open("rb") as f:
+            while chunk := f.read(chunk_size):
+                size += len(chunk)
+                digest.update(chunk)
+                chunk_counts = _byte_histogram(chunk)
+                if np is not None:
+                    histogram += chunk_counts
+                else:
+                    histogram = [a + b for a, b in zip(histogram, chunk_counts)]
+    except FileNotFoundError:
+        return 0, "", histogram
+    return size, digest.hexdigest(), histogram
+
+
 def get_file_size(path: Path) -> int:
-    return path.stat().st_size if path.exists() else 0
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
 
 
 def base64_to_file(content_b64: str, destination: Path) -> None:
@@ -92,6 +180,35 @@ def base64_to_file(content_b64: str, destination: Path) -> None:
     destination.write_bytes(decoded)
 
 
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, Path):
+        return str(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_dumps_bytes(data: Any) -> bytes:
+    """Serialize ``data`` as indented UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(data, option=option, default=_json_default)
+    return json.dumps(data, indent=2, default=_json_default).encode("utf-8")
+
+
+def json_dumps(data: Any) -> str:
+    """Serialize ``data`` as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return json_dumps_bytes(data).decode("utf-8")
+    return json.dumps(data, indent=2, default=_json_default)
+
+
+def json_loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def read_json(path: Path) -> Dict:
     with path.open("r", encoding="utf-8") as f:
         return json.load(f)
@@ -99,14 +216,13 @@ def read_json(path: Path) -> Dict:
 
 def write_json(path: Path, data: Dict) -> None:
     ensure_directory(path.parent)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    # orjson already produces UTF-8 bytes; writing them directly skips a decode/encode round trip.
+    path.write_bytes(json_dumps_bytes(data))
 
 
 def write_text(path: Path, content: str) -> None:
     ensure_directory(path.parent)
-    with path.open("w", encoding="utf-8") as f:
-        f.write(content)
+    path.write_bytes(content.encode("utf-8"))
 
 
 def create_temp_directory(prefix: str = "obf-") -> tempfile.TemporaryDirectory[str]:
@@ -122,13 +238,15 @@ def get_platform_triple(target_platform: str) -> str:
     return platform.machine()
 
 
-def merge_flags(base: Iterable[str], extra: Optional[Iterable[str]] = None) -> List[str]:
-    merged = list(base)
-    if extra:
-        for flag in extra:
-            if flag not in merged:
-                merged.append(flag)
-    return merged
+def merge_flags(base: Iterable[str], extra: Optional[Iterable[str]] = None) -> Tuple[str, ...]:
+    """Ordered union of base and extra flags, shared between calls with the same inputs."""
+    return _merge_flags(tuple(base), tuple(extra) if extra else ())
+
+
+@lru_cache(maxsize=128)
+def _merge_flags(base: Tuple[str, ...], extra: Tuple[str, ...]) -> Tuple[str, ...]:
+    # dict keeps first-seen order and makes each membership check O(1).
+    return tuple(dict.fromkeys(base + extra))
 
 
 def normalize_flags_and_passes(flags: Iterable[str]) -> Tuple[List[str], Dict[str, bool]]:
@@ -197,23 +315,29 @@ def normalize_flags_and_passes(flags: Iterable[str]) -> Tuple[List[str], Dict[st
     return cleaned, pass_enabled
 
 
+# Smaller files cannot hold an ELF/PE/Mach-O header, so nm/objdump are not spawned for them.
+_MIN_OBJECT_SIZE = 64
+
+# nm lines for text (function) symbols; at most one match per line.
+_NM_TEXT_SYMBOL_RE = re.compile(rb"^[^\n]* [Tt] ", re.MULTILINE)
+
+
 def summarize_symbols(binary_path: Path) -> Tuple[int, int]:
-    if not binary_path.exists():
+    if get_file_size(binary_path) < _MIN_OBJECT_SIZE:
         return 0, 0
-    nm_tool = "llvm-nm" if tool_exists("llvm-nm") else "nm"
+    nm_tool = _preferred_tool("llvm-nm", "nm")
     try:
-        _, stdout, _ = run_command([nm_tool, str(binary_path)])
+        _, stdout, _ = run_command([nm_tool, str(binary_path)], text=False)
     except ObfuscationError:
         return 0, 0
-    symbols = stdout.splitlines()
-    functions = [line for line in symbols if " T " in line or " t " in line]
-    return len(symbols), len(functions)
+    # Count over the raw buffer instead of decoding and splitting nm's output into per-line strings.
+    symbols = stdout.count(b"\n") + (1 if stdout and not stdout.endswith(b"\n") else 0)
+    return symbols, len(_NM_TEXT_SYMBOL_RE.findall(stdout))
 
 
 def write_html(path: Path, content: str) -> None:
     ensure_directory(path.parent)
-    with path.open("w", encoding="utf-8") as f:
-        f.write(content)
+    path.write_bytes(content.encode("utf-8"))
 
 
 def write_pdf_placeholder(path: Path) -> None:
@@ -222,22 +346,20 @@ def write_pdf_placeholder(path: Path) -> None:
     path.write_text(placeholder, encoding="utf-8")
 
 
+# "Idx Name Size VMA ..." rows of `objdump -h`; the header and flag lines do not start with an index.
+_OBJDUMP_SECTION_RE = re.compile(rb"^[ \t]*\d+[ \t]+(\S+)[ \t]+([0-9a-fA-F]+)[ \t]+\S", re.MULTILINE)
+
+
 def list_sections(binary_path: Path) -> Dict[str, int]:
-    if not binary_path.exists():
+    if get_file_size(binary_path) < _MIN_OBJECT_SIZE:
         return {}
-    objdump = "llvm-objdump" if tool_exists("llvm-objdump") else "objdump"
+    objdump = _preferred_tool("llvm-objdump", "objdump")
     try:
-        _, stdout, _ = run_command([objdump, "-h", str(binary_path)])
+        _, stdout, _ = run_command([objdump, "-h", str(binary_path)], text=False)
     except ObfuscationError:
         return {}
-    sections: Dict[str, int] = {}
-    for line in stdout.splitlines():
-        parts = line.split()
-        if len(parts) >= 4 and parts[0].isdigit():
-            name = parts[1]
-            size = int(parts[2], 16)
-            sections[name] = size
-    return sections
+    # Only the matched section names are decoded.
+    return {name.decode("utf-8", errors="replace"): int(size, 16) for name, size in _OBJDUMP_SECTION_RE.findall(stdout)}
 
 
 def current_platform() -> str:
@@ -256,8 +378,10 @@ def make_executable(path: Path) -> None:
 def load_yaml(path: Path) -> Dict:
     import yaml
 
+    # Prefer the libyaml-backed loader when PyYAML was built with it.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     with path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=loader)
 
 
 def dump_yaml(path: Path, data: Dict) -> None:
@@ -53,7 +53,7 @@ setup(
     install_requires=requirements,
 
     # Python version
-    python_requires=">=3.9",
+    python_requires=">=3.10",
 
     # Entry points
     entry_points={
@@ -70,7 +70,6 @@ setup(
         "Topic :: Software Development :: Build Tools",
         "License :: OSI Approved :: Apache Software License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Programming Language :: Python :: 3.12",
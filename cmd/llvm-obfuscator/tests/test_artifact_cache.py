@@ -0,0 +1,73 @@
+"""
+Unit tests for the content-addressed artifact cache.
+"""
+
+from core.artifact_cache import ArtifactCache, cache_key, default_cache_dir
+
+
+def test_store_and_fetch_round_trip(tmp_path):
+    """Stored artifacts are copied back out together with their metadata"""
+    cache = ArtifactCache(tmp_path / "cache")
+    artifact = tmp_path / "binary"
+    artifact.write_bytes(b"\x7fELFcached")
+    artifact.chmod(0o755)
+    key = cache_key(b"source", "-O3", "flattening")
+
+    assert cache.fetch(key, tmp_path / "miss") is None
+    cache.store(key, artifact, {"applied_passes": ["flattening"], "warnings": []})
+
+    destination = tmp_path / "restored"
+    assert cache.fetch(key, destination) == {"applied_passes": ["flattening"], "warnings": []}
+    assert destination.read_bytes() == b"\x7fELFcached"
+    assert destination.stat().st_mode & 0o111
+    assert (tmp_path / "cache" / key[:2] / key / "artifact").exists()
+
+
+def test_store_keeps_first_entry(tmp_path):
+    """A second store for the same key leaves the published entry untouched"""
+    cache = ArtifactCache(tmp_path / "cache")
+    first = tmp_path / "first"
+    first.write_bytes(b"first")
+    second = tmp_path / "second"
+    second.write_bytes(b"second")
+    key = cache_key("same")
+
+    cache.store(key, first, {})
+    cache.store(key, second, {})
+    cache.fetch(key, tmp_path / "out")
+    assert (tmp_path / "out").read_bytes() == b"first"
+    assert list((tmp_path / "cache" / key[:2]).iterdir()) == [tmp_path / "cache" / key[:2] / key]
+
+
+def test_cache_key_separates_parts():
+    """Part boundaries are part of the key"""
+    assert cache_key("ab", "c") != cache_key("a", "bc")
+
+
+def test_default_cache_dir_env(tmp_path, monkeypatch):
+    """Caching is opt-in through the environment and can still be disabled there"""
+    monkeypatch.delenv("LLVM_OBFUSCATOR_CACHE_DIR", raising=False)
+    monkeypatch.delenv("LLVM_OBFUSCATOR_NO_CACHE", raising=False)
+    assert default_cache_dir() is None
+    monkeypatch.setenv("LLVM_OBFUSCATOR_CACHE_DIR", str(tmp_path))
+    assert default_cache_dir() == tmp_path
+    monkeypatch.setenv("LLVM_OBFUSCATOR_NO_CACHE", "1")
+    assert default_cache_dir() is None
+
+
+def test_memory_layer_is_bounded_lru(tmp_path):
+    """Hot keys are served from memory and the in-process layer evicts least recently used keys"""
+    cache = ArtifactCache(tmp_path / "cache", memory_size=2)
+    artifact = tmp_path / "binary"
+    artifact.write_bytes(b"payload")
+    keys = [cache_key(str(i)) for i in range(3)]
+    for key in keys:
+        cache.store(key, artifact, {"key": key})
+
+    assert list(cache._memory) == keys[1:]
+    # Served from the remembered path without consulting meta.json.
+    (tmp_path / "cache" / keys[2][:2] / keys[2] / "meta.json").unlink()
+    assert cache.fetch(keys[2], tmp_path / "out") == {"key": keys[2]}
+    # Evicted keys still come back from disk and are re-remembered.
+    assert cache.fetch(keys[0], tmp_path / "out") == {"key": keys[0]}
+    assert list(cache._memory) == [keys[2], keys[0]]
@@ -0,0 +1,95 @@
+"""
+Unit tests for configuration parsing.
+"""
+
+from pathlib import Path
+
+from core.config import ObfuscationConfig, ObfuscationLevel, Platform
+
+
+def test_from_dict_defaults():
+    """Missing sections fall back to dataclass defaults"""
+    config = ObfuscationConfig.from_dict({})
+    assert config.level == ObfuscationLevel.MEDIUM
+    assert config.platform == Platform.LINUX
+    assert config.passes.enabled_passes() == ()
+    assert config.advanced.cycles == 1
+    assert config.output.directory == Path("./obfuscated")
+
+
+def test_from_dict_partial_sections():
+    """Only the keys present in each section override defaults"""
+    config = ObfuscationConfig.from_dict({
+        "level": 5,
+        "platform": "darwin",
+        "passes": {"flattening": True, "linear_mba": True},
+        "advanced": {"cycles": 2, "fake_loops": 3},
+        "output": {"directory": "build/out", "report_format": ["json", "html"]},
+    })
+    assert config.level == ObfuscationLevel.MAXIMUM
+    assert config.platform == Platform.MACOS
+    assert config.passes.enabled_passes() == ("flattening", "linear-mba")
+    assert config.advanced.cycles == 2
+    assert config.advanced.fake_loops == 3
+    assert config.advanced.string_encryption is False
+    assert config.output.directory == Path("build/out")
+    assert config.output.report_formats == frozenset({"json", "html"})
+
+
+
+def test_report_format_accepts_single_string():
+    """A bare format string is one format, not a set of characters"""
+    config = ObfuscationConfig.from_dict({"output": {"report_format": "HTML"}})
+    assert config.output.report_formats == frozenset({"html"})
+
+
+def test_report_format_none_uses_default():
+    """A null report format (e.g. from an API payload) falls back to JSON"""
+    config = ObfuscationConfig.from_dict({"output": {"report_format": None}})
+    assert config.output.report_formats == frozenset({"json"})
+
+
+def test_enabled_passes_is_computed_once():
+    """Equal pass configurations share one cached tuple and keep only the pass flags as fields"""
+    from dataclasses import asdict
+
+    from core.config import PassConfiguration
+
+    passes = PassConfiguration(substitution=True, split=True)
+    assert passes.enabled_passes() == ("substitution", "split")
+    assert passes.enabled_passes() is PassConfiguration(substitution=True, split=True).enabled_passes()
+    assert asdict(passes) == {
+        "flattening": False,
+        "substitution": True,
+        "bogus_control_flow": False,
+        "split": True,
+        "linear_mba": False,
+    }
+
+
+def test_platform_from_string():
+    """Platform lookup is case-insensitive and maps darwin to macOS"""
+    import pytest
+
+    assert Platform.from_string("Linux") == Platform.LINUX
+    assert Platform.from_string("DARWIN") == Platform.MACOS
+    with pytest.raises(ValueError, match="Unsupported platform: solaris"):
+        Platform.from_string("solaris")
+
+
+def test_from_dict_shares_identical_sections():
+    """Jobs with identical pass/advanced sections reuse the same frozen instances"""
+    data = {"passes": {"flattening": True}, "advanced": {"cycles": 2}}
+    first = ObfuscationConfig.from_dict(data)
+    second = ObfuscationConfig.from_dict({**data, "output": {"directory": "other"}})
+    assert first.passes is second.passes
+    assert first.advanced is second.advanced
+    assert first.output is not second.output
+
+
+def test_shared_sections_keep_value_types():
+    """Sections differing only in bool vs int values are not conflated by the shared cache"""
+    as_int = ObfuscationConfig.from_dict({"passes": {"flattening": 1}})
+    as_bool = ObfuscationConfig.from_dict({"passes": {"flattening": True}})
+    assert as_int.passes.flattening is not True and as_int.passes.flattening == 1
+    assert as_bool.passes.flattening is True
@@ -150,3 +150,421 @@ def test_cli_commands(sample_source, tmp_path, monkeypatch):
         ],
     )
     assert compare.exit_code == 0
+
+
+def test_cli_batch_parallel_jobs(sample_source, tmp_path, monkeypatch):
+    """Test batch command running jobs in parallel"""
+    from typer.testing import CliRunner
+
+    from cli.obfuscate import app as cli_app
+
+    monkeypatch.chdir(tmp_path)
+    config_path = tmp_path / "batch.yaml"
+    config_path.write_text(
+        "jobs:\n"
+        f"  - source: {sample_source}\n"
+        f"    output: {tmp_path / 'out1'}\n"
+        f"  - source: {sample_source}\n"
+        f"    output: {tmp_path / 'out2'}\n",
+        encoding="utf-8",
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(cli_app, ["batch", str(config_path), "--jobs", "2"])
+    assert result.exit_code == 0
+    assert (tmp_path / "out1" / "sample").exists()
+    assert (tmp_path / "out2" / "sample").exists()
+
+
+def test_build_config_default_fast_path(tmp_path):
+    """Plain compiles reuse the default pass/advanced sections"""
+    from cli.obfuscate import _DEFAULT_CONFIG, CliOptions, _build_config
+    from core.config import ObfuscationLevel, Platform
+
+    opts = CliOptions(
+        input_path=tmp_path / "a.c",
+        output=tmp_path / "out",
+        platform=Platform.MACOS,
+        level=ObfuscationLevel(4),
+        report_formats="json,html",
+    )
+    config = _build_config(opts)
+    assert config.passes is _DEFAULT_CONFIG.passes
+    assert config.advanced is _DEFAULT_CONFIG.advanced
+    assert config.compiler_flags is not _DEFAULT_CONFIG.compiler_flags
+    assert config.level == ObfuscationLevel.HIGH
+    assert config.platform == Platform.MACOS
+    assert config.output.directory == tmp_path / "out"
+    assert config.output.report_formats == frozenset({"json", "html"})
+
+
+def test_opt_batches_split_and_link(tmp_path, monkeypatch, obfuscator: LLVMObfuscator):
+    """Batched opt extracts function groups, runs opt per group and links the results"""
+    ir_file = tmp_path / "sample_temp.ll"
+    ir_file.write_text(
+        "@msg = private constant [4 x i8] c\"abc\\00\"\n"
+        "define internal i32 @secret() {\n  ret i32 42\n}\n"
+        "define i32 @helper() {\n  ret i32 1\n}\n"
+        "declare i32 @puts(ptr)\n"
+        "define i32 @main() {\n  ret i32 0\n}\n",
+        encoding="utf-8",
+    )
+    for tool in ("llvm-extract", "llvm-link"):
+        (tmp_path / tool).write_text("", encoding="utf-8")
+    commands = []
+    monkeypatch.setattr("core.obfuscator.run_command", lambda cmd, cwd=None: commands.append(cmd))
+    monkeypatch.setattr("core.obfuscator.os.cpu_count", lambda: 2)
+
+    opt_cmd = ["opt", "-load-pass-plugin=plugin.so", "-passes=flattening"]
+    batched = obfuscator._run_opt_batched(
+        opt_cmd, tmp_path / "opt", ir_file, tmp_path / "sample_obfuscated.bc", 1, cwd=tmp_path
+    )
+
+    assert batched is True
+    extracts = [cmd for cmd in commands if cmd[0].endswith("llvm-extract")]
+    assert [[arg for arg in cmd if arg.startswith("--func=")] for cmd in extracts] == [
+        ["--func=secret", "--func=helper"],
+        ["--func=main"],
+    ]
+    assert "--rglob=.*" in extracts[0] and "--rglob=.*" not in extracts[1]
+    assert sum(cmd[:3] == opt_cmd for cmd in commands) == 2
+    assert commands[-1][0].endswith("llvm-link")
+    assert commands[-1][-2:] == ["-o", str(tmp_path / "sample_obfuscated.bc")]
+
+
+def test_bundled_plugin_paths_per_target(obfuscator: LLVMObfuscator):
+    """Bundled plugin lookup maps each target platform to its plugins/<system>-<arch> directory"""
+    from core.config import Platform
+    from core.obfuscator import _BUNDLED_PLUGIN_PATHS
+
+    linux_plugin = _BUNDLED_PLUGIN_PATHS[Platform.LINUX]
+    assert linux_plugin.parent.name == "linux-x86_64"
+    assert linux_plugin.name == "LLVMObfuscationPlugin.so"
+    assert _BUNDLED_PLUGIN_PATHS[Platform.WINDOWS].name == "LLVMObfuscationPlugin.dll"
+    assert _BUNDLED_PLUGIN_PATHS[Platform.MACOS] == _BUNDLED_PLUGIN_PATHS[Platform.DARWIN]
+    expected = linux_plugin if linux_plugin.exists() else None
+    assert obfuscator._get_bundled_plugin_path(Platform.LINUX) == expected
+
+
+def test_fused_pass_plugin_single_invocation(sample_source, tmp_path, monkeypatch, obfuscator: LLVMObfuscator):
+    """Fused mode compiles C sources with one clang call that loads the pass plugin"""
+    from core.config import AdvancedConfiguration, ObfuscationConfig, PassConfiguration, Platform
+
+    plugin_dir = tmp_path / "plugin"
+    plugin_dir.mkdir()
+    plugin = plugin_dir / "LLVMObfuscationPlugin.so"
+    plugin.write_bytes(b"")
+    (plugin_dir / "clang").write_bytes(b"")
+    commands = []
+    monkeypatch.setattr("core.obfuscator.run_command", lambda cmd, cwd=None: commands.append(cmd))
+    monkeypatch.setattr("core.obfuscator._SYSTEM", "linux")
+
+    config = ObfuscationConfig(
+        platform=Platform.LINUX,
+        passes=PassConfiguration(flattening=True, split=True),
+        advanced=AdvancedConfiguration(fuse_pass_plugin=True),
+        custom_pass_plugin=plugin,
+    )
+    destination = tmp_path / "out" / "sample"
+    result = obfuscator._run_compile_pipeline(sample_source, destination, config, ["-O3", "-flto"], ("flattening", "split"))
+
+    assert result["applied_passes"] == ["flattening", "split"]
+    assert len(commands) == 1
+    assert commands[0][:6] == [
+        str(plugin_dir / "clang"),
+        str(sample_source.resolve()),
+        f"-fpass-plugin={plugin}",
+        "-mllvm",
+        "-passes=flattening,split",
+        "-o",
+    ]
+    assert "-O3" in commands[0] and "-flto" not in commands[0]
+
+
+def test_fused_pass_plugin_falls_back_once(sample_source, tmp_path, monkeypatch, obfuscator: LLVMObfuscator):
+    """A plugin that rejects fused mode falls back to opt and is not tried fused again"""
+    from core.config import AdvancedConfiguration, ObfuscationConfig, PassConfiguration, Platform
+    from core.exceptions import ObfuscationError
+
+    plugin_dir = tmp_path / "plugin"
+    plugin_dir.mkdir()
+    plugin = plugin_dir / "LLVMObfuscationPlugin.so"
+    plugin.write_bytes(b"")
+    (plugin_dir / "clang").write_bytes(b"")
+    (plugin_dir / "opt").write_bytes(b"")
+    commands = []
+
+    def fake_run(cmd, cwd=None):
+        commands.append(cmd)
+        if f"-fpass-plugin={plugin}" in cmd:
+            raise ObfuscationError("clang: Unknown command line argument '-passes=flattening'")
+
+    monkeypatch.setattr("core.obfuscator.run_command", fake_run)
+    monkeypatch.setattr("core.obfuscator._SYSTEM", "linux")
+
+    config = ObfuscationConfig(
+        platform=Platform.LINUX,
+        passes=PassConfiguration(flattening=True),
+        advanced=AdvancedConfiguration(fuse_pass_plugin=True),
+        custom_pass_plugin=plugin,
+    )
+    destination = tmp_path / "out" / "sample"
+    first = obfuscator._run_compile_pipeline(sample_source, destination, config, ["-O3"], ("flattening",))
+    assert first["applied_passes"] == ["flattening"]
+    assert sum(f"-fpass-plugin={plugin}" in cmd for cmd in commands) == 1
+    assert any(cmd[0] == str(plugin_dir / "opt") for cmd in commands)
+
+    commands.clear()
+    obfuscator._run_compile_pipeline(sample_source, destination, config, ["-O3"], ("flattening",))
+    assert not any(f"-fpass-plugin={plugin}" in cmd for cmd in commands)
+    assert any(cmd[0] == str(plugin_dir / "opt") for cmd in commands)
+
+
+def test_exception_handling_detection_bitcode_and_text(tmp_path, obfuscator: LLVMObfuscator):
+    """EH detection works on textual IR and on bitcode via the personality routine name"""
+    text_ir = tmp_path / "input.ll"
+    text_ir.write_text("  %r = invoke i32 @f() to label %ok unwind label %lp\n", encoding="utf-8")
+    assert obfuscator._has_exception_handling(text_ir)
+
+    bitcode = tmp_path / "input.bc"
+    bitcode.write_bytes(b"BC\xc0\xde\x00\x01mainf__gxx_personality_v0_Z3foov")
+    assert obfuscator._has_exception_handling(bitcode)
+    bitcode.write_bytes(b"BC\xc0\xde\x00\x01mainprintf")
+    assert not obfuscator._has_exception_handling(bitcode)
+
+
+def test_fallback_opt_lookup_is_remembered(tmp_path, monkeypatch, obfuscator: LLVMObfuscator):
+    """LLVM_OBFUSCATOR_OPT wins and the resolved opt is reused on later lookups"""
+    custom_opt = tmp_path / "opt"
+    custom_opt.write_bytes(b"")
+    monkeypatch.setenv("LLVM_OBFUSCATOR_OPT", str(custom_opt))
+    assert obfuscator._find_fallback_opt() == custom_opt
+
+    monkeypatch.delenv("LLVM_OBFUSCATOR_OPT")
+    monkeypatch.setattr("core.obfuscator.shutil.which", lambda name: pytest.fail("opt lookup repeated"))
+    assert obfuscator._find_fallback_opt() == custom_opt
+
+
+def test_attribute_collection_skipped_without_reporter(sample_source, tmp_path, monkeypatch):
+    """Without a reporter, collect_attributes=False skips the objdump/nm listings"""
+    from core.config import ObfuscationConfig, OutputConfiguration
+
+    monkeypatch.setattr(LLVMObfuscator, "_compile_and_analyze_baseline", lambda *args: {})
+    monkeypatch.setattr("core.obfuscator.list_sections", lambda path: pytest.fail("sections listed"))
+    monkeypatch.setattr("core.obfuscator.summarize_symbols", lambda path: pytest.fail("symbols listed"))
+
+    config = ObfuscationConfig(output=OutputConfiguration(directory=tmp_path / "out", collect_attributes=False))
+    result = LLVMObfuscator(reporter=None).obfuscate(sample_source, config)
+    assert result["output_attributes"]["sections"] == {}
+    assert result["output_attributes"]["symbols_count"] == 0
+
+
+def test_cycles_repeat_passes_in_one_compile(sample_source, tmp_path, monkeypatch, obfuscator: LLVMObfuscator):
+    """Multiple cycles repeat the pass sequence in one pipeline instead of recompiling binaries"""
+    from core.config import AdvancedConfiguration, ObfuscationConfig, PassConfiguration, Platform
+
+    plugin_dir = tmp_path / "plugin"
+    plugin_dir.mkdir()
+    plugin = plugin_dir / "LLVMObfuscationPlugin.so"
+    plugin.write_bytes(b"")
+    (plugin_dir / "clang").write_bytes(b"")
+    commands = []
+    monkeypatch.setattr("core.obfuscator.run_command", lambda cmd, cwd=None: commands.append(cmd))
+    monkeypatch.setattr("core.obfuscator._SYSTEM", "linux")
+
+    config = ObfuscationConfig(
+        platform=Platform.LINUX,
+        passes=PassConfiguration(flattening=True, substitution=True),
+        advanced=AdvancedConfiguration(cycles=2, fuse_pass_plugin=True),
+        custom_pass_plugin=plugin,
+    )
+    obfuscator._run_compile_pipeline(
+        sample_source, tmp_path / "sample", config, [], ("flattening", "substitution")
+    )
+    assert "-passes=flattening,substitution,flattening,substitution" in commands[0]
+
+    calls = []
+    monkeypatch.setattr(LLVMObfuscator, "_compile", lambda self, source, destination, *args: calls.append(destination))
+    monkeypatch.setattr(LLVMObfuscator, "_compile_and_analyze_baseline", lambda *args: {})
+    config.output.directory = tmp_path / "out"
+    obfuscator.obfuscate(sample_source, config)
+    assert calls == [tmp_path / "out" / "sample"]
+
+
+def test_job_data_keeps_payload_layout(sample_source, obfuscation_config, obfuscator: LLVMObfuscator):
+    """obfuscate() still returns the report payload as a plain dict in the documented key order"""
+    from core.obfuscator import _JOB_DATA_FIELDS
+
+    result = obfuscator.obfuscate(sample_source, obfuscation_config)
+    assert list(result)[: len(_JOB_DATA_FIELDS)] == list(_JOB_DATA_FIELDS)
+    assert _JOB_DATA_FIELDS[0] == "job_id" and _JOB_DATA_FIELDS[-1] == "output_file"
+    assert "report_paths" in result
+
+
+def test_estimate_metrics_per_cycle_entries_are_per_job(obfuscator: LLVMObfuscator, tmp_path):
+    """Every job gets its own per-cycle metric entries"""
+    kwargs = dict(
+        source_file=tmp_path / "a.c",
+        output_binary=tmp_path / "a",
+        passes=("flattening", "split"),
+        cycles=3,
+        string_result=None,
+        fake_loops=[],
+        entropy=5.0,
+    )
+    first = obfuscator._estimate_metrics(**kwargs)
+    second = obfuscator._estimate_metrics(**kwargs)
+    per_cycle = first.cycles_completed["per_cycle_metrics"]
+    assert [entry["duration_ms"] for entry in per_cycle] == [500, 600, 700]
+    assert per_cycle[2] == {"cycle": 3, "passes_applied": ("flattening", "split"), "duration_ms": 700}
+    per_cycle[0]["duration_ms"] = 0
+    assert second.cycles_completed["per_cycle_metrics"][0]["duration_ms"] == 500
+    assert obfuscator._estimate_metrics(**kwargs).cycles_completed["per_cycle_metrics"][0]["duration_ms"] == 500
+    assert first.obfuscation_score == 50 + 10 + 9
+
+
+def test_compile_context_resolves_target_once(obfuscator: LLVMObfuscator, tmp_path, monkeypatch):
+    """Compiler, plugin and target flags are resolved up front and shared by every compile step"""
+    from dataclasses import replace
+
+    from core.config import ObfuscationConfig, Platform
+
+    monkeypatch.setattr("core.obfuscator._SYSTEM", "linux")
+    plugin = tmp_path / "plugin.so"
+    plugin.write_bytes(b"")
+    config = ObfuscationConfig(platform=Platform.WINDOWS, custom_pass_plugin=plugin)
+
+    context = obfuscator._compile_context(tmp_path / "a.cpp", config, ("flattening",))
+    assert context.base_compiler == "clang++" and context.is_cpp
+    assert context.plugin_path == plugin
+    assert context.target_flags == ("--target=x86_64-w64-mingw32",)
+    assert context.is_cross_compiling
+
+    native = replace(context, target_os="linux", target_flags=())
+    assert not native.is_cross_compiling
+    assert obfuscator._compile_context(tmp_path / "a.c", config, ()).plugin_path is None
+
+
+def test_ir_defined_functions_scans_mapped_file(tmp_path):
+    """Defined (not declared) function names come out of the mapped IR, quoted names unwrapped"""
+    from core.obfuscator import _ir_defined_functions
+
+    ir_file = tmp_path / "module.ll"
+    ir_file.write_text(
+        'declare i32 @puts(ptr)\n'
+        'define i32 @main() {\n}\n'
+        'define internal void @"odd name"(i32 %x) {\n}\n'
+    )
+    assert _ir_defined_functions(ir_file) == ["main", "odd name"]
+    empty = tmp_path / "empty.ll"
+    empty.write_bytes(b"")
+    assert _ir_defined_functions(empty) == []
+
+
+def test_binary_listings_cached_by_content(obfuscator: LLVMObfuscator, tmp_path, monkeypatch):
+    """nm/objdump run once per distinct binary contents, not once per path"""
+    calls = []
+    monkeypatch.setattr("core.obfuscator.list_sections", lambda path: calls.append(path) or {".text": 16})
+    monkeypatch.setattr("core.obfuscator.summarize_symbols", lambda path: (3, 1))
+    first, second, other = tmp_path / "a", tmp_path / "b", tmp_path / "c"
+    first.write_bytes(b"\x7fELF" + bytes(60))
+    second.write_bytes(b"\x7fELF" + bytes(60))
+    other.write_bytes(b"\x7fELF" + bytes(61))
+
+    metrics = obfuscator._binary_metrics(first)
+    assert obfuscator._binary_metrics(second) == metrics
+    obfuscator._binary_metrics(other)
+    assert calls == [first, other]
+    assert metrics["sections"] == {".text": 16} and metrics["symbols_count"] == 3
+
+
+def test_baseline_overlaps_obfuscated_build(sample_source, obfuscation_config, obfuscator: LLVMObfuscator, monkeypatch):
+    """The baseline build runs off the calling thread and its metrics still reach the result"""
+    import threading
+
+    baseline_threads = []
+
+    def fake_baseline(self, source_file, baseline_binary, config):
+        baseline_threads.append(threading.current_thread())
+        return {"file_size": 1, "symbols_count": 0, "functions_count": 0, "entropy": 0.0}
+
+    monkeypatch.setattr(LLVMObfuscator, "_compile_and_analyze_baseline", fake_baseline)
+    result = obfuscator.obfuscate(sample_source, obfuscation_config)
+    assert baseline_threads and baseline_threads[0] is not threading.current_thread()
+    assert result["baseline_metrics"]["file_size"] == 1
+
+
+def test_baseline_joined_when_pipeline_fails(sample_source, obfuscation_config, obfuscator: LLVMObfuscator, monkeypatch):
+    """A failed obfuscation waits for the baseline build instead of leaving it running"""
+    import threading
+    import time
+
+    import pytest
+
+    from core.exceptions import ObfuscationError
+
+    finished = threading.Event()
+
+    def slow_baseline(self, source_file, baseline_binary, config):
+        time.sleep(0.05)
+        finished.set()
+        return {}
+
+    def failing_compile(self, *args, **kwargs):
+        raise ObfuscationError("compile failed")
+
+    monkeypatch.setattr(LLVMObfuscator, "_compile_and_analyze_baseline", slow_baseline)
+    monkeypatch.setattr(LLVMObfuscator, "_compile", failing_compile)
+    with pytest.raises(ObfuscationError):
+        obfuscator.obfuscate(sample_source, obfuscation_config)
+    assert finished.is_set()
+
+
+def test_batch_keeps_going_after_job_error(tmp_path, monkeypatch, capsys):
+    """A job raising any exception is logged and the remaining jobs still run and report"""
+    import asyncio
+
+    import cli.obfuscate as cli_module
+    from core.config import ObfuscationConfig
+
+    def fake_job(job):
+        if job["source"].name == "bad.c":
+            raise OSError("unreadable source")
+        return {"source": job["source"].name}
+
+    monkeypatch.setattr(cli_module, "_run_batch_job", fake_job)
+    jobs = [
+        {"source": tmp_path / name, "config": ObfuscationConfig(), "output": tmp_path / "out"}
+        for name in ("bad.c", "good.c")
+    ]
+    assert asyncio.run(cli_module._run_batch(iter(jobs), 2)) == 2
+    assert '"source": "good.c"' in capsys.readouterr().out
+
+
+def test_artifact_key_covers_build_inputs(obfuscator: LLVMObfuscator, tmp_path, monkeypatch):
+    """Options that change the build are in the key and sources with local headers are not cached"""
+    from dataclasses import replace
+
+    from core.config import AdvancedConfiguration, ObfuscationConfig
+
+    source = tmp_path / "a.c"
+    source.write_text("#include <stdio.h>\nint main() { return 0; }\n", encoding="utf-8")
+    config = ObfuscationConfig()
+    context = obfuscator._compile_context(source, config, ())
+
+    key = obfuscator._artifact_key(source, config, ["-O2"], (), context)
+    assert key is not None
+    for advanced in (AdvancedConfiguration(fuse_pass_plugin=True), AdvancedConfiguration(opt_batches_per_thread=2)):
+        assert obfuscator._artifact_key(source, replace(config, advanced=advanced), ["-O2"], (), context) != key
+
+    compiler = tmp_path / "clang"
+    compiler.write_bytes(b"v1")
+    compiler.chmod(0o755)
+    compiler_context = replace(context, base_compiler=str(compiler))
+    first = obfuscator._artifact_key(source, config, ["-O2"], (), compiler_context)
+    compiler.write_bytes(b"v2-rebuilt")
+    assert obfuscator._artifact_key(source, config, ["-O2"], (), compiler_context) != first
+
+    assert obfuscator._artifact_key(source, config, ["-O2", "-Iinclude"], (), context) is None
+    source.write_text('#include "local.h"\nint main() { return 0; }\n', encoding="utf-8")
+    assert obfuscator._artifact_key(source, config, ["-O2"], (), context) is None
@@ -0,0 +1,190 @@
+"""
+Unit tests for report rendering.
+"""
+
+from dataclasses import replace
+from pathlib import Path
+from types import SimpleNamespace
+
+from core.reporter import ObfuscationReport, ReportModel
+
+
+def _report(**job_data):
+    return ObfuscationReport(Path("unused")).generate_report(job_data)
+
+
+def test_render_html_tables_and_escaping():
+    """HTML report lists table rows and escapes user-supplied values"""
+    reporter = ObfuscationReport(Path("unused"))
+    report = _report(
+        source_file="<main>.c",
+        warnings=["a & b"],
+        output_attributes={"sections": {".text": 100}},
+        fake_loops_inserted={"count": 2, "types": ["while", "for"], "locations": ["main"]},
+    )
+    html = reporter._render_html(report, "job-1")
+    assert "<code>&lt;main&gt;.c</code>" in html
+    assert "<tr><td>1</td><td>a &amp; b</td></tr>" in html
+    assert "<tr><td>.text</td><td>100 bytes</td></tr>" in html
+    assert "<tr><td>Loop 2</td><td>for</td><td>Unknown</td></tr>" in html
+
+
+def test_render_html_empty_report():
+    """Missing sections fall back to the placeholder rows"""
+    html = ObfuscationReport(Path("unused"))._render_html(_report(), "job-2")
+    assert "No warnings - all obfuscation techniques applied successfully" in html
+    assert "No section information available" in html
+    assert "Loop Details" not in html
+
+
+def test_markdown_warnings_numbered_list():
+    """Warnings render as a numbered markdown list without trailing newline"""
+    reporter = ObfuscationReport(Path("unused"))
+    assert reporter._format_warnings_markdown(["first", "second"]) == "1. first\n2. second"
+    assert reporter._format_warnings_markdown([]).startswith("✅ **No warnings**")
+
+
+def test_export_prepares_context_once(tmp_path, monkeypatch):
+    """All rendered formats of one export share a single prepared context"""
+    reporter = ObfuscationReport(tmp_path)
+    calls = []
+    prepare = ObfuscationReport._prepare_context
+
+    def counting_prepare(self, report, job_id):
+        calls.append(job_id)
+        return prepare(self, report, job_id)
+
+    monkeypatch.setattr(ObfuscationReport, "_prepare_context", counting_prepare)
+    outputs = reporter.export(_report(compiler_flags=["-O2"]), "job-3", ["json", "html", "markdown"])
+    assert calls == ["job-3"]
+    assert set(outputs) == {"json", "html", "markdown"}
+    assert "<code>-O2</code>" in outputs["html"].read_text(encoding="utf-8")
+
+
+def test_comparison_context_binds_values_once():
+    """Comparison section values and CSS classes are derived in one place"""
+    reporter = ObfuscationReport(Path("unused"))
+    assert reporter._comparison_context({}, {}, {"size_change_percent": 1}) is None
+    delta = reporter._comparison_context(
+        {"file_size": 2048, "symbols_count": 10},
+        {"file_size": 1024, "symbols_count": 2},
+        {"size_change_percent": -50.0, "symbols_removed": 8, "symbols_removed_percent": 180.0},
+    )
+    assert delta["size_before_str"] == "2.00" and delta["size_after_str"] == "1.00"
+    assert delta["size_change_str"] == "-50.00" and delta["symbols_percent_str"] == "180.0"
+    assert delta["size_class"] == "change-positive"
+    assert delta["symbols_class"] == "change-positive"
+    assert delta["symbols_bar"] == 100
+    assert delta["functions_class"] == "change-neutral"
+
+
+def test_pdf_without_reportlab_writes_note(tmp_path, monkeypatch):
+    """PDF export degrades to a plain-text note when ReportLab is unavailable"""
+    import core.reporter as reporter_module
+
+    monkeypatch.setattr(reporter_module, "_reportlab", lambda: None)
+    path = tmp_path / "job-4.pdf"
+    ObfuscationReport(tmp_path)._write_pdf(path, _report(warnings=["w"]), "job-4")
+    content = path.read_text(encoding="utf-8")
+    assert content.startswith("PDF Report for Job job-4")
+    assert '"warnings": [\n    "w"\n  ]' in content
+
+
+def test_render_html_reuses_cached_output(monkeypatch):
+    """Identical reports for the same job are rendered once but stamped per export; the cache stays bounded"""
+    import core.reporter as reporter_module
+
+    renders = []
+    template = reporter_module._REPORT_TMPL
+    monkeypatch.setattr(
+        reporter_module,
+        "_REPORT_TMPL",
+        SimpleNamespace(render=lambda ctx: renders.append(ctx) or template.render(ctx)),
+    )
+    reporter = ObfuscationReport(Path("unused"))
+    report = _report(warnings=["w"], timestamp="t")
+    first_context = dict(reporter._prepare_context(report, "job-5"), timestamp="2020-01-01 00:00:00 UTC")
+    first = reporter._render_html(report, "job-5", first_context)
+    second_context = dict(first_context, timestamp="2024-01-01 00:00:00 UTC")
+    second = reporter._render_html(ReportModel(**report.to_dict()), "job-5", second_context)
+    assert len(renders) == 1
+    assert "2020-01-01 00:00:00 UTC" in first and "2024-01-01 00:00:00 UTC" not in first
+    assert second == first.replace("2020-01-01", "2024-01-01")
+    assert reporter_module._HTML_TIMESTAMP_SLOT not in second
+
+    reporter._render_html(report, "job-6")
+    reporter._render_html(replace(report, warnings=["x"]), "job-5")
+    assert len(renders) == 3
+
+    for idx in range(ObfuscationReport.HTML_CACHE_SIZE + 5):
+        reporter._render_html(_report(), f"job-{idx}")
+    assert len(reporter._html_cache) == ObfuscationReport.HTML_CACHE_SIZE
+
+
+def test_minify_css():
+    """Minified stylesheet keeps declarations and drops insignificant whitespace"""
+    from core.reporter import _minify_css
+
+    css = """
+        th, td {
+            border: 1px solid #000;
+            margin: 0 auto;
+        }
+
+        @media print {
+            body {
+                padding: 10px;
+            }
+        }
+    """
+    assert _minify_css(css) == "th,td{border:1px solid #000;margin:0 auto}@media print{body{padding:10px}}"
+
+
+def test_generate_report_model_to_dict():
+    """The report model keeps the JSON payload keys, order and defaults"""
+    report = _report(source_file="a.c", obfuscation_score=42.0)
+    payload = report.to_dict()
+    assert list(payload)[:3] == ["input_parameters", "warnings", "baseline_metrics"]
+    assert list(payload)[-1] == "estimated_re_effort"
+    assert payload["input_parameters"]["source_file"] == "a.c"
+    assert payload["obfuscation_score"] == 42.0
+    assert report.estimated_re_effort == "4-6 weeks"
+
+
+def test_export_serializes_report_once(tmp_path, monkeypatch):
+    """JSON and HTML exports share one serialization of the report"""
+    import core.reporter as reporter_module
+
+    calls = []
+    dumps = reporter_module.json_dumps_bytes
+
+    def counting_dumps(data):
+        calls.append(data)
+        return dumps(data)
+
+    monkeypatch.setattr(reporter_module, "json_dumps_bytes", counting_dumps)
+    outputs = ObfuscationReport(tmp_path).export(_report(), "job-7", ["JSON", "html"])
+    assert len(calls) == 1
+    assert outputs["json"].read_bytes() == dumps(calls[0])
+
+
+def test_large_html_report_is_streamed(tmp_path, monkeypatch):
+    """Reports above the row threshold are streamed to disk with the same content"""
+    monkeypatch.setattr(ObfuscationReport, "HTML_STREAM_ROWS", 3)
+    reporter = ObfuscationReport(tmp_path)
+    report = _report(warnings=[f"warning {i}" for i in range(5)], timestamp="t")
+    outputs = reporter.export(report, "job-8", ["html"])
+    assert not reporter._html_cache
+    streamed = outputs["html"].read_text(encoding="utf-8")
+    assert "<tr><td>5</td><td>warning 4</td></tr>" in streamed
+    assert streamed == reporter._render_html(report, "job-8", reporter._prepare_context(report, "job-8"))
+
+
+def test_html_escapes_job_id_and_source_once(tmp_path):
+    """Job id and source path are HTML-escaped exactly once"""
+    reporter = ObfuscationReport(tmp_path)
+    report = _report(source_file="a<b>.c", timestamp="t")
+    html = reporter._render_html(report, "job&1")
+    assert "<code>job&amp;1</code>" in html
+    assert "<code>a&lt;b&gt;.c</code>" in html
+    assert "&amp;amp;" not in html and "&amp;lt;" not in html
@@ -0,0 +1,117 @@
+"""
+Unit tests for core.utils helpers.
+"""
+
+import json
+from pathlib import Path
+
+from core.config import Platform
+from core.utils import compute_entropy, file_size_and_entropy, json_dumps, load_yaml
+
+
+def test_json_dumps_handles_paths_and_enums():
+    """Paths and enums serialize to their string values"""
+    payload = {"output": Path("/tmp/out"), "platform": Platform.LINUX, "count": 3}
+    data = json.loads(json_dumps(payload))
+    assert data == {"output": "/tmp/out", "platform": "linux", "count": 3}
+
+
+def test_load_yaml_keeps_yaml_types(tmp_path):
+    """YAML-only types such as dates and non-string keys survive loading"""
+    import datetime
+
+    config = tmp_path / "config.yaml"
+    config.write_text("level: 3\ndate: 2024-01-01\nnames: {1: x}\n", encoding="utf-8")
+    assert load_yaml(config) == {"level": 3, "date": datetime.date(2024, 1, 1), "names": {1: "x"}}
+
+
+def test_compute_entropy_bounds():
+    """Entropy is 0 for constant data and 8 bits for a uniform byte histogram"""
+    assert compute_entropy(b"") == 0.0
+    assert compute_entropy(b"\x00" * 64) == 0.0
+    assert compute_entropy(bytes(range(256)) * 4) == 8.0
+    assert compute_entropy(b"ab") == 1.0
+
+
+def test_file_size_and_entropy(tmp_path):
+    """Size and entropy of a file come from one pass and tolerate missing/empty files"""
+    binary = tmp_path / "binary"
+    data = bytes(range(256)) * 3 + b"\x00" * 100
+    binary.write_bytes(data)
+    assert file_size_and_entropy(binary) == (len(data), compute_entropy(data))
+
+    empty = tmp_path / "empty"
+    empty.write_bytes(b"")
+    assert file_size_and_entropy(empty) == (0, 0.0)
+    assert file_size_and_entropy(tmp_path / "missing") == (0, 0.0)
+
+
+def test_merge_flags_dedupes_in_order_and_is_shared():
+    """merge_flags keeps first occurrences and returns the same tuple for the same inputs"""
+    from core.utils import merge_flags
+
+    merged = merge_flags(("-O3", "-g"), ["-g", "-flto", "-O3", "-Wall"])
+    assert merged == ("-O3", "-g", "-flto", "-Wall")
+    assert merge_flags(("-O3", "-g"), ["-g", "-flto", "-O3", "-Wall"]) is merged
+    assert merge_flags(["-O2"]) == ("-O2",)
+
+
+def test_fingerprint_file_single_pass(tmp_path):
+    """fingerprint_file returns size, SHA-256 and a histogram matching the byte entropy"""
+    import hashlib
+
+    from core.utils import entropy_from_histogram, fingerprint_file
+
+    binary = tmp_path / "binary"
+    data = bytes(range(256)) * 5 + b"\xff" * 7
+    binary.write_bytes(data)
+
+    size, digest, histogram = fingerprint_file(binary, chunk_size=100)
+    assert size == len(data)
+    assert digest == hashlib.sha256(data).hexdigest()
+    assert list(histogram)[0xFF] == 12
+    assert entropy_from_histogram(histogram, size) == compute_entropy(data)
+    assert fingerprint_file(tmp_path / "missing")[:2] == (0, "")
+
+
+def test_write_json_writes_utf8_bytes(tmp_path):
+    """write_json emits indented UTF-8 JSON that round-trips non-ASCII text"""
+    from core.utils import json_dumps_bytes, write_json
+
+    path = tmp_path / "nested" / "report.json"
+    write_json(path, {"warnings": ["naïve ✓"], "score": 1.5})
+    assert path.read_bytes() == json_dumps_bytes({"warnings": ["naïve ✓"], "score": 1.5})
+    assert json.loads(path.read_text(encoding="utf-8")) == {"warnings": ["naïve ✓"], "score": 1.5}
+
+
+def test_summarize_symbols_counts_nm_output(tmp_path, monkeypatch):
+    """Symbol and text-symbol counts match nm's line-oriented output"""
+    import core.utils as utils
+
+    binary = tmp_path / "binary"
+    binary.write_bytes(b"\x7fELF" + bytes(124))
+    output = "0000 T main\n0010 t helper\n                 U puts\n0020 D data"
+    monkeypatch.setattr(utils, "run_command", lambda command, text: (0, output.encode(), b""))
+    assert utils.summarize_symbols(binary) == (4, 2)
+
+    # Too small to be an object file: nm is not run at all.
+    binary.write_bytes(b"\x7fELF")
+    monkeypatch.setattr(utils, "run_command", None)
+    assert utils.summarize_symbols(binary) == (0, 0)
+
+
+def test_list_sections_parses_objdump_headers(tmp_path, monkeypatch):
+    """Only the indexed section rows of `objdump -h` are picked up"""
+    import core.utils as utils
+
+    binary = tmp_path / "binary"
+    binary.write_bytes(b"\x7fELF" + bytes(124))
+    output = (
+        "\nbinary:     file format elf64-x86-64\n\nSections:\n"
+        "Idx Name          Size      VMA               LMA               File off  Algn\n"
+        "  0 .interp       0000001c  0000000000000318  0000000000000318  00000318  2**0\n"
+        "                  CONTENTS, ALLOC, LOAD, READONLY, DATA\n"
+        " 12 .text         00000105  0000000000001040  0000000000001040  00001040  2**4\n"
+    )
+    monkeypatch.setattr(utils, "run_command", lambda command, text: (0, output.encode(), b""))
+    assert utils.list_sections(binary) == {".interp": 0x1C, ".text": 0x105}